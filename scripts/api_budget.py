@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+API Budget Planner
+
+Pre-flight cost estimate for a sync run, checked against GitHub's hourly limits:
+- ApiCost: REST reads/writes, GraphQL queries and mutation documents/fields,
+  with the primary (hourly) and secondary (per-minute) points they use
+- Remaining primary budget per resource from GET /rate_limit (which is free)
+- Schedule choice: run everything now, run the longest prefix of the
+  dependency-ordered task list that fits and defer the rest until the budget
+  resets, or refuse when not even one pending task fits
+"""
+
+import time
+from datetime import datetime
+from typing import Callable, Dict, NamedTuple
+
+from github_transport import rest_call
+from rate_limit import BUCKET_CAPACITY, MUTATION_POINTS, PRIMARY_RESERVE, QUERY_POINTS, get_governor
+
+SCHEDULE_NOW = "now"
+SCHEDULE_SPLIT = "split"
+SCHEDULE_REFUSE = "refuse"
+
+# Primary GraphQL points per mutation document (aliased fields share the document's cost)
+MUTATION_DOCUMENT_POINTS = 1
+
+
+class ApiCost:
+    """API calls needed for (part of) a sync run."""
+
+    FIELDS = ("rest_reads", "rest_writes", "graphql_queries", "query_points", "mutation_documents", "mutation_fields")
+
+    def __init__(
+        self,
+        rest_reads: int = 0,
+        rest_writes: int = 0,
+        graphql_queries: int = 0,
+        query_points: int = 0,
+        mutation_documents: int = 0,
+        mutation_fields: int = 0,
+    ):
+        self.rest_reads = rest_reads
+        self.rest_writes = rest_writes
+        self.graphql_queries = graphql_queries
+        self.query_points = query_points
+        self.mutation_documents = mutation_documents
+        self.mutation_fields = mutation_fields
+
+    def __add__(self, other: "ApiCost") -> "ApiCost":
+        return ApiCost(**{name: getattr(self, name) + getattr(other, name) for name in self.FIELDS})
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, name) for name in self.FIELDS)
+
+    def __repr__(self) -> str:
+        return "ApiCost(" + ", ".join(f"{name}={getattr(self, name)}" for name in self.FIELDS) + ")"
+
+    @property
+    def rest_calls(self) -> int:
+        return self.rest_reads + self.rest_writes
+
+    @property
+    def graphql_calls(self) -> int:
+        return self.graphql_queries + self.mutation_documents
+
+    @property
+    def graphql_points(self) -> int:
+        """Primary GraphQL points (hourly limit)."""
+        return self.query_points + self.mutation_documents * MUTATION_DOCUMENT_POINTS
+
+    @property
+    def secondary_points(self) -> float:
+        """Secondary-limit points (5 per REST write or mutation field, 1 per read)."""
+        return (
+            (self.rest_reads + self.graphql_queries) * QUERY_POINTS
+            + (self.rest_writes + self.mutation_fields) * MUTATION_POINTS
+        )
+
+
+def rest_cost(writes: int = 0, reads: int = 0) -> ApiCost:
+    return ApiCost(rest_reads=reads, rest_writes=writes)
+
+
+def query_cost(points: int = 1, queries: int = 1) -> ApiCost:
+    return ApiCost(graphql_queries=queries, query_points=points)
+
+
+def mutation_cost(fields: int = 1, documents: int = 1) -> ApiCost:
+    """`documents` mutation requests carrying `fields` aliased mutation fields in total."""
+    return ApiCost(mutation_documents=documents, mutation_fields=fields)
+
+
+class ResourceBudget(NamedTuple):
+    """Primary budget of one resource ("core" for REST, "graphql")."""
+    limit: int
+    remaining: int
+    reset_at: float  # epoch seconds
+
+
+class BudgetPlan(NamedTuple):
+    """Schedule for a sync run: how many tasks (a dependency-order prefix) to run now."""
+    decision: str  # SCHEDULE_NOW, SCHEDULE_SPLIT or SCHEDULE_REFUSE
+    total: ApiCost
+    task_count: int
+    runnable: int
+    runnable_cost: ApiCost
+    budget: Dict[str, ResourceBudget]
+
+
+def fetch_budget() -> Dict[str, ResourceBudget]:
+    """
+    Remaining primary budget for "core" and "graphql".
+
+    Uses GET /rate_limit; falls back to what the governor learned from earlier
+    responses. Empty when neither is available.
+    """
+    response = rest_call("/rate_limit")
+    resources = (response.data or {}).get("resources") if response.ok and isinstance(response.data, dict) else None
+    budget = {}
+    for name in ("core", "graphql"):
+        entry = (resources or {}).get(name)
+        if entry and entry.get("remaining") is not None:
+            budget[name] = ResourceBudget(int(entry["limit"]), int(entry["remaining"]), float(entry["reset"]))
+    if budget:
+        return budget
+
+    for name, (remaining, reset_at, limit) in get_governor().budget.items():
+        if name in ("core", "graphql") and remaining is not None:
+            budget[name] = ResourceBudget(limit, remaining, reset_at)
+    return budget
+
+
+def fits_budget(cost: ApiCost, budget: Dict[str, ResourceBudget], reserve: int = PRIMARY_RESERVE) -> bool:
+    """True when `cost` leaves at least `reserve` of every known resource's budget."""
+    core = budget.get("core")
+    graphql = budget.get("graphql")
+    return (
+        (core is None or cost.rest_calls <= core.remaining - reserve)
+        and (graphql is None or cost.graphql_points <= graphql.remaining - reserve)
+    )
+
+
+def plan_schedule(
+    task_count: int,
+    cost_of_prefix: Callable[[int], ApiCost],
+    budget: Dict[str, ResourceBudget],
+    reserve: int = PRIMARY_RESERVE,
+) -> BudgetPlan:
+    """
+    Pick a schedule for `task_count` dependency-ordered tasks.
+
+    cost_of_prefix(k) is the cost of syncing the first k tasks (including
+    their relationship links and fixed per-run calls); it must not decrease
+    as k grows. A prefix never leaves a task without its dependencies, so the
+    deferred tasks can be synced by a later run once the budget resets.
+    """
+    total = cost_of_prefix(task_count)
+    if fits_budget(total, budget, reserve):
+        return BudgetPlan(SCHEDULE_NOW, total, task_count, task_count, total, budget)
+
+    # Longest prefix that fits
+    low, high = 0, task_count
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits_budget(cost_of_prefix(middle), budget, reserve):
+            low = middle
+        else:
+            high = middle - 1
+
+    # A prefix of already-synced tasks costs nothing and gets nothing done
+    runnable_cost = cost_of_prefix(low)
+    decision = SCHEDULE_SPLIT if low > 0 and runnable_cost else SCHEDULE_REFUSE
+    return BudgetPlan(decision, total, task_count, low, runnable_cost, budget)
+
+
+def estimated_seconds(cost: ApiCost) -> float:
+    """Time the governor needs for `cost` at its secondary-limit rate (after the initial burst)."""
+    governor = get_governor()
+    return max(0.0, cost.secondary_points - BUCKET_CAPACITY) / governor.rate
+
+
+def describe_cost(cost: ApiCost) -> str:
+    return (
+        f"{cost.rest_calls} REST ({cost.rest_writes} writes), "
+        f"{cost.graphql_calls} GraphQL ({cost.mutation_documents} mutations / {cost.mutation_fields} fields, "
+        f"{cost.graphql_queries} queries) = {cost.graphql_points} GraphQL points"
+    )
+
+
+def print_budget_plan(plan: BudgetPlan) -> None:
+    """Print the cost estimate, remaining budget and chosen schedule."""
+    print(f"💰 Estimated cost: {describe_cost(plan.total)}")
+    print(f"   ⏱️  ~{estimated_seconds(plan.total) / 60:.1f} min at the secondary-limit pace "
+          f"({plan.total.secondary_points:.0f} points)")
+
+    if not plan.budget:
+        print("   ⚠️  Remaining rate-limit budget unknown - not checked")
+        return
+    for name, resource in sorted(plan.budget.items()):
+        reset = datetime.fromtimestamp(resource.reset_at).strftime("%H:%M")
+        print(f"   📉 {name}: {resource.remaining}/{resource.limit} left (resets {reset})")
+
+    if plan.decision == SCHEDULE_NOW:
+        print(f"   ✅ Fits the remaining budget - syncing all {plan.task_count} task(s) now")
+    elif plan.decision == SCHEDULE_SPLIT:
+        reset_at = max(resource.reset_at for resource in plan.budget.values())
+        wait_minutes = max(0.0, reset_at - time.time()) / 60
+        print(f"   ⚠️  Does not fit - syncing the first {plan.runnable}/{plan.task_count} task(s) now "
+              f"({describe_cost(plan.runnable_cost)})")
+        print(f"   ⏭️  Re-run after {datetime.fromtimestamp(reset_at).strftime('%H:%M')} "
+              f"(~{wait_minutes:.0f} min) for the remaining {plan.task_count - plan.runnable}")
+    else:
+        print("   ❌ Not even one pending task fits the remaining budget - refusing to start")
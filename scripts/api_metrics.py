@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+GitHub API Metrics
+
+Per-operation instrumentation for every call made through github_transport:
+- Call count, errors, retries, latency histogram and percentiles
+- Bytes sent and received
+- Time spent waiting for the rate-limit governor
+- GraphQL query cost and the last remaining primary budget per resource
+
+Operations are named after the endpoint ("POST /repos/{owner}/{repo}/issues",
+"mutation updateProjectV2ItemFieldValue"), prefixed by the enclosing
+`operation("create_issue_rest")` block or `@instrumented(...)` function when
+there is one; the block itself is also timed end to end.
+
+The summary is printed at the end of a run and can be written as JSON and as
+a Prometheus textfile (node_exporter textfile collector format).
+"""
+
+import atexit
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from cache_utils import atomic_write
+
+# Latency histogram bucket upper bounds (seconds)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PROMETHEUS_PREFIX = "morpheus_github_api"
+
+GRAPHQL_TOKEN = re.compile(r'"(?:\\.|[^"\\])*"|[{}()]|[A-Za-z_]\w*(?:\s*:\s*[A-Za-z_]\w*)?')
+
+
+class OperationMetrics:
+    """Counters for one operation name."""
+
+    def __init__(self, name: str, kind: str):
+        self.name = name
+        self.kind = kind
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.latencies: List[float] = []
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.wait_seconds = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.graphql_cost = 0
+
+    def observe_latency(self, seconds: float) -> None:
+        self.latencies.append(seconds)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    def summary(self) -> Dict:
+        latencies = sorted(self.latencies)
+        return {
+            "kind": self.kind,
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "latency_seconds": {
+                "total": sum(latencies),
+                "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+                "p50": percentile(latencies, 50),
+                "p90": percentile(latencies, 90),
+                "p99": percentile(latencies, 99),
+                "max": latencies[-1] if latencies else 0.0,
+            },
+            "latency_histogram": {
+                **{f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS, self.bucket_counts)},
+                "le_inf": self.bucket_counts[-1],
+            },
+            "wait_seconds": self.wait_seconds,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "graphql_cost": self.graphql_cost,
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe per-operation metrics plus the latest rate-limit budget."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.operations: Dict[str, OperationMetrics] = {}
+        self.rate_limit: Dict[str, Dict] = {}
+        self.started = time.time()
+
+    def _metrics(self, name: str, kind: str) -> OperationMetrics:
+        metrics = self.operations.get(name)
+        if metrics is None:
+            metrics = self.operations[name] = OperationMetrics(name, kind)
+        return metrics
+
+    # -- recording ----------------------------------------------------------
+
+    def current_operation(self) -> Optional[str]:
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[None]:
+        """Attribute the API calls inside the block to `name` and time the block."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(name)
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            stack.pop()
+            with self._lock:
+                metrics = self._metrics(name, "operation")
+                metrics.calls += 1
+                metrics.errors += int(failed)
+                metrics.observe_latency(time.perf_counter() - started)
+
+    def record_call(
+        self,
+        endpoint_name: str,
+        kind: str,
+        latencies: List[float],
+        ok: bool,
+        wait_seconds: float = 0.0,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        graphql_cost: Optional[int] = None,
+        rate_limit: Optional[Dict] = None,
+    ) -> None:
+        """
+        Record one API call (all of its attempts).
+
+        latencies holds one entry per HTTP attempt; every attempt after the
+        first counts as a retry.
+        """
+        context = self.current_operation()
+        name = f"{context}: {endpoint_name}" if context else endpoint_name
+        with self._lock:
+            metrics = self._metrics(name, kind)
+            metrics.calls += 1
+            metrics.errors += 0 if ok else 1
+            metrics.retries += max(0, len(latencies) - 1)
+            for seconds in latencies:
+                metrics.observe_latency(seconds)
+            metrics.wait_seconds += wait_seconds
+            metrics.bytes_sent += bytes_sent
+            metrics.bytes_received += bytes_received
+            metrics.graphql_cost += graphql_cost or 0
+            if rate_limit:
+                self.rate_limit[rate_limit["resource"]] = rate_limit
+
+    # -- reporting ----------------------------------------------------------
+
+    def summary(self) -> Dict:
+        with self._lock:
+            operations = {name: metrics.summary() for name, metrics in sorted(self.operations.items())}
+            rate_limit = dict(self.rate_limit)
+        api_calls = [op for op in operations.values() if op["kind"] != "operation"]
+        return {
+            "started": self.started,
+            "duration_seconds": time.time() - self.started,
+            "totals": {
+                "calls": sum(op["calls"] for op in api_calls),
+                "errors": sum(op["errors"] for op in api_calls),
+                "retries": sum(op["retries"] for op in api_calls),
+                "bytes_sent": sum(op["bytes_sent"] for op in api_calls),
+                "bytes_received": sum(op["bytes_received"] for op in api_calls),
+                "graphql_cost": sum(op["graphql_cost"] for op in api_calls),
+                "wait_seconds": sum(op["wait_seconds"] for op in api_calls),
+            },
+            "operations": operations,
+            "rate_limit": rate_limit,
+        }
+
+    def write_json(self, path: Path) -> None:
+        atomic_write(path, json.dumps(self.summary(), indent=2))
+
+    def write_prometheus(self, path: Path) -> None:
+        """Write a Prometheus textfile (atomically, as the textfile collector expects)."""
+        atomic_write(path, self.prometheus_text())
+
+    def prometheus_text(self) -> str:
+        with self._lock:
+            operations = sorted(self.operations.values(), key=lambda metrics: metrics.name)
+            rate_limit = dict(self.rate_limit)
+
+        lines = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {PROMETHEUS_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{name} {kind}")
+
+        def sample(name: str, labels: Dict[str, str], value: float) -> None:
+            rendered = ",".join(f'{key}="{escape_label(str(val))}"' for key, val in labels.items())
+            lines.append(f"{PROMETHEUS_PREFIX}_{name}{{{rendered}}} {value}")
+
+        counters = (
+            ("calls_total", "calls", "API calls (or timed operations) per operation"),
+            ("errors_total", "errors", "Calls that ended in an error"),
+            ("retries_total", "retries", "Retries after rate-limit responses"),
+            ("wait_seconds_total", "wait_seconds", "Time spent waiting for the rate-limit governor"),
+            ("sent_bytes_total", "bytes_sent", "Request body bytes sent"),
+            ("received_bytes_total", "bytes_received", "Response body bytes received"),
+            ("graphql_cost_total", "graphql_cost", "GraphQL primary cost reported by rateLimit"),
+        )
+        for metric, attribute, help_text in counters:
+            family(metric, "counter", help_text)
+            for metrics in operations:
+                sample(metric, {"operation": metrics.name, "kind": metrics.kind}, getattr(metrics, attribute))
+
+        family("latency_seconds", "histogram", "Per-attempt latency (whole block for timed operations)")
+        for metrics in operations:
+            labels = {"operation": metrics.name, "kind": metrics.kind}
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.bucket_counts):
+                cumulative += count
+                sample("latency_seconds_bucket", {**labels, "le": str(bound)}, cumulative)
+            sample("latency_seconds_bucket", {**labels, "le": "+Inf"}, len(metrics.latencies))
+            sample("latency_seconds_sum", labels, sum(metrics.latencies))
+            sample("latency_seconds_count", labels, len(metrics.latencies))
+
+        family("rate_limit_remaining", "gauge", "Primary rate-limit budget left at the last response")
+        for resource, budget in sorted(rate_limit.items()):
+            sample("rate_limit_remaining", {"resource": resource}, budget["remaining"])
+        family("rate_limit_limit", "gauge", "Primary rate-limit budget per window")
+        for resource, budget in sorted(rate_limit.items()):
+            sample("rate_limit_limit", {"resource": resource}, budget["limit"])
+
+        return "\n".join(lines) + "\n"
+
+    def print_summary(self, top: int = 10) -> None:
+        """Print the operations with the most total latency."""
+        summary = self.summary()
+        totals = summary["totals"]
+        if not totals["calls"]:
+            return
+        print(f"\n📈 GitHub API: {totals['calls']} calls, {totals['errors']} errors, {totals['retries']} retries, "
+              f"{totals['bytes_sent'] / 1024:.0f} KiB sent / {totals['bytes_received'] / 1024:.0f} KiB received, "
+              f"{totals['wait_seconds']:.1f}s waiting on rate limits")
+        ranked = sorted(
+            ((name, op) for name, op in summary["operations"].items() if op["kind"] != "operation"),
+            key=lambda item: -item[1]["latency_seconds"]["total"],
+        )
+        for name, op in ranked[:top]:
+            latency = op["latency_seconds"]
+            print(f"   {op['calls']:>6}x  {latency['total']:>7.1f}s  p50 {latency['p50'] * 1000:>6.0f}ms  "
+                  f"p99 {latency['p99'] * 1000:>6.0f}ms  {name}")
+        for resource, budget in sorted(summary["rate_limit"].items()):
+            print(f"   📉 {resource}: {budget['remaining']}/{budget['limit']} left")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def rest_operation_name(method: str, endpoint: str) -> str:
+    """"POST /repos/{owner}/{repo}/issues/{number}/labels" style name for a REST call."""
+    path = endpoint.split("?", 1)[0]
+    path = re.sub(r"^/?repos/[^/]+/[^/]+", "/repos/{owner}/{repo}", path)
+    path = re.sub(r"/labels/[^/]+$", "/labels/{name}", path)
+    path = re.sub(r"/\d+(?=/|$)", "/{number}", path)
+    return f"{method} {path}"
+
+
+@lru_cache(maxsize=512)
+def graphql_operation_name(query: str) -> str:
+    """
+    "query repository" / "mutation createIssue" style name from the root fields
+    of a document (aliases dropped, rateLimit ignored).
+    """
+    text = query.strip()
+    kind = "mutation" if text.startswith("mutation") else "query"
+    fields = []
+    braces = parens = 0
+    for match in GRAPHQL_TOKEN.finditer(text):
+        token = match.group(0)
+        if token == "{":
+            braces += 1
+        elif token == "}":
+            braces -= 1
+            if braces == 0:
+                break  # End of the operation (fragments follow)
+        elif token == "(":
+            parens += 1
+        elif token == ")":
+            parens -= 1
+        elif braces == 1 and parens == 0 and not token.startswith('"'):
+            name = token.split(":")[-1].strip()
+            if name != "rateLimit" and name not in fields:
+                fields.append(name)
+    return f"{kind} {'+'.join(sorted(fields)) or '(anonymous)'}"
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+        return _registry
+
+
+def operation(name: str):
+    """Context manager attributing API calls to a named operation (see MetricsRegistry.operation)."""
+    return get_metrics().operation(name)
+
+
+def instrumented(name: str):
+    """Decorator: run the function inside operation(name)."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with operation(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def report_at_exit(json_path: Optional[Path] = None, prometheus_path: Optional[Path] = None) -> None:
+    """Print the summary (and write the requested files) when the process exits."""
+
+    def report() -> None:
+        metrics = get_metrics()
+        metrics.print_summary()
+        if json_path:
+            metrics.write_json(json_path)
+            print(f"💾 API metrics written to {json_path}")
+        if prometheus_path:
+            metrics.write_prometheus(prometheus_path)
+            print(f"💾 Prometheus metrics written to {prometheus_path}")
+
+    atexit.register(report)
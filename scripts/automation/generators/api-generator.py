@@ -5,23 +5,23 @@ Usage: python scripts/automation/generators/api-generator.py T25
 """
 
 import sys
-import yaml
 from pathlib import Path
 from typing import Dict, List
 
+# Shared planning-script helpers live in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from issue_index import load_estimate
+
 WORKSPACE_ROOT = Path('/workspaces/morpheus-press')
 
 def load_task_spec(task_key: str) -> Dict:
-    """Load task specification from planning files"""
-    effort_map_path = WORKSPACE_ROOT / 'planning/estimates/effort-map.yaml'
-    
-    with open(effort_map_path, 'r') as f:
-        effort_map = yaml.safe_load(f)
+    """Load task specification from planning files (only the task's effort-map block is parsed)"""
+    task_estimate = load_estimate(task_key, WORKSPACE_ROOT / 'planning')
     
-    if task_key not in effort_map['estimates']:
+    if task_estimate is None:
         raise ValueError(f"Task {task_key} not found")
     
-    return effort_map['estimates'][task_key]
+    return task_estimate
 
 def generate_api_route(task_key: str, task_spec: Dict) -> str:
     """Generate Fastify route template"""
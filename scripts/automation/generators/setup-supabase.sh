@@ -19,7 +19,8 @@ fi
 
 # 2. Read task spec from planning/docs
 DOCS_DIR="$WORKSPACE_ROOT/planning/docs"
-TASK_DOC=$(find "$DOCS_DIR" -name "${TASK_KEY}-*.md" | head -1)
+SCRIPTS_DIR="$(cd "$(dirname "$0")/../.." && pwd)"
+TASK_DOC=$(python3 "$SCRIPTS_DIR/docs_index.py" --docs-dir "$DOCS_DIR" "$TASK_KEY" 2>/dev/null || true)
 
 if [ -z "$TASK_DOC" ]; then
     echo "❌ Task documentation not found for $TASK_KEY"
@@ -6,6 +6,7 @@ Usage:
   python scripts/automation/task-automation-agent.py T24      # Generate code for specific task
   python scripts/automation/task-automation-agent.py --auto   # Auto-generate all HIGH AI tasks
   python scripts/automation/task-automation-agent.py --dry-run T24  # Preview without creating files
+  python scripts/automation/task-automation-agent.py --auto --profile  # Time each phase (JSON report)
 
 Workflow:
   1. Read task spec from planning/docs/
@@ -17,14 +18,23 @@ Workflow:
 
 import os
 import sys
-import yaml
 import argparse
+import sqlite3
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import anthropic
 from dotenv import load_dotenv
 
+# Shared planning-script helpers live in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from docs_index import load_docs_index
+from issue_index import load_estimate, load_issue
+from planning_search import related_tasks
+from planning_store import open_store
+from yaml_patch import set_status
+from profiling import add_profile_arguments, phase, record_count, start_profiling
+
 load_dotenv()
 
 # Task Pattern Categories
@@ -37,6 +47,9 @@ PATTERNS = {
     'component': ['component', 'ui', 'shadcn', 'react'],
 }
 
+# progress.status values a successful run may move to in-progress (later states are kept)
+STARTABLE_STATUSES = (None, '', 'not-started', 'todo')
+
 class TaskAutomationAgent:
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
@@ -50,46 +63,36 @@ class TaskAutomationAgent:
     def load_task_spec(self, task_key: str) -> Optional[Dict[str, Any]]:
         """Load task specification from planning/docs/ and planning/issues/"""
         
-        # 1. Load from effort-map.yaml
-        effort_map_path = self.workspace_root / 'planning/estimates/effort-map.yaml'
-        with open(effort_map_path, 'r') as f:
-            effort_map = yaml.safe_load(f)
+        # 1. Load from effort-map.yaml (only this task's block is parsed)
+        planning_dir = self.workspace_root / 'planning'
+        task_estimate = load_estimate(task_key, planning_dir)
         
-        if task_key not in effort_map['estimates']:
+        if task_estimate is None:
             print(f"❌ Task {task_key} not found in effort-map.yaml")
             return None
         
-        task_estimate = effort_map['estimates'][task_key]
-        
-        # 2. Find task in issues/*.yaml
-        issues_dir = self.workspace_root / 'planning/issues'
-        task_issue = None
-        
-        for issue_file in issues_dir.glob('*.yaml'):
-            with open(issue_file, 'r') as f:
-                issue_data = yaml.safe_load(f)
-            
-            for issue in issue_data.get('issues', []):
-                if issue['key'] == task_key:
-                    task_issue = issue
-                    break
-            
-            if task_issue:
-                break
+        # 2. Find task in issues/*.yaml (byte-offset index, no full-file parse)
+        task_issue = load_issue(task_key, planning_dir)
         
         if not task_issue:
             print(f"❌ Task {task_key} not found in planning/issues/")
             return None
         
         # 3. Find markdown doc in planning/docs/
-        docs_pattern = f"**/{task_key}-*.md"
-        docs_files = list((self.workspace_root / 'planning/docs').glob(docs_pattern))
+        doc_file = load_docs_index(self.workspace_root / 'planning/docs').find(task_key)
         
         task_doc_content = None
-        if docs_files:
-            with open(docs_files[0], 'r', encoding='utf-8') as f:
+        if doc_file:
+            with open(doc_file, 'r', encoding='utf-8') as f:
                 task_doc_content = f.read()
         
+        # 4. Related tasks from the full-text index (no YAML loaded)
+        try:
+            related = [f"{hit.key}: {hit.title}" for hit in related_tasks(task_key, planning_dir)]
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  Could not look up related tasks: {e}")
+            related = []
+        
         return {
             'key': task_key,
             'title': task_estimate['title'],
@@ -101,6 +104,7 @@ class TaskAutomationAgent:
             'acceptance_criteria': task_issue.get('acceptance_criteria', []),
             'agent_notes': task_issue.get('agent_notes', {}),
             'doc_content': task_doc_content,
+            'related_tasks': related,
         }
     
     def identify_pattern(self, task_spec: Dict[str, Any]) -> str:
@@ -130,15 +134,16 @@ class TaskAutomationAgent:
             return {'main.ts': '// Generated code would appear here'}
         
         # Call LLM
-        response = self.client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=8000,
-            temperature=0.3,  # Lower for more consistent code generation
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }]
-        )
+        with phase('llm_call'):
+            response = self.client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=8000,
+                temperature=0.3,  # Lower for more consistent code generation
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            )
         
         # Parse response - expect JSON with file paths and content
         response_text = response.content[0].text
@@ -153,6 +158,7 @@ class TaskAutomationAgent:
         
         research_findings = task_spec['agent_notes'].get('research_findings', '')
         acceptance_criteria = '\n'.join(f"- {c}" for c in task_spec['acceptance_criteria'])
+        related_tasks = '\n'.join(f"- {t}" for t in task_spec.get('related_tasks', [])) or 'None found'
         
         prompt = f"""You are a Senior Full-Stack Developer implementing task {task_spec['key']}.
 
@@ -172,6 +178,9 @@ Area: {task_spec['area']}
 🔬 RESEARCH FINDINGS:
 {research_findings}
 
+🔗 RELATED TASKS (keep interfaces consistent with these):
+{related_tasks}
+
 📚 FULL DOCUMENTATION:
 {task_spec.get('doc_content', 'No detailed docs available')}
 
@@ -265,7 +274,8 @@ Generate the implementation now:
         print("="*80)
         
         # 1. Load spec
-        task_spec = self.load_task_spec(task_key)
+        with phase('yaml_load'):
+            task_spec = self.load_task_spec(task_key)
         if not task_spec:
             return False
         
@@ -290,11 +300,25 @@ Generate the implementation now:
         print(f"\n📦 Generated {len(files)} files")
         
         # 4. Write files
-        written = self.write_files(files)
+        with phase('file_write'):
+            written = self.write_files(files)
         
         print(f"\n✅ Task {task_key} automated successfully!")
         print(f"   Files created: {len(written)}")
         
+        # 5. Record progress in planning/issues/*.yaml (in-place patch, formatting kept)
+        if not self.dry_run and written:
+            planning_dir = self.workspace_root / 'planning'
+            issue = load_issue(task_key, planning_dir) or {}
+            progress = issue.get('progress') if isinstance(issue.get('progress'), dict) else {}
+            current_status = progress.get('status')
+            if current_status not in STARTABLE_STATUSES:
+                print(f"   Status: progress.status stays {current_status}")
+            elif set_status(task_key, 'in-progress', planning_dir):
+                print(f"   Status: progress.status = in-progress")
+            else:
+                print(f"⚠️  Could not update progress.status for {task_key}")
+        
         if not self.dry_run:
             print(f"\n📝 Next steps:")
             print(f"   1. Review generated code: git diff")
@@ -311,20 +335,22 @@ def main():
     parser.add_argument('--auto', action='store_true', help='Auto-generate all HIGH AI tasks')
     parser.add_argument('--dry-run', action='store_true', help='Preview without creating files')
     parser.add_argument('--list', action='store_true', help='List all HIGH AI effectiveness tasks')
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
+    start_profiling(args, 'task-automation-agent')
     
     agent = TaskAutomationAgent(dry_run=args.dry_run)
     
     if args.list:
-        # List all HIGH AI tasks
-        effort_map_path = Path('/workspaces/morpheus-press/planning/estimates/effort-map.yaml')
-        with open(effort_map_path, 'r') as f:
-            effort_map = yaml.safe_load(f)
+        # List all HIGH AI tasks (indexed query on the planning store)
+        with phase('yaml_load'):
+            store = open_store(Path('/workspaces/morpheus-press/planning'))
         
         high_ai_tasks = [
-            (key, data) for key, data in effort_map['estimates'].items()
-            if 'AI Impact: HIGH' in data.get('reasoning', '')
+            (task['key'], task) for task in store.query(
+                ai_effectiveness='high', estimated_only=True, columns=['key', 'title', 'estimated_days']
+            )
         ]
         
         print(f"\n🤖 HIGH AI EFFECTIVENESS TASKS ({len(high_ai_tasks)} total):")
@@ -332,7 +358,7 @@ def main():
         
         for key, data in high_ai_tasks:
             print(f"\n{key}: {data['title']}")
-            print(f"   Estimated: {data.get('estimated_days', 0)} days")
+            print(f"   Estimated: {data.get('estimated_days') or 0} days")
             pattern_hint = "setup" if "setup" in data['title'].lower() else \
                           "test" if "test" in data['title'].lower() else \
                           "api" if "api" in data['title'].lower() else "generic"
@@ -351,17 +377,16 @@ def main():
             if response.lower() != 'y':
                 return
         
-        # Load all HIGH AI tasks
-        effort_map_path = Path('/workspaces/morpheus-press/planning/estimates/effort-map.yaml')
-        with open(effort_map_path, 'r') as f:
-            effort_map = yaml.safe_load(f)
+        # Load all HIGH AI tasks (indexed query on the planning store)
+        with phase('yaml_load'):
+            store = open_store(Path('/workspaces/morpheus-press/planning'))
         
         high_ai_tasks = [
-            key for key, data in effort_map['estimates'].items()
-            if 'AI Impact: HIGH' in data.get('reasoning', '')
+            task['key'] for task in store.query(ai_effectiveness='high', estimated_only=True, columns=['key'])
         ]
         
         print(f"\nFound {len(high_ai_tasks)} HIGH AI tasks to automate")
+        record_count('tasks', len(high_ai_tasks))
         
         success_count = 0
         for i, task_key in enumerate(high_ai_tasks, 1):
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Issue Sync Benchmark
+
+Runs create-issues-api.py against the local fake GitHub server
+(fake_github_server.py) on synthetic backlogs and reports, per size:
+- API calls per issue (REST / GraphQL split, rate-limited responses)
+- Wall time and issues per second
+- p50 / p99 call latency (server side, including simulated latency)
+
+Usage:
+    python scripts/benchmark_sync.py                          # 100 and 1000 tasks
+    python scripts/benchmark_sync.py --sizes 100 1000 10000 --latency-ms 30
+    python scripts/benchmark_sync.py --rerun --json results.json
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+from fake_github_server import DEFAULT_ITERATIONS, DEFAULT_MILESTONES, FakeGitHub, FakeGitHubServer, percentile
+
+SCRIPT_PATH = Path(__file__).resolve().parent / "create-issues-api.py"
+DEFAULT_SIZES = [100, 1000]
+
+
+def generate_backlog(workspace: Path, size: int, max_dependencies: int = 3, seed: int = 42) -> None:
+    """
+    Write a synthetic planning tree (effort map + issue YAML) with `size` tasks.
+
+    Each task depends on up to `max_dependencies` earlier tasks, picked
+    mostly from its recent neighbours, so the graph is a deep DAG.
+    """
+    rng = random.Random(seed)
+    estimates = {}
+    issues_by_milestone: Dict[str, List[Dict]] = {title: [] for title in DEFAULT_MILESTONES}
+
+    for index in range(1, size + 1):
+        task_key = f"T{index}"
+        milestone = DEFAULT_MILESTONES[(index - 1) * len(DEFAULT_MILESTONES) // size]
+        iteration = f"I{1 + (index - 1) * len(DEFAULT_ITERATIONS) // size}"
+        impact = rng.choice(["HIGH", "HIGH", "MEDIUM", "LOW"])
+        estimates[task_key] = {
+            "title": f"Synthetic task {index}",
+            "milestone": milestone,
+            "iteration": iteration,
+            "priority": rng.choice(["critical", "high", "medium", "low"]),
+            "effort": rng.choice([2, 3, 5, 8]),
+            "estimated_days": rng.choice([1, 2, 3, 5]),
+            "reasoning": f"AI Impact: {impact}\nSynthetic benchmark task.",
+        }
+
+        candidates = range(max(1, index - 50), index)
+        depends_on = sorted(
+            {f"T{rng.choice(candidates)}" for _ in range(rng.randint(0, max_dependencies))} if index > 1 else set(),
+            key=lambda key: int(key[1:]),
+        )
+        issues_by_milestone[milestone].append({
+            "key": task_key,
+            "title": estimates[task_key]["title"],
+            "milestone": milestone,
+            "iteration": iteration,
+            "dependsOn": depends_on,
+        })
+
+    (workspace / "planning/estimates").mkdir(parents=True, exist_ok=True)
+    (workspace / "planning/issues").mkdir(parents=True, exist_ok=True)
+    (workspace / "planning/docs").mkdir(parents=True, exist_ok=True)
+    with open(workspace / "planning/estimates/effort-map.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump({"estimates": estimates}, f, sort_keys=False)
+    for number, (milestone, issues) in enumerate(issues_by_milestone.items()):
+        if issues:
+            with open(workspace / f"planning/issues/m{number}-synthetic.yaml", "w", encoding="utf-8") as f:
+                yaml.safe_dump({"milestone": milestone, "issues": issues}, f, sort_keys=False)
+
+
+def run_sync(workspace: Path, server: FakeGitHubServer, args: argparse.Namespace, log_path: Path) -> Dict:
+    """Run create-issues-api.py once; returns wall time and exit code."""
+    env = {
+        **os.environ,
+        "MORPHEUS_WORKSPACE_ROOT": str(workspace),
+        "MORPHEUS_CACHE_DIR": str(workspace / "planning/.cache"),
+        "GITHUB_API_URL": server.url,
+        "GITHUB_TOKEN": "fake-token",
+        "PYTHONUNBUFFERED": "1",
+    }
+    if not args.github_pacing:
+        env["MORPHEUS_BUCKET_RATE"] = "1000000"
+
+    command = [
+        sys.executable, str(SCRIPT_PATH), "--yes", "--transport", "http",
+        "--concurrency", str(args.concurrency),
+        "--provision", args.provision,
+        "--link-mode", args.link_mode,
+    ] + args.sync_args
+
+    started = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        result = subprocess.run(command, env=env, stdout=log, stderr=subprocess.STDOUT)
+    return {"wall_seconds": time.perf_counter() - started, "exit_code": result.returncode}
+
+
+def measure(fake: FakeGitHub, before: Dict, run: Dict, issues: int) -> Dict:
+    """Combine the server's request log for one run with its wall time."""
+    log = fake.request_log[before["requests"]:]
+    durations = sorted(entry["duration"] for entry in log)
+    by_operation: Dict[str, int] = {}
+    for entry in log:
+        by_operation[entry["operation"]] = by_operation.get(entry["operation"], 0) + 1
+
+    return {
+        **run,
+        "issues": issues,
+        "requests": len(log),
+        "rest": sum(1 for entry in log if entry["kind"] == "rest"),
+        "graphql": sum(1 for entry in log if entry["kind"] == "graphql"),
+        "rate_limited": sum(1 for entry in log if entry["status"] in (403, 429)),
+        "calls_per_issue": len(log) / issues if issues else 0.0,
+        "issues_per_second": issues / run["wall_seconds"] if run["wall_seconds"] else 0.0,
+        "p50_ms": percentile(durations, 50) * 1000,
+        "p99_ms": percentile(durations, 99) * 1000,
+        "by_operation": dict(sorted(by_operation.items(), key=lambda item: -item[1])),
+    }
+
+
+def benchmark_size(size: int, args: argparse.Namespace) -> Dict:
+    workspace = Path(tempfile.mkdtemp(prefix=f"morpheus-bench-{size}-"))
+    generate_backlog(workspace, size, args.max_dependencies, args.seed)
+
+    fake = FakeGitHub(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        primary_limit=args.primary_limit,
+        secondary_points_per_minute=args.secondary_points,
+    )
+    server = FakeGitHubServer(fake)
+    server.start_background()
+
+    try:
+        print(f"\n📦 {size} tasks (workspace: {workspace})")
+        before = {"requests": 0}
+        run = run_sync(workspace, server, args, workspace / "sync.log")
+        result = {"size": size, "first_run": measure(fake, before, run, len(fake.issues))}
+        print_run("first run", result["first_run"])
+
+        if args.rerun:
+            # Second run over the same backlog: everything exists already
+            before = {"requests": len(fake.request_log)}
+            run = run_sync(workspace, server, args, workspace / "sync-rerun.log")
+            result["rerun"] = measure(fake, before, run, size)
+            print_run("re-run", result["rerun"])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if not args.keep:
+        shutil.rmtree(workspace, ignore_errors=True)
+    return result
+
+
+def print_run(label: str, stats: Dict) -> None:
+    status = "✅" if stats["exit_code"] == 0 else f"❌ exit {stats['exit_code']}"
+    print(f"   {status} {label}: {stats['issues']} issues, {stats['requests']} calls "
+          f"({stats['calls_per_issue']:.2f}/issue; REST {stats['rest']}, GraphQL {stats['graphql']}, "
+          f"rate limited {stats['rate_limited']})")
+    print(f"      wall {stats['wall_seconds']:.1f}s ({stats['issues_per_second']:.1f} issues/s), "
+          f"latency p50 {stats['p50_ms']:.1f} ms, p99 {stats['p99_ms']:.1f} ms")
+    for operation, count in list(stats["by_operation"].items())[:6]:
+        print(f"      {count:>7}  {operation}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark create-issues-api.py against a fake GitHub API")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Backlog sizes (tasks)")
+    parser.add_argument("--max-dependencies", type=int, default=3, help="Max dependsOn entries per task")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per API call")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency per API call")
+    parser.add_argument("--primary-limit", type=int, default=10_000_000, help="Fake hourly request limit")
+    parser.add_argument("--secondary-points", type=int, default=0, help="Fake secondary limit (points/minute)")
+    parser.add_argument("--github-pacing", action="store_true",
+                        help="Keep the client governor at GitHub's secondary-limit rate (slow for big backlogs)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--provision", choices=["graphql", "rest"], default="graphql")
+    parser.add_argument("--link-mode", choices=["batched", "sequential"], default="batched")
+    parser.add_argument("--rerun", action="store_true", help="Also measure a second run over the same backlog")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic workspaces and logs")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    parser.add_argument("sync_args", nargs="*", help="Extra create-issues-api.py arguments (after --)")
+    args = parser.parse_args()
+
+    print("⏱️  Issue sync benchmark")
+    print(f"   provision={args.provision} link-mode={args.link_mode} concurrency={args.concurrency} "
+          f"latency={args.latency_ms}ms")
+
+    results = [benchmark_size(size, args) for size in args.sizes]
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Results written to {args.json}")
+
+    failed = [r["size"] for r in results if r["first_run"]["exit_code"] != 0]
+    if failed:
+        print(f"\n❌ Sync failed for sizes: {', '.join(map(str, failed))} (re-run with --keep to inspect logs)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
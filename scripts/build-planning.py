@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Build Combined Planning YAML
+
+Compiles the components listed in planning/pi-metadata.yaml (metadata,
+milestones.yaml, labels.yaml and the issues/*.yaml files) into one document,
+<build.output>.built (planning/pi.yaml.built), incrementally:
+- Every section is kept as its dumped YAML text in planning/.cache/pi-build.json;
+  unchanged components (size/mtime, or content hash for fresh mtimes) are
+  spliced in from there without being read
+- Changed issue files are split into their "- key:" blocks (no YAML parse);
+  only blocks whose hash is new are parsed and dumped, so an edit to one
+  issue costs one issue
+- With build.validate, only the changed issues are validated (all of them
+  when milestones, iterations or labels change), plus reference and cycle
+  checks against the cached keys and dependencies
+- The output is written atomically, and only when its content changed
+
+Usage:
+    python scripts/build-planning.py                # incremental build
+    python scripts/build-planning.py --full         # ignore the cache
+    python scripts/build-planning.py --no-validate
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import yaml
+
+from cache_utils import CACHE_DIR, atomic_write, read_json_cache, write_json_cache
+from issue_index import ISSUES, iter_blocks
+from planning_yaml import RACY_WINDOW_SECONDS, load_yaml, parse_yaml
+from validate_planning import check_references
+
+CACHE_VERSION = 1
+BUILD_CACHE_FILE = CACHE_DIR / "pi-build.json"
+WORKSPACE_ROOT = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press"))
+DEFAULT_METADATA_PATH = WORKSPACE_ROOT / "planning/pi-metadata.yaml"
+
+# Top-level section order of the combined document (issues always last)
+SECTION_ORDER = ("project", "safe", "issueTypes", "milestones", "labels", "projectFields")
+# pi-metadata.yaml keys that describe the build rather than the plan
+BUILD_KEYS = ("components", "build")
+# Issue fields kept in the cache for validation
+SUMMARY_FIELDS = ("key", "title", "milestone", "iteration", "priority", "area", "effort", "dependsOn")
+
+
+def dump_yaml(data) -> str:
+    return yaml.dump(data, sort_keys=False, allow_unicode=True)
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def display_path(path: Path, root: Path) -> str:
+    try:
+        return str(path.relative_to(root))
+    except ValueError:
+        return str(path)
+
+
+def summarize_issue(issue: Dict) -> Dict:
+    return {field: issue.get(field) for field in SUMMARY_FIELDS if field in issue}
+
+
+def validation_context(sections: Dict) -> Dict[str, List[str]]:
+    """Names issues are validated against, from whichever sections a component holds."""
+    context: Dict[str, List[str]] = {}
+    if "milestones" in sections:
+        context["milestones"] = [m.get("name") for m in sections["milestones"] or [] if isinstance(m, dict)]
+    pi = ((sections.get("safe") or {}).get("pi") or {}) if "safe" in sections else {}
+    if pi.get("iterations"):
+        context["iterations"] = [str(iteration) for iteration in pi["iterations"]]
+    labels = sections.get("labels") or {}
+    for name in ("area", "priority"):
+        if labels.get(name):
+            context[name] = list(labels[name])
+    return context
+
+
+class ComponentBuilder:
+    """Per-component cache entries: reused when unchanged, rebuilt (as little as possible) otherwise."""
+
+    def __init__(self, previous: Dict[str, Dict]):
+        self.previous = previous
+        # Parsed issue blocks by content hash, across all files (an issue moved between files is reused)
+        self.known_blocks = {
+            block["sha256"]: block
+            for entry in previous.values()
+            for block in entry.get("blocks", [])
+        }
+        self.files_read = 0
+        self.blocks_parsed = 0
+        self.blocks_reused = 0
+        self.changed_keys: Set[str] = set()
+
+    def _unchanged(self, path: Path, stat: os.stat_result, entry: Optional[Dict]) -> bool:
+        return bool(
+            entry
+            and entry["size"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["checked_at"] - stat.st_mtime_ns / 1e9 > RACY_WINDOW_SECONDS
+        )
+
+    def build(self, path: Path, kind: str) -> Dict:
+        """Cache entry for one component ("sections" or "issues")."""
+        stat = path.stat()
+        entry = self.previous.get(str(path))
+        if entry and entry["kind"] != kind:
+            entry = None
+        if self._unchanged(path, stat, entry):
+            return entry
+
+        raw = path.read_bytes()
+        self.files_read += 1
+        digest = sha256(raw)
+        if entry and entry["sha256"] == digest:
+            built = dict(entry)
+        elif kind == "sections":
+            data = parse_yaml(raw, str(path)) or {}
+            sections = {name: value for name, value in data.items() if name not in BUILD_KEYS}
+            built = {
+                "kind": kind,
+                "sections": {name: dump_yaml({name: value}) for name, value in sections.items()},
+                "context": validation_context(sections),
+            }
+        else:
+            built = {"kind": kind, "blocks": self._issue_blocks(path, raw)}
+        built.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=digest, checked_at=time.time())
+        return built
+
+    def _issue_blocks(self, path: Path, raw: bytes) -> List[Dict]:
+        blocks = []
+        for _, offset, length in iter_blocks(raw, ISSUES):
+            data = raw[offset:offset + length]
+            digest = sha256(data)
+            if digest in self.known_blocks:
+                blocks.append(self.known_blocks[digest])
+                self.blocks_reused += 1
+                continue
+            try:
+                parsed = parse_yaml(data, f"{path} (bytes {offset}-{offset + length})")
+            except yaml.YAMLError:
+                parsed = None
+            if not (isinstance(parsed, list) and len(parsed) == 1 and isinstance(parsed[0], dict)):
+                # The block does not stand alone (anchors, unusual layout): parse the whole file
+                return self._whole_file(path)
+            blocks.append(self._new_block(digest, parsed))
+        if not blocks and raw.strip():
+            return self._whole_file(path)
+        return blocks
+
+    def _whole_file(self, path: Path) -> List[Dict]:
+        issues = (load_yaml(path) or {}).get(ISSUES) or []
+        return [self._new_block(sha256(dump_yaml([issue]).encode("utf-8")), [issue]) for issue in issues]
+
+    def _new_block(self, digest: str, issues: List[Dict]) -> Dict:
+        self.blocks_parsed += 1
+        summaries = [summarize_issue(issue) for issue in issues]
+        self.changed_keys.update(str(summary.get("key")) for summary in summaries)
+        return {"sha256": digest, "fragment": dump_yaml(issues), "issues": summaries}
+
+
+def validate_issues(
+    summaries: List[Dict],
+    keys_to_check: Set[str],
+    context: Dict[str, List[str]],
+) -> List[str]:
+    """Errors for the issues in keys_to_check (references resolved against every issue)."""
+    areas = set(context.get("area", []))
+    priorities = set(context.get("priority", []))
+
+    errors = []
+    references = []
+    for summary in summaries:
+        if not summary.get("key"):
+            errors.append(f"Issue without a key: {summary.get('title', '?')}")
+            continue
+        key = str(summary["key"])
+        references.append({**summary, "key": key, "dependsOn": [str(dep) for dep in summary.get("dependsOn") or []]})
+        if key not in keys_to_check:
+            continue
+        if not summary.get("title"):
+            errors.append(f"{key}: missing title")
+        if priorities and "priority" in summary and f"priority:{summary['priority']}" not in priorities:
+            errors.append(f"{key}: unknown priority {summary['priority']!r}")
+        if areas and "area" in summary and f"area: {summary['area']}" not in areas:
+            errors.append(f"{key}: unknown area {summary['area']!r}")
+        if "effort" in summary and not isinstance(summary["effort"], (int, float)):
+            errors.append(f"{key}: effort must be a number, got {summary['effort']!r}")
+
+    # Cycles are only warnings for the sync, but the built plan must stay acyclic
+    reference_errors, cycles = check_references(
+        references, context.get("milestones"), context.get("iterations"), keys_to_check,
+    )
+    return errors + reference_errors + cycles
+
+
+def build_planning(
+    metadata_path: Path = DEFAULT_METADATA_PATH,
+    output_path: Optional[Path] = None,
+    validate: Optional[bool] = None,
+    full: bool = False,
+) -> bool:
+    """
+    Incrementally (re)build the combined planning document.
+
+    Returns False when validation failed (nothing is written then).
+    """
+    started = time.perf_counter()
+    metadata_path = Path(metadata_path).resolve()
+    root = metadata_path.parent.parent
+    metadata = load_yaml(metadata_path) or {}
+    components = metadata.get("components") or {}
+    build_config = metadata.get("build") or {}
+    if output_path is None:
+        output_path = root / f"{build_config.get('output', 'planning/pi.yaml')}.built"
+    output_path = Path(output_path).resolve()
+    if validate is None:
+        validate = bool(build_config.get("validate", True))
+
+    cache = None if full else read_json_cache(BUILD_CACHE_FILE)
+    if not cache or cache.get("version") != CACHE_VERSION or cache.get("metadata") != str(metadata_path):
+        cache = {"components": {}}
+    builder = ComponentBuilder(cache["components"])
+
+    section_paths = [metadata_path] + [root / components[name] for name in ("milestones", "labels") if components.get(name)]
+    issue_paths = [root / path for path in components.get("issues") or []]
+    try:
+        entries = {str(path): builder.build(path, "sections") for path in section_paths}
+        entries.update({str(path): builder.build(path, "issues") for path in issue_paths})
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ {e}")
+        return False
+
+    # Validation: changed issues (plus any a --no-validate build skipped), or
+    # all of them when what they are checked against changed
+    context: Dict[str, List[str]] = {}
+    for path in section_paths:
+        context.update(entries[str(path)]["context"])
+    summaries = [summary for path in issue_paths for block in entries[str(path)]["blocks"] for summary in block["issues"]]
+    previous_keys = set(cache.get("keys", []))
+    current_keys = {str(summary.get("key")) for summary in summaries}
+    if context != cache.get("context"):
+        to_check = current_keys
+    else:
+        removed = previous_keys - current_keys
+        to_check = builder.changed_keys | {
+            str(summary.get("key")) for summary in summaries
+            if removed & {str(dep) for dep in summary.get("dependsOn") or []}
+        }
+        to_check |= set(cache.get("unvalidated", [])) & current_keys
+    if validate:
+        errors = validate_issues(summaries, to_check, context)
+        if errors:
+            print(f"❌ Validation failed ({len(errors)} error(s)) - {output_path.name} not written:")
+            for error in errors:
+                print(f"   - {error}")
+            return False
+
+    # Splice the cached fragments into the combined document
+    include_comments = build_config.get("include_comments", False)
+    sections: Dict[str, str] = {}
+    for path in section_paths:
+        for name, fragment in entries[str(path)]["sections"].items():
+            sections.setdefault(name, fragment)
+    ordered = [name for name in SECTION_ORDER if name in sections] + [
+        name for name in sections if name not in SECTION_ORDER
+    ]
+    parts = []
+    if include_comments:
+        parts.append(f"# Generated by scripts/build-planning.py from {display_path(metadata_path, root)} - do not edit\n")
+    parts.extend(sections[name] for name in ordered)
+    parts.append("issues:\n")
+    for path in issue_paths:
+        if include_comments:
+            parts.append(f"# {display_path(path, root)}\n")
+        parts.extend(block["fragment"] for block in entries[str(path)]["blocks"])
+    document = "".join(parts).encode("utf-8")
+
+    digest = sha256(document)
+    output_current = False
+    if cache.get("output_sha256") == digest and output_path.exists():
+        stat = output_path.stat()
+        output_current = [stat.st_size, stat.st_mtime_ns] == cache.get("output_signature")
+    if not output_current:
+        atomic_write(output_path, document)
+    stat = output_path.stat()
+
+    try:
+        write_json_cache(BUILD_CACHE_FILE, {
+            "version": CACHE_VERSION,
+            "metadata": str(metadata_path),
+            "components": entries,
+            "context": context,
+            "keys": sorted(current_keys),
+            "unvalidated": [] if validate else sorted(to_check),
+            "output_sha256": digest,
+            "output_signature": [stat.st_size, stat.st_mtime_ns],
+        })
+    except OSError as e:
+        print(f"⚠️  Could not cache build state: {e}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - started
+    action = "Wrote" if not output_current else "Up to date:"
+    print(f"✅ {action} {display_path(output_path, root)} - {len(summaries)} issues from {len(issue_paths)} files")
+    print(f"   {builder.files_read} file(s) read, {builder.blocks_parsed} issue block(s) parsed, "
+          f"{builder.blocks_reused} reused; {len(to_check) if validate else 0} issue(s) validated; {elapsed:.2f}s")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build planning/pi.yaml.built from the modular planning files")
+    parser.add_argument("--metadata", type=Path, default=DEFAULT_METADATA_PATH, help="pi-metadata.yaml path")
+    parser.add_argument("--output", type=Path, help="Output path (default: <build.output>.built)")
+    parser.add_argument("--full", action="store_true", help="Rebuild everything, ignoring the cache")
+    validation = parser.add_mutually_exclusive_group()
+    validation.add_argument("--validate", dest="validate", action="store_true", default=None,
+                            help="Validate changed issues (default: build.validate)")
+    validation.add_argument("--no-validate", dest="validate", action="store_false")
+    args = parser.parse_args()
+
+    if not build_planning(args.metadata, args.output, args.validate, args.full):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
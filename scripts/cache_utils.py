@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Local Cache Helpers
+
+Shared by the planning scripts that keep derived data on disk:
+- One cache directory (planning/.cache, git-ignored; MORPHEUS_CACHE_DIR overrides)
+- Atomic writes (temp file + rename) so readers never see partial files
+- JSON caches with a time-to-live
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("MORPHEUS_CACHE_DIR", REPO_ROOT / "planning" / ".cache"))
+
+
+def atomic_write(path: Path, data: Union[str, bytes]) -> None:
+    """Write a file via a temp file in the same directory and rename it into place."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data.encode("utf-8") if isinstance(data, str) else data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def read_json_cache(path: Path, max_age: Optional[float] = None) -> Optional[Any]:
+    """
+    Load a JSON cache file.
+
+    Returns None when the file is missing, unreadable, or older than
+    max_age seconds.
+    """
+    path = Path(path)
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_cache(path: Path, data: Any) -> None:
+    """Atomically write a JSON cache file."""
+    atomic_write(path, json.dumps(data, indent=2, sort_keys=True))
+
+
+def remove_cache(path: Path) -> None:
+    """Delete a cache file if it exists."""
+    try:
+        Path(path).unlink()
+    except FileNotFoundError:
+        pass
@@ -9,12 +9,14 @@ Functions to:
 """
 
 import json
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+from api_metrics import instrumented
+from github_transport import graphql_call
+
 
 def generate_copilot_instructions(
     task_key: str,
@@ -145,6 +147,7 @@ def select_custom_agent(task_data: Dict) -> Optional[str]:
     return None
 
 
+@instrumented("assign_copilot_agent")
 def assign_copilot_agent(
     issue_node_id: str,
     custom_instructions: str,
@@ -192,15 +195,15 @@ def assign_copilot_agent(
     }}
     """
     
-    cmd_bot = ["gh", "api", "graphql", "-f", f"query={query_bot}"]
-    result_bot = subprocess.run(cmd_bot, capture_output=True, text=True)
+    # Shares the pooled transport and rate-limit governor with the issue sync
+    result_bot = graphql_call(query_bot)
     
-    if result_bot.returncode != 0:
-        print(f"❌ Failed to query suggestedActors: {result_bot.stderr}")
+    if not result_bot.ok:
+        print(f"❌ Failed to query suggestedActors: {result_bot.error}")
         return False
     
     try:
-        response_bot = json.loads(result_bot.stdout)
+        response_bot = result_bot.data
         actors = response_bot.get("data", {}).get("repository", {}).get("suggestedActors", {}).get("nodes", [])
         
         # Find copilot-swe-agent
@@ -264,16 +267,13 @@ def assign_copilot_agent(
     """
     
     # CRITICAL: Must include GraphQL feature flags header
-    cmd_assign = [
-        "gh", "api", "graphql",
-        "-H", "GraphQL-Features: issues_copilot_assignment_api_support,coding_agent_model_selection",
-        "-f", f"query={mutation}"
-    ]
-    
-    result_assign = subprocess.run(cmd_assign, capture_output=True, text=True)
+    result_assign = graphql_call(
+        mutation,
+        headers={"GraphQL-Features": "issues_copilot_assignment_api_support,coding_agent_model_selection"},
+    )
     
-    if result_assign.returncode != 0:
-        stderr = result_assign.stderr.strip()
+    if not result_assign.ok:
+        stderr = result_assign.error.strip()
         if "Resource not accessible" in stderr or "FORBIDDEN" in stderr:
             print(f"⚠️  Insufficient permissions or Copilot beta not enabled")
             print(f"   Check: https://github.com/{repo_owner}/{repo_name}/settings")
@@ -282,7 +282,7 @@ def assign_copilot_agent(
         return False
     
     try:
-        response_assign = json.loads(result_assign.stdout)
+        response_assign = result_assign.data
         
         # Check for errors
         if "errors" in response_assign:
@@ -304,7 +304,7 @@ def assign_copilot_agent(
                 
     except (json.JSONDecodeError, KeyError) as e:
         print(f"❌ Failed to parse assignment response: {e}")
-        print(f"   Response: {result_assign.stdout[:500]}")
+        print(f"   Response: {json.dumps(result_assign.data)[:500]}")
     
     return False
 
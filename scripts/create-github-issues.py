@@ -7,16 +7,22 @@ Usage:
   python scripts/planning/create-github-issues.py T24          # Create single issue
   python scripts/planning/create-github-issues.py --milestone M1  # Create milestone issues
   python scripts/planning/create-github-issues.py --dry-run    # Preview without creating
+  python scripts/planning/create-github-issues.py --dry-run --profile  # Time each phase (JSON report)
 """
 
 import os
 import sys
-import yaml
 import argparse
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from docs_index import load_docs_index
+from planning_yaml import load_yaml
+from profiling import add_profile_arguments, phase, record_count, start_profiling
+from reconcile_metadata import load_planned_milestones, reconcile_metadata
+from validate_planning import check_planning
+
 WORKSPACE_ROOT = Path('/workspaces/morpheus-press')
 
 def load_planning_data():
@@ -24,16 +30,14 @@ def load_planning_data():
     
     # Load effort-map
     effort_map_path = WORKSPACE_ROOT / 'planning/estimates/effort-map.yaml'
-    with open(effort_map_path, 'r') as f:
-        effort_map = yaml.safe_load(f)
+    effort_map = load_yaml(effort_map_path)
     
     # Load issues
     issues_dir = WORKSPACE_ROOT / 'planning/issues'
     all_issues = []
     
     for issue_file in issues_dir.glob('*.yaml'):
-        with open(issue_file, 'r') as f:
-            issue_data = yaml.safe_load(f)
+        issue_data = load_yaml(issue_file)
         
         for issue in issue_data.get('issues', []):
             all_issues.append(issue)
@@ -41,7 +45,8 @@ def load_planning_data():
     # Combine data
     enriched_issues = []
     for issue in all_issues:
-        key = issue['key']
+        # Issues without a key are reported by the validation pre-flight
+        key = issue.get('key')
         estimate = effort_map['estimates'].get(key, {})
         
         enriched_issues.append({
@@ -65,78 +70,27 @@ def extract_ai_effectiveness(reasoning: str) -> str:
 
 def find_docs_for_task(task_key: str) -> Optional[str]:
     """Find markdown doc for task"""
-    docs_dir = WORKSPACE_ROOT / 'planning/docs'
-    docs_files = list(docs_dir.glob(f'**/{task_key}-*.md'))
+    doc = load_docs_index(WORKSPACE_ROOT / 'planning/docs').find(task_key)
     
-    if docs_files:
-        return str(docs_files[0].relative_to(WORKSPACE_ROOT))
+    if doc:
+        return str(doc.relative_to(WORKSPACE_ROOT))
     return None
 
 def create_milestones(dry_run: bool = False) -> Dict[str, int]:
-    """Create GitHub milestones via API and return milestone name -> number mapping"""
-    
-    milestones = [
-        {'title': 'M0 - Infrastructure & Setup', 'due_on': '2026-02-28T00:00:00Z', 'description': 'Project setup, CI/CD, devcontainer, Docker'},
-        {'title': 'M1 - Backend Services', 'due_on': '2026-03-31T00:00:00Z', 'description': 'Supabase, API routes, services, testing'},
-        {'title': 'M2 - Dashboard UI', 'due_on': '2026-04-30T00:00:00Z', 'description': 'Next.js dashboard, shadcn/ui components'},
-        {'title': 'M3 - Image Generation', 'due_on': '2026-05-31T00:00:00Z', 'description': 'RunPod, Stable Diffusion, ComfyUI integration'},
-        {'title': 'M4 - ML & Publishing', 'due_on': '2026-06-30T00:00:00Z', 'description': 'Propaganda detection, e-commerce, PDF generation'},
-    ]
+    """Reconcile milestones and labels with planning/milestones.yaml and labels.yaml; return milestone name -> number"""
     
-    milestone_map = {}
+    milestones_path = WORKSPACE_ROOT / 'planning/milestones.yaml'
+    print("\n📅 Reconciling milestones and labels...")
+    milestone_map = reconcile_metadata(
+        milestones_path=milestones_path,
+        labels_path=WORKSPACE_ROOT / 'planning/labels.yaml',
+        dry_run=dry_run,
+    ) or {}
     
     if dry_run:
-        print("\n📅 Would create milestones:")
-        for ms in milestones:
-            print(f"   • {ms['title']} (due: {ms['due_on'][:10]})")
-        # Return dummy mapping for dry-run
-        return {ms['title']: idx+1 for idx, ms in enumerate(milestones)}
-    
-    # Get existing milestones
-    try:
-        result = subprocess.run(
-            ['gh', 'api', '/repos/neutrico/morpheus-press/milestones', '--jq', '.[] | "\(.number)\t\(.title)"'],
-            capture_output=True, text=True, check=False
-        )
-        
-        existing = {}
-        if result.returncode == 0 and result.stdout.strip():
-            for line in result.stdout.strip().split('\n'):
-                if '\t' in line:
-                    num, title = line.split('\t', 1)
-                    existing[title] = int(num)
-        
-        print(f"\n📅 Found {len(existing)} existing milestones")
-    except Exception as e:
-        print(f"⚠️  Could not fetch existing milestones: {e}")
-        existing = {}
-    
-    # Create missing milestones
-    print("\n📅 Creating milestones...")
-    for ms in milestones:
-        title = ms['title']
-        
-        if title in existing:
-            milestone_map[title] = existing[title]
-            print(f"   ✓ {title} (already exists)")
-            continue
-        
-        try:
-            result = subprocess.run(
-                ['gh', 'api', '/repos/neutrico/morpheus-press/milestones',
-                 '-f', f"title={title}",
-                 '-f', f"due_on={ms['due_on']}",
-                 '-f', f"description={ms['description']}",
-                 '--jq', '.number'],
-                capture_output=True, text=True, check=True
-            )
-            
-            milestone_num = int(result.stdout.strip())
-            milestone_map[title] = milestone_num
-            print(f"   ✅ Created: {title} (#{milestone_num})")
-            
-        except subprocess.CalledProcessError as e:
-            print(f"   ❌ Failed to create {title}: {e.stderr}")
+        # Placeholder numbers for milestones that would be created
+        for idx, title in enumerate(load_planned_milestones(milestones_path)):
+            milestone_map.setdefault(title, idx + 1)
     
     return milestone_map
 
@@ -333,32 +287,45 @@ def main():
     parser.add_argument('--milestone', help='Filter by milestone (e.g., M1)')
     parser.add_argument('--dry-run', action='store_true', help='Preview without creating')
     parser.add_argument('--ai-high-only', action='store_true', help='Only HIGH AI effectiveness tasks')
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
+    start_profiling(args, 'create-github-issues')
     
     print("🚀 GitHub Issue Creator")
     print("="*80)
     
-    # Create milestones first
-    milestone_map = create_milestones(dry_run=args.dry_run)
-    
     # Load planning data
-    issues = load_planning_data()
+    with phase('yaml_load'):
+        issues = load_planning_data()
+    record_count('tasks', len(issues))
     
     # Filter
-    if args.task_key:
-        issues = [i for i in issues if i['key'] == args.task_key]
-    
-    if args.milestone:
-        issues = [i for i in issues if i.get('milestone', '').startswith(args.milestone)]
-    
-    if args.ai_high_only:
-        issues = [i for i in issues if i.get('ai_effectiveness') == 'HIGH']
+    with phase('filter'):
+        if args.task_key:
+            issues = [i for i in issues if i.get('key') == args.task_key]
+        
+        if args.milestone:
+            issues = [i for i in issues if i.get('milestone', '').startswith(args.milestone)]
+        
+        if args.ai_high_only:
+            issues = [i for i in issues if i.get('ai_effectiveness') == 'HIGH']
+    record_count('filtered_tasks', len(issues))
     
     if not issues:
         print("❌ No issues found matching criteria")
         return
     
+    # Check the selected tasks first: a task without a key or with a dangling
+    # dependency would otherwise fail halfway through the run
+    with phase('validate'):
+        if not check_planning(WORKSPACE_ROOT / 'planning', keys={i.get('key') for i in issues}):
+            sys.exit(1)
+    
+    # Create milestones before the issues that reference them
+    with phase('milestones'):
+        milestone_map = create_milestones(dry_run=args.dry_run)
+    
     print(f"\nFound {len(issues)} issue(s) to create")
     
     if args.dry_run:
@@ -371,9 +338,10 @@ def main():
     
     # Create issues
     success = 0
-    for issue in issues:
-        if create_github_issue(issue, milestone_map, dry_run=args.dry_run):
-            success += 1
+    with phase('issue_creation'):
+        for issue in issues:
+            if create_github_issue(issue, milestone_map, dry_run=args.dry_run):
+                success += 1
     
     print(f"\n{'='*80}")
     print(f"✅ Complete: {success}/{len(issues)} issues {'would be' if args.dry_run else ''} created")
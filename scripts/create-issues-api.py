@@ -2,18 +2,34 @@
 """
 GitHub Issues Creator with full GitHub Projects v2 API support.
 Creates issues with proper milestone, project assignment, custom fields, and relationships.
+With --watch, keeps running and pushes planning edits as they are saved.
 """
 
+import hashlib
+import heapq
 import json
 import os
-import subprocess
+import re
 import sys
-import time
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
 
 import yaml
 
+from api_budget import (
+    SCHEDULE_REFUSE,
+    SCHEDULE_SPLIT,
+    ApiCost,
+    fetch_budget,
+    mutation_cost,
+    plan_schedule,
+    print_budget_plan,
+    query_cost,
+    rest_cost,
+)
+from api_metrics import instrumented, report_at_exit
 # Import Copilot agent functions
 from copilot_agent import (
     assign_copilot_agent,
@@ -21,53 +37,92 @@ from copilot_agent import (
     generate_copilot_instructions,
     select_custom_agent,
 )
+from docs_index import load_docs_index
+from github_transport import TRANSPORT_MODES, configure as configure_transport, graphql_call, rest_call
+from graphql_batch import (
+    DEFAULT_CHUNK_SIZE,
+    alias_results,
+    build_aliased_mutation,
+    estimate_batch_count,
+    mutation_op,
+    run_aliased_batches,
+)
+from issue_scheduler import DEFAULT_CONCURRENCY, run_dependency_ordered, strongly_connected_components
+from planning_watch import (
+    DEFAULT_DEBOUNCE_SECONDS,
+    DEFAULT_POLL_INTERVAL,
+    PollingWatcher,
+    create_watcher,
+    is_docs_path,
+    wait_for_changes,
+)
+from planning_store import PlanningStore, extract_ai_effectiveness, open_store
+from planning_yaml import load_yaml
+from profiling import add_profile_arguments, phase, record_count, start_profiling
+from project_schema import (
+    invalidate_project_schema,
+    is_not_found_error,
+    iteration_key_from_title,
+    load_project_schema,
+)
+from reconcile_metadata import reconcile_metadata
+from sync_state import STEP_CREATED, STEP_DONE, STEP_IN_PROJECT, STEP_TYPED, SyncState, step_reached
+from validate_planning import check_planning
 
 # Configuration
-WORKSPACE_ROOT = Path("/workspaces/morpheus-press")
+WORKSPACE_ROOT = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press"))
 EFFORT_MAP_PATH = WORKSPACE_ROOT / "planning/estimates/effort-map.yaml"
 ISSUES_DIR = WORKSPACE_ROOT / "planning/issues"
 DOCS_DIR = WORKSPACE_ROOT / "planning/docs"
+PLANNING_DIR = WORKSPACE_ROOT / "planning"
+MILESTONES_PATH = PLANNING_DIR / "milestones.yaml"
+LABELS_PATH = PLANNING_DIR / "labels.yaml"
+SYNC_STATE_PATH = WORKSPACE_ROOT / "planning/.cache/sync-state.db"
 
 REPO_OWNER = "neutrico"
 REPO_NAME = "morpheus-press"
 PROJECT_NUMBER = 5  # Morpheus Press - Planning & Automation
-PROJECT_ID = "PVT_kwDOACzkfM4BOras"
 
-# GitHub Projects v2 Field IDs
-FIELD_STATUS = "PVTSSF_lADOACzkfM4BOraszg9TxGA"
-FIELD_MILESTONE = "PVTF_lADOACzkfM4BOraszg9TxGM"
-FIELD_PARENT_ISSUE = "PVTF_lADOACzkfM4BOraszg9TxGc"
-FIELD_BLOCKED_BY = "PVTF_lADOACzkfM4BOraszg9TzuM"  # Custom text field
-FIELD_ITERATION = "PVTIF_lADOACzkfM4BOraszg9T_B8"  # Iteration field
+# Project field / option / issue type names - their IDs are discovered at startup
+# (project_schema.py, cached in planning/.cache) by resolve_project_ids()
+FIELD_NAME_STATUS = "Status"
+FIELD_NAME_MILESTONE = "Milestone"
+FIELD_NAME_PARENT_ISSUE = "Parent issue"
+FIELD_NAME_BLOCKED_BY = "Blocked By"  # Custom text field
+FIELD_NAME_ITERATION = "Iteration"  # Iteration field
 
-STATUS_TODO_ID = "f75ad846"
-STATUS_IN_PROGRESS_ID = "47fc9ee4"
-STATUS_DONE_ID = "98236657"
+STATUS_NAME_TODO = "Todo"
+STATUS_NAME_IN_PROGRESS = "In Progress"
+STATUS_NAME_DONE = "Done"
 
 # GitHub Native Issue Types (ONLY these are used)
-GITHUB_ISSUE_TYPE_TASK = "IT_kwDOACzkfM4ABHiZ"
-GITHUB_ISSUE_TYPE_BUG = "IT_kwDOACzkfM4ABHic"
-GITHUB_ISSUE_TYPE_FEATURE = "IT_kwDOACzkfM4ABHie"
-
-# Milestone mapping (created in previous step)
-MILESTONE_MAP = {
-    "M0 - Infrastructure & Setup": 1,
-    "M1 - Backend Services": 2,
-    "M2 - Dashboard UI": 3,
-    "M3 - Content Generation Pipeline": 4,  # Fixed: was "M3 - Image Generation"
-    "M4 - ML & Publishing": 5,
-}
+ISSUE_TYPE_NAME_TASK = "Task"
+ISSUE_TYPE_NAME_BUG = "Bug"
+ISSUE_TYPE_NAME_FEATURE = "Feature"
 
-# Iteration mapping (I1-I7 -> iteration IDs)
-ITERATION_MAP = {
-    "I1": "aa0d8cf1",  # I1 - Infrastructure
-    "I2": "8ff7fbce",  # I2 - Backend Core
-    "I3": "7e358c77",  # I3 - ML Foundation
-    "I4": "c49f86bc",  # I4 - Generation Pipeline
-    "I5": "7467ed8f",  # I5 - Dashboard & Assembly
-    "I6": "946f740b",  # I6 - Commerce & Distribution
-    "I7": "088db25a",  # I7 - Launch & Release
-}
+# Resolved IDs (filled by resolve_project_ids)
+PROJECT_ID: Optional[str] = None
+
+FIELD_STATUS: Optional[str] = None
+FIELD_MILESTONE: Optional[str] = None
+FIELD_PARENT_ISSUE: Optional[str] = None
+FIELD_BLOCKED_BY: Optional[str] = None
+FIELD_ITERATION: Optional[str] = None
+
+STATUS_TODO_ID: Optional[str] = None
+STATUS_IN_PROGRESS_ID: Optional[str] = None
+STATUS_DONE_ID: Optional[str] = None
+
+GITHUB_ISSUE_TYPE_TASK: Optional[str] = None
+GITHUB_ISSUE_TYPE_BUG: Optional[str] = None
+GITHUB_ISSUE_TYPE_FEATURE: Optional[str] = None
+
+# Milestone title -> number
+MILESTONE_MAP: Dict[str, int] = {}
+
+# Iteration mapping (I1-I7 -> iteration IDs) and full iteration titles
+ITERATION_MAP: Dict[str, str] = {}
+ITERATION_NAMES: Dict[str, str] = {}
 
 # Cache for created issues (task_key -> issue_number)
 created_issues_cache: Dict[str, int] = {}
@@ -75,6 +130,22 @@ created_issues_cache: Dict[str, int] = {}
 # Cache for issue node IDs (task_key -> node_id) - needed for parent/sub-issue relationships
 created_issues_node_ids: Dict[str, str] = {}
 
+# Both caches are filled concurrently by the issue scheduler - update them together under the lock
+_cache_lock = threading.Lock()
+
+# Repository/label/milestone node IDs for GraphQL provisioning (from the project schema)
+_repository_ids: Optional[Dict] = None
+_repository_lock = threading.RLock()
+_schema_refreshed = False
+
+# Persistent sync progress (opened in main(); None with --no-state or --dry-run)
+sync_state: Optional[SyncState] = None
+
+# Issues already on GitHub, keyed by task key parsed from the title (filled by prefetch_remote_index)
+remote_index: Dict[str, Dict] = {}
+remote_relationships: set = set()
+TASK_KEY_PATTERN = re.compile(r"^(T\d+):")
+
 # Parent mapping (child_key -> parent_key) - for demo purposes
 # In production, this should be derived from YAML structure or inferred from Feature/Task relationships
 PARENT_MAPPING = {
@@ -85,100 +156,225 @@ PARENT_MAPPING = {
     # "T32": "T25",  # Docs → API Routes
 }
 
+# task_data keys added by select_tasks() on top of the effort-map entry
+DERIVED_TASK_FIELDS = ("ai_effectiveness", "task", "dependencies", "planning_hashes")
+
 
 def run_gh_api(
     endpoint: str, method: str = "GET", data: Optional[Dict] = None
 ) -> Dict:
-    """Run GitHub REST API command."""
-    cmd = ["gh", "api", endpoint, "-X", method]
-    if data:
-        cmd.extend(["-f", f"input={json.dumps(data)}"])
-        for key, value in data.items():
-            if isinstance(value, (str, int)):
-                cmd.extend(["-f", f"{key}={value}"])
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"❌ API Error: {result.stderr}")
+    """Run GitHub REST API call (pooled HTTP session, `gh api` fallback)."""
+    response = rest_call(endpoint, method, data)
+    if not response.ok:
+        print(f"❌ API Error: {response.error}")
         return {}
-    return json.loads(result.stdout) if result.stdout else {}
+    return response.data or {}
 
 
 def run_graphql(query: str, variables: Optional[Dict] = None) -> Dict:
-    """Run GitHub GraphQL API query."""
-    cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
-    if variables:
-        # Use -F for JSON variables (non-string types)
-        for key, value in variables.items():
-            if isinstance(value, bool):
-                # Boolean values need lowercase true/false in JSON
-                cmd.extend(["-F", f"{key}={json.dumps(value)}"])
-            elif isinstance(value, (dict, list)):
-                cmd.extend(["-F", f"{key}={json.dumps(value)}"])
-            else:
-                cmd.extend(["-F", f"{key}={json.dumps(value)}"])
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"❌ GraphQL Error: {result.stderr}")
+    """Run GitHub GraphQL API query (pooled HTTP session, `gh api` fallback)."""
+    response = graphql_call(query, variables)
+    if response.error:
+        print(f"❌ GraphQL Error: {response.error}")
+        refresh_stale_project_ids(response.data, response.error)
+    if response.status == 0:
         return {}
-    return json.loads(result.stdout) if result.stdout else {}
+    return response.data or {}
+
+
+def mutation_succeeded(result: Dict, field: str) -> bool:
+    """Check that a mutation field came back non-null (GraphQL errors null it out)."""
+    return bool((result.get("data") or {}).get(field))
 
 
 def load_effort_map() -> Dict:
     """Load effort-map.yaml with task definitions."""
-    with open(EFFORT_MAP_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_yaml(EFFORT_MAP_PATH)
+
+
+def load_milestone_definitions() -> Dict[str, Dict]:
+    """Milestones from planning/milestones.yaml, keyed by name (empty if the file is missing)."""
+    if not MILESTONES_PATH.exists():
+        return {}
+    data = load_yaml(MILESTONES_PATH) or {}
+    return {milestone["name"]: milestone for milestone in data.get("milestones", []) if milestone.get("name")}
+
+
+def parse_issue_file(issue_file: Path) -> Dict[str, Dict]:
+    """Sync inputs per task from one planning/issues/*.yaml file: dependsOn and the agent_notes hashes."""
+    milestone_data = load_yaml(issue_file) or {}
+    entries = {}
+    for issue in milestone_data.get("issues", []):
+        task_key = issue.get("key")
+        if task_key:
+            agent_notes = issue.get("agent_notes") or {}
+            entries[task_key] = {
+                "dependencies": issue.get("dependsOn", []),
+                "planning_hashes": [agent_notes.get("content_hash", ""), agent_notes.get("planning_hash", "")],
+            }
+    return entries
+
+
+def load_issue_files(store: PlanningStore) -> Dict[Path, Dict[str, Dict]]:
+    """parse_issue_file() results for every planning/issues/*.yaml file, read from the compiled store."""
+    dependencies = store.dependencies()
+    issue_files: Dict[Path, Dict[str, Dict]] = {}
+    for row in store.query(columns=["key", "issue_file", "content_hash", "planning_hash"]):
+        if row["issue_file"]:
+            issue_files.setdefault(ISSUES_DIR / row["issue_file"], {})[row["key"]] = {
+                "dependencies": dependencies.get(row["key"], []),
+                "planning_hashes": [row["content_hash"], row["planning_hash"]],
+            }
+    return issue_files
+
+
+def merge_issue_entries(issue_files: Dict[Path, Dict[str, Dict]]) -> Dict[str, Dict]:
+    """Task key -> sync inputs across all issue files."""
+    merged = {}
+    for entries in issue_files.values():
+        merged.update(entries)
+    return merged
+
+
+def estimate_fields(task_data: Dict) -> Dict:
+    """An effort-map entry without the fields select_tasks() derives from it."""
+    return {key: value for key, value in task_data.items() if key not in DERIVED_TASK_FIELDS}
+
+
+def select_tasks(
+    tasks: Dict[str, Dict],
+    issue_entries: Dict[str, Dict],
+    args,
+    keys: Optional[set] = None,
+) -> List[tuple]:
+    """
+    Apply the command-line filters (task keys, --milestone, --ai-high-only)
+    and merge the issue-file inputs into each selected task's data.
+    
+    `keys` restricts the selection further (the planning store's indexed
+    query on startup, the affected tasks in watch mode).
+    """
+    filtered_tasks = []
+    for task_key, task_data in tasks.items():
+        if keys is not None and task_key not in keys:
+            continue
+        
+        # Extract AI effectiveness from reasoning
+        ai_effectiveness = extract_ai_effectiveness(task_data)
+        
+        # Skip if specific keys requested and not in list
+        if args.task_keys and task_key not in args.task_keys:
+            continue
+        
+        # Skip if milestone filter and doesn't match
+        if args.milestone and not task_data.get("milestone", "").startswith(args.milestone):
+            continue
+        
+        # Skip if HIGH AI only and not HIGH
+        if args.ai_high_only and ai_effectiveness.lower() != "high":
+            continue
+        
+        # Merge AI data and dependencies into task_data
+        entry = issue_entries.get(task_key, {})
+        task_data["ai_effectiveness"] = ai_effectiveness
+        task_data["task"] = task_data.get("title", "")  # Map title -> task
+        task_data["dependencies"] = entry.get("dependencies", [])
+        task_data["planning_hashes"] = entry.get("planning_hashes", [])
+        
+        filtered_tasks.append((task_key, task_data))
+    return filtered_tasks
 
 
-def topological_sort_tasks(tasks: List[tuple]) -> List[tuple]:
+def topological_sort_tasks(tasks: List[tuple], known_keys: Optional[set] = None) -> List[tuple]:
     """
     Sort tasks by dependencies (topological sort).
     Tasks without dependencies come first, then tasks that depend on them.
     
+    Kahn's algorithm over the condensation of the dependency graph: every
+    dependency cycle (strongly connected component, found once with Tarjan)
+    is one unit, released as a whole - in task key order - when nothing
+    outside it is still pending. Tasks downstream of a cycle therefore still
+    come after every task of the cycle. O((V + E) log V), with ties broken by
+    task key so the order is deterministic; cycles are reported once.
+    
     Args:
         tasks: List of (task_key, task_data) tuples
+        known_keys: Every task key in the planning data; dependencies outside
+                    it are reported as dangling (default: don't check)
     
     Returns:
         Sorted list of (task_key, task_data) tuples
     """
-    # Build dependency graph
     task_map = {task_key: task_data for task_key, task_data in tasks}
     
-    # Calculate in-degree (number of dependencies)
-    in_degree = {}
+    # Collapse each dependency cycle into one unit, named by its lowest key
+    cycles = find_dependency_cycles(tasks)
+    for component in cycles:
+        shown = ", ".join(component[:10])
+        more = f" (+{len(component) - 10} more)" if len(component) > 10 else ""
+        print(f"   ⚠️  Dependency cycle between: {shown}{more}")
+    unit_of = {task_key: task_key for task_key in task_map}
+    members = {task_key: [task_key] for task_key in task_map}
+    for component in cycles:
+        for task_key in component:
+            unit_of[task_key] = component[0]
+            members.pop(task_key, None)
+        members[component[0]] = component
+    
+    # Build the unit graph (only dependencies inside our filtered task list count)
+    in_degree = {unit: 0 for unit in members}
+    dependents: Dict[str, List[str]] = {unit: [] for unit in members}
+    dangling = []
     for task_key, task_data in tasks:
-        dependencies = task_data.get("dependencies", [])
-        # Only count dependencies that are in our filtered task list
-        valid_deps = [dep for dep in dependencies if dep in task_map]
-        in_degree[task_key] = len(valid_deps)
-    
-    # Start with tasks that have no dependencies
-    sorted_tasks = []
-    queue = [task_key for task_key in in_degree if in_degree[task_key] == 0]
-    
-    # Process tasks in order
-    while queue:
-        # Sort queue for deterministic order
-        queue.sort()
-        task_key = queue.pop(0)
-        sorted_tasks.append((task_key, task_map[task_key]))
+        for dep in set(task_data.get("dependencies", [])):
+            if dep in task_map:
+                if unit_of[dep] != unit_of[task_key]:
+                    in_degree[unit_of[task_key]] += 1
+                    dependents[unit_of[dep]].append(unit_of[task_key])
+            elif known_keys is not None and dep not in known_keys:
+                dangling.append((task_key, dep))
+    
+    for task_key, dep in sorted(dangling):
+        print(f"   ⚠️  {task_key} depends on unknown task {dep}")
+    
+    # Start with units that have no dependencies; the condensation is acyclic,
+    # so every unit becomes ready exactly once
+    ready = [unit for unit, degree in in_degree.items() if degree == 0]
+    heapq.heapify(ready)
+    sorted_keys = []
+    while ready:
+        unit = heapq.heappop(ready)
+        sorted_keys.extend(members[unit])
         
-        # Find tasks that depend on this one and decrement their in-degree
-        for other_key, other_data in tasks:
-            if other_key in [t[0] for t in sorted_tasks]:
-                continue
-            dependencies = other_data.get("dependencies", [])
-            if task_key in dependencies:
-                in_degree[other_key] -= 1
-                if in_degree[other_key] == 0:
-                    queue.append(other_key)
+        # Decrement the in-degree of units that depend on this one
+        for dependent in dependents[unit]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                heapq.heappush(ready, dependent)
     
-    # Add any remaining tasks (circular dependencies or orphans)
-    remaining = [t for t in tasks if t[0] not in [s[0] for s in sorted_tasks]]
-    sorted_tasks.extend(remaining)
+    return [(task_key, task_map[task_key]) for task_key in sorted_keys]
+
+
+def find_dependency_cycles(tasks: List[tuple]) -> List[List[str]]:
+    """
+    Strongly connected components with more than one task (or a self-dependency).
     
-    return sorted_tasks
+    Uses the scheduler's iterative Tarjan (strongly_connected_components).
+    Each component is returned as a sorted list of task keys.
+    """
+    graph = {
+        task_key: sorted({dep for dep in task_data.get("dependencies", []) if dep != task_key})
+        for task_key, task_data in tasks
+    }
+    self_loops = {task_key for task_key, task_data in tasks if task_key in task_data.get("dependencies", [])}
+    for task_key in graph:
+        graph[task_key] = [dep for dep in graph[task_key] if dep in graph]
+    
+    components = [
+        component for component in strongly_connected_components(graph)
+        if len(component) > 1 or component[0] in self_loops
+    ]
+    return sorted(components)
 
 
 def get_milestone_number(milestone_key: str) -> Optional[int]:
@@ -196,6 +392,7 @@ def get_issue_node_id(issue_number: int) -> Optional[str]:
     return result.get("node_id")
 
 
+@instrumented("create_issue_rest")
 def create_issue_rest(
     title: str,
     body: str,
@@ -212,27 +409,12 @@ def create_issue_rest(
     if milestone:
         payload["milestone"] = milestone
     
-    # Use --input with JSON via stdin
-    cmd = [
-        "gh", "api",
-        f"/repos/{REPO_OWNER}/{REPO_NAME}/issues",
-        "-X", "POST",
-        "--input", "-",  # Read from stdin
-    ]
-    
-    result = subprocess.run(
-        cmd,
-        input=json.dumps(payload),
-        capture_output=True,
-        text=True,
-    )
-    
-    if result.returncode != 0:
-        print(f"   ❌ Failed to create issue: {result.stderr}")
+    response = rest_call(f"/repos/{REPO_OWNER}/{REPO_NAME}/issues", "POST", payload)
+    if not response.ok:
+        print(f"   ❌ Failed to create issue: {response.error}")
         return None
     
-    issue_data = json.loads(result.stdout)
-    return issue_data.get("number")
+    return response.data.get("number")
 
 
 def add_issue_to_project(issue_node_id: str) -> Optional[str]:
@@ -292,7 +474,7 @@ def set_project_field(
         },
     )
     
-    return "data" in result and "updateProjectV2ItemFieldValue" in result["data"]
+    return mutation_succeeded(result, "updateProjectV2ItemFieldValue")
 
 
 def set_project_text_field(
@@ -326,7 +508,7 @@ def set_project_text_field(
         },
     )
     
-    return "data" in result and "updateProjectV2ItemFieldValue" in result["data"]
+    return mutation_succeeded(result, "updateProjectV2ItemFieldValue")
 
 
 def set_project_iteration_field(
@@ -360,7 +542,7 @@ def set_project_iteration_field(
         },
     )
     
-    return "data" in result and "updateProjectV2ItemFieldValue" in result["data"]
+    return mutation_succeeded(result, "updateProjectV2ItemFieldValue")
 
 
 def set_issue_type(issue_node_id: str, issue_type_id: str) -> bool:
@@ -390,7 +572,7 @@ def set_issue_type(issue_node_id: str, issue_type_id: str) -> bool:
         },
     )
     
-    return "data" in result and "updateIssue" in result["data"]
+    return mutation_succeeded(result, "updateIssue")
 
 
 def set_parent_issue(parent_node_id: str, sub_issue_node_id: str) -> bool:
@@ -430,7 +612,7 @@ def set_parent_issue(parent_node_id: str, sub_issue_node_id: str) -> bool:
         },
     )
     
-    return "data" in result and "addSubIssue" in result["data"]
+    return mutation_succeeded(result, "addSubIssue")
 
 
 def link_issue_dependency(blocked_issue_node_id: str, blocking_issue_node_id: str) -> bool:
@@ -468,16 +650,15 @@ def link_issue_dependency(blocked_issue_node_id: str, blocking_issue_node_id: st
         },
     )
     
-    return "data" in result and "addBlockedBy" in result["data"]
+    return mutation_succeeded(result, "addBlockedBy")
 
 
-def create_github_issue(
+def build_issue_content(
     task_key: str,
     task_data: Dict,
-    milestone_key: str,
     spec_file: Optional[Path] = None,
-) -> Optional[int]:
-    """Create a GitHub issue with full project integration."""
+) -> Tuple[str, str, List[str]]:
+    """Build issue title, body and labels for a task."""
     
     # Build issue title
     title = f"{task_key}: {task_data['task']}"
@@ -530,40 +711,771 @@ def create_github_issue(
     if priority in ["critical", "high"]:
         labels.append(f"priority:{priority}")
     
+    return title, body, labels
+
+
+def build_blocked_by_text(task_data: Dict) -> Tuple[str, List[str]]:
+    """
+    Build "Blocked By" field text (e.g., "#36, #37") from already created dependencies.
+    
+    Returns:
+        (blocked_by_text, missing_dependency_keys)
+    """
+    blocked_by_items = []
+    missing_deps = []
+    for dep in task_data.get("dependencies", []):
+        if dep in created_issues_cache:
+            blocked_by_items.append(f"#{created_issues_cache[dep]}")
+        else:
+            missing_deps.append(dep)
+    return ", ".join(blocked_by_items), missing_deps
+
+
+def record_created_issue(task_key: str, issue_number: int, issue_node_id: str) -> None:
+    """Record a created issue in both caches atomically."""
+    with _cache_lock:
+        created_issues_cache[task_key] = issue_number
+        created_issues_node_ids[task_key] = issue_node_id
+
+
+def resolve_project_ids(refresh: bool = False) -> bool:
+    """
+    Fill the project, field, option, issue type, milestone and iteration IDs
+    from the discovered project schema (disk cache, refetched when stale).
+    
+    Returns False when the schema could not be loaded.
+    """
+    global PROJECT_ID, FIELD_STATUS, FIELD_MILESTONE, FIELD_PARENT_ISSUE, FIELD_BLOCKED_BY, FIELD_ITERATION
+    global STATUS_TODO_ID, STATUS_IN_PROGRESS_ID, STATUS_DONE_ID
+    global GITHUB_ISSUE_TYPE_TASK, GITHUB_ISSUE_TYPE_BUG, GITHUB_ISSUE_TYPE_FEATURE
+    global MILESTONE_MAP, ITERATION_MAP, ITERATION_NAMES, _repository_ids
+    
+    with _repository_lock:
+        schema = load_project_schema(REPO_OWNER, REPO_NAME, PROJECT_NUMBER, refresh=refresh)
+        if schema is None:
+            return False
+        
+        PROJECT_ID = schema.project_id
+        FIELD_STATUS = schema.field_id(FIELD_NAME_STATUS)
+        FIELD_MILESTONE = schema.field_id(FIELD_NAME_MILESTONE)
+        FIELD_PARENT_ISSUE = schema.field_id(FIELD_NAME_PARENT_ISSUE)
+        FIELD_BLOCKED_BY = schema.field_id(FIELD_NAME_BLOCKED_BY)
+        FIELD_ITERATION = schema.field_id(FIELD_NAME_ITERATION)
+        
+        STATUS_TODO_ID = schema.option_id(FIELD_NAME_STATUS, STATUS_NAME_TODO)
+        STATUS_IN_PROGRESS_ID = schema.option_id(FIELD_NAME_STATUS, STATUS_NAME_IN_PROGRESS)
+        STATUS_DONE_ID = schema.option_id(FIELD_NAME_STATUS, STATUS_NAME_DONE)
+        
+        GITHUB_ISSUE_TYPE_TASK = schema.issue_type_id(ISSUE_TYPE_NAME_TASK)
+        GITHUB_ISSUE_TYPE_BUG = schema.issue_type_id(ISSUE_TYPE_NAME_BUG)
+        GITHUB_ISSUE_TYPE_FEATURE = schema.issue_type_id(ISSUE_TYPE_NAME_FEATURE)
+        
+        MILESTONE_MAP = schema.milestone_numbers()
+        ITERATION_MAP, ITERATION_NAMES = {}, {}
+        for iteration in schema.iterations(FIELD_NAME_ITERATION):
+            key = iteration_key_from_title(iteration["title"])
+            if key:
+                ITERATION_MAP[key] = iteration["id"]
+                ITERATION_NAMES[key] = iteration["title"]
+        
+        # GraphQL createIssue takes node IDs where the REST API takes names/numbers
+        _repository_ids = {
+            "id": schema.repository_id,
+            "labels": schema.label_ids(),
+            "milestones": schema.milestone_ids(),
+        }
+    
+    missing = [
+        name for name, value in (
+            (FIELD_NAME_STATUS, FIELD_STATUS),
+            (FIELD_NAME_ITERATION, FIELD_ITERATION),
+            (FIELD_NAME_BLOCKED_BY, FIELD_BLOCKED_BY),
+            (f"{FIELD_NAME_STATUS}: {STATUS_NAME_TODO}", STATUS_TODO_ID),
+            (f"issue type {ISSUE_TYPE_NAME_FEATURE}", GITHUB_ISSUE_TYPE_FEATURE),
+        ) if not value
+    ]
+    if missing:
+        print(f"⚠️  Not found in project #{PROJECT_NUMBER}: {', '.join(missing)}")
+    return True
+
+
+def refresh_stale_project_ids(result: Dict, error: str = "") -> None:
+    """Refetch the project schema (once per run) when the API reports a cached ID as not found."""
+    global _schema_refreshed
+    if _schema_refreshed or PROJECT_ID is None or not is_not_found_error(result, error):
+        return
+    _schema_refreshed = True
+    print("   🔄 Cached project IDs look stale - refreshing project schema")
+    invalidate_project_schema(REPO_OWNER, REPO_NAME, PROJECT_NUMBER)
+    resolve_project_ids(refresh=True)
+
+
+def get_repository_ids() -> Dict:
+    """Repository node ID plus label and milestone node IDs (from the project schema)."""
+    with _repository_lock:
+        if _repository_ids is None:
+            resolve_project_ids()
+        return _repository_ids or {}
+
+
+def get_label_ids(labels: List[str]) -> List[str]:
+    """Resolve label names to node IDs, creating missing labels like the REST API does."""
+    label_ids = []
+    with _repository_lock:
+        repo_ids = get_repository_ids()
+        for name in labels:
+            if name not in repo_ids["labels"]:
+                created = run_gh_api(f"/repos/{REPO_OWNER}/{REPO_NAME}/labels", "POST", {"name": name})
+                if created.get("node_id"):
+                    repo_ids["labels"][name] = created["node_id"]
+                else:
+                    # Most likely created after the schema was cached - refetch and look again
+                    resolve_project_ids(refresh=True)
+                    repo_ids = get_repository_ids()
+                    if name not in repo_ids["labels"]:
+                        print(f"   ⚠️  Could not create label '{name}', skipping")
+                        continue
+            label_ids.append(repo_ids["labels"][name])
+    return label_ids
+
+
+def create_issue_graphql(
+    title: str,
+    body: str,
+    labels: List[str],
+    milestone: Optional[int] = None,
+    issue_type_id: Optional[str] = None,
+) -> Optional[Dict]:
+    """
+    Create issue via GraphQL with issue type and project membership in one call.
+    
+    Returns:
+        Dict with "number", "node_id" and "project_item_id" (None if not added to project)
+    """
+    repo_ids = get_repository_ids()
+    if not repo_ids:
+        print("   ❌ Could not resolve repository IDs")
+        return None
+    
+    issue_input = {
+        "repositoryId": repo_ids["id"],
+        "title": title,
+        "body": body,
+        "labelIds": get_label_ids(labels),
+        "projectV2Ids": [PROJECT_ID],
+    }
+    if milestone and milestone in repo_ids["milestones"]:
+        issue_input["milestoneId"] = repo_ids["milestones"][milestone]
+    if issue_type_id:
+        issue_input["issueTypeId"] = issue_type_id
+    
+    mutation = """
+    mutation($input: CreateIssueInput!) {
+      createIssue(input: $input) {
+        issue {
+          id
+          number
+          projectItems(first: 10) {
+            nodes {
+              id
+              project { id }
+            }
+          }
+        }
+      }
+    }
+    """
+    
+    result = run_graphql(mutation, variables={"input": issue_input})
+    issue = ((result.get("data") or {}).get("createIssue") or {}).get("issue")
+    if not issue:
+        return None
+    
+    project_item_id = next(
+        (item["id"] for item in issue["projectItems"]["nodes"] if item["project"]["id"] == PROJECT_ID),
+        None,
+    )
+    return {"number": issue["number"], "node_id": issue["id"], "project_item_id": project_item_id}
+
+
+def apply_project_updates(operations: List[Dict]) -> Dict[str, bool]:
+    """Run several mutations as one aliased document; returns alias -> success."""
+    if not operations:
+        return {}
+    document, variables = build_aliased_mutation(operations)
+    result = run_graphql(document, variables=variables)
+    return alias_results(result, [op["alias"] for op in operations])
+
+
+def field_value_op(alias: str, project_item_id: str, field_id: str, value: Dict) -> Dict:
+    """Aliased updateProjectV2ItemFieldValue operation."""
+    return mutation_op(
+        alias,
+        "updateProjectV2ItemFieldValue",
+        "UpdateProjectV2ItemFieldValueInput",
+        {"projectId": PROJECT_ID, "itemId": project_item_id, "fieldId": field_id, "value": value},
+        "projectV2Item { id }",
+    )
+
+
+def sub_issue_op(alias: str, parent_node_id: str, sub_issue_node_id: str) -> Dict:
+    """Aliased addSubIssue operation."""
+    return mutation_op(
+        alias,
+        "addSubIssue",
+        "AddSubIssueInput",
+        {"issueId": parent_node_id, "subIssueId": sub_issue_node_id, "replaceParent": True},
+        "issue { id }",
+    )
+
+
+def build_sync_snapshot(
+    title: str,
+    body: str,
+    labels: List[str],
+    milestone_num: Optional[int],
+    task_data: Dict,
+) -> Dict:
+    """Fields the sync writes for a task, as recorded in the sync state after each sync."""
+    blocked_by_text, _ = build_blocked_by_text(task_data)
+    return {
+        "title": title,
+        "body_hash": hashlib.sha256(body.encode("utf-8")).hexdigest()[:16],
+        "labels": sorted(labels),
+        "milestone": milestone_num,
+        "iteration": task_data.get("iteration", ""),
+        "blocked_by": blocked_by_text,
+    }
+
+
+def compute_content_hash(snapshot: Dict, task_data: Dict) -> str:
+    """
+    Fingerprint of a task's synced state.
+    
+    Combines the rendered snapshot with the agent_notes content/planning hashes
+    from planning/issues/*.yaml, so any planning change shows up as a new hash.
+    """
+    payload = {**snapshot, "planning_hashes": task_data.get("planning_hashes", [])}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def clear_field_op(alias: str, project_item_id: str, field_id: str) -> Dict:
+    """Aliased clearProjectV2ItemFieldValue operation."""
+    return mutation_op(
+        alias,
+        "clearProjectV2ItemFieldValue",
+        "ClearProjectV2ItemFieldValueInput",
+        {"projectId": PROJECT_ID, "itemId": project_item_id, "fieldId": field_id},
+        "projectV2Item { id }",
+    )
+
+
+def plan_issue_update(
+    record: Dict,
+    title: str,
+    body: str,
+    milestone_num: Optional[int],
+    snapshot: Dict,
+) -> Dict:
+    """
+    Deltas between the last synced snapshot of an issue and the planning data.
+    
+    Returns:
+        Dict with "patch" (REST fields), "added_labels", "removed_labels"
+        and "field_ops" (aliased project field mutations)
+    """
+    previous = json.loads(record.get("snapshot") or "{}")
+    
+    patch = {}
+    if snapshot["title"] != previous.get("title"):
+        patch["title"] = title
+    if snapshot["body_hash"] != previous.get("body_hash"):
+        patch["body"] = body
+    if snapshot["milestone"] != previous.get("milestone"):
+        patch["milestone"] = milestone_num
+    
+    field_ops = []
+    project_item_id = record.get("project_item_id")
+    if project_item_id and snapshot["iteration"] != previous.get("iteration"):
+        iteration_id = ITERATION_MAP.get(snapshot["iteration"])
+        field_ops.append(
+            field_value_op("iteration", project_item_id, FIELD_ITERATION, {"iterationId": iteration_id})
+            if iteration_id else clear_field_op("iteration", project_item_id, FIELD_ITERATION)
+        )
+    if project_item_id and snapshot["blocked_by"] != previous.get("blocked_by"):
+        field_ops.append(
+            field_value_op("blocked_by", project_item_id, FIELD_BLOCKED_BY, {"text": snapshot["blocked_by"]})
+            if snapshot["blocked_by"] else clear_field_op("blocked_by", project_item_id, FIELD_BLOCKED_BY)
+        )
+    
+    return {
+        "patch": patch,
+        "added_labels": sorted(set(snapshot["labels"]) - set(previous.get("labels", []))),
+        "removed_labels": sorted(set(previous.get("labels", [])) - set(snapshot["labels"])),
+        "field_ops": field_ops,
+    }
+
+
+@instrumented("update_github_issue")
+def update_github_issue(
+    task_key: str,
+    record: Dict,
+    title: str,
+    body: str,
+    labels: List[str],
+    milestone_num: Optional[int],
+    snapshot: Dict,
+) -> bool:
+    """
+    Push only what changed since the last sync of an existing issue.
+    
+    - title/body/milestone: one REST PATCH
+    - labels: add missing in one call, remove stale ones individually
+      (labels added by hand are left alone)
+    - iteration and "Blocked By" project fields: one aliased mutation
+    
+    Returns True when every delta was applied.
+    """
+    issue_number = record["issue_number"]
+    issue_path = f"/repos/{REPO_OWNER}/{REPO_NAME}/issues/{issue_number}"
+    update = plan_issue_update(record, title, body, milestone_num, snapshot)
+    patch = update["patch"]
+    added_labels = update["added_labels"]
+    removed_labels = update["removed_labels"]
+    field_ops = update["field_ops"]
+    
+    changes = list(patch)
+    changes += [f"+{label}" for label in added_labels] + [f"-{label}" for label in removed_labels]
+    changes += [op["alias"] for op in field_ops]
+    if not changes:
+        return True
+    
+    print(f"   🔄 Updating {task_key} (#{issue_number}): {', '.join(changes)}...", end=" ", flush=True)
+    failed = []
+    
+    if patch and not rest_call(issue_path, "PATCH", patch).ok:
+        failed.extend(patch)
+    
+    if added_labels and not rest_call(f"{issue_path}/labels", "POST", {"labels": added_labels}).ok:
+        failed.extend(f"+{label}" for label in added_labels)
+    
+    for label in removed_labels:
+        response = rest_call(f"{issue_path}/labels/{quote(label, safe='')}", "DELETE")
+        # 404: label already gone
+        if not response.ok and response.status != 404:
+            failed.append(f"-{label}")
+    
+    for alias, ok in apply_project_updates(field_ops).items():
+        if not ok:
+            failed.append(alias)
+    
+    print(f"❌ Failed: {', '.join(failed)}" if failed else "✅")
+    return not failed
+
+
+def advance(task_key: str, record: Dict, step: str, **fields) -> Dict:
+    """Persist a completed provisioning step (if a state store is open) and return the updated record."""
+    record = {**record, **{k: v for k, v in fields.items() if v is not None}, "step": step}
+    if sync_state is not None:
+        sync_state.save(task_key, step, **{k: v for k, v in fields.items() if v is not None})
+    return record
+
+
+REMOTE_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, states: [OPEN, CLOSED], orderBy: {field: CREATED_AT, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id
+        number
+        title
+        body
+        issueType { id }
+        milestone { number }
+        labels(first: 50) { nodes { name } }
+        parent { id }
+        blockedBy(first: 50) { nodes { id } }
+        projectItems(first: 10) {
+          nodes {
+            id
+            project { id }
+            fieldValues(first: 20) {
+              nodes {
+                ... on ProjectV2ItemFieldSingleSelectValue { optionId field { ... on ProjectV2FieldCommon { id } } }
+                ... on ProjectV2ItemFieldIterationValue { iterationId field { ... on ProjectV2FieldCommon { id } } }
+                ... on ProjectV2ItemFieldTextValue { text field { ... on ProjectV2FieldCommon { id } } }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+  rateLimit { cost limit remaining resetAt }
+}
+"""
+
+
+@instrumented("prefetch_remote_index")
+def prefetch_remote_index() -> Dict[str, Dict]:
+    """
+    Page through every repository issue (100 per query) with its project item
+    and field values, and index them by the task key in the title ("T24: ...").
+    
+    Fills remote_index and remote_relationships; returns remote_index.
+    """
+    issues = []
+    cursor = None
+    pages = 0
+    while True:
+        result = run_graphql(REMOTE_ISSUES_QUERY, variables={"owner": REPO_OWNER, "name": REPO_NAME, "cursor": cursor})
+        connection = ((result.get("data") or {}).get("repository") or {}).get("issues")
+        if not connection:
+            print("   ⚠️  Prefetch failed, falling back to per-issue lookups")
+            break
+        pages += 1
+        issues.extend(connection["nodes"])
+        if not connection["pageInfo"]["hasNextPage"]:
+            break
+        cursor = connection["pageInfo"]["endCursor"]
+    
+    keys_by_node_id = {}
+    for issue in issues:
+        match = TASK_KEY_PATTERN.match(issue["title"])
+        if not match:
+            continue
+        task_key = match.group(1)
+        if task_key in remote_index:
+            # Oldest issue wins - later ones are accidental duplicates
+            print(f"   ⚠️  Duplicate issues for {task_key}: #{remote_index[task_key]['number']} and #{issue['number']}")
+            continue
+        
+        item = next(
+            (node for node in issue["projectItems"]["nodes"] if (node.get("project") or {}).get("id") == PROJECT_ID),
+            None,
+        )
+        fields = {}
+        for value in (item or {}).get("fieldValues", {}).get("nodes", []):
+            field_id = (value.get("field") or {}).get("id")
+            if field_id:
+                fields[field_id] = value.get("optionId") or value.get("iterationId") or value.get("text")
+        
+        remote_index[task_key] = {
+            "number": issue["number"],
+            "node_id": issue["id"],
+            "title": issue["title"],
+            "body": issue.get("body") or "",
+            "issue_type_id": (issue.get("issueType") or {}).get("id"),
+            "milestone": (issue.get("milestone") or {}).get("number"),
+            "labels": [label["name"] for label in issue["labels"]["nodes"]],
+            "parent_node_id": (issue.get("parent") or {}).get("id"),
+            "blocked_by_node_ids": [node["id"] for node in (issue.get("blockedBy") or {}).get("nodes", [])],
+            "project_item_id": item["id"] if item else None,
+            "fields": fields,
+        }
+        keys_by_node_id[issue["id"]] = task_key
+    
+    # Relationships that already exist on GitHub, as (kind, task, target) edges
+    for task_key, remote in remote_index.items():
+        for node_id in remote["blocked_by_node_ids"]:
+            if node_id in keys_by_node_id:
+                remote_relationships.add(("blocked_by", task_key, keys_by_node_id[node_id]))
+        if remote["parent_node_id"] in keys_by_node_id:
+            remote_relationships.add(("parent", task_key, keys_by_node_id[remote["parent_node_id"]]))
+    
+    in_project = sum(1 for remote in remote_index.values() if remote["project_item_id"])
+    print(f"🔎 Prefetched {len(issues)} issue(s) in {pages} quer{'y' if pages == 1 else 'ies'}: "
+          f"{len(remote_index)} planning task(s), {in_project} in project")
+    return remote_index
+
+
+def remote_record(remote: Dict) -> Dict:
+    """
+    Sync record (step, IDs, snapshot) for a prefetched issue that has no state yet.
+    
+    The step is derived from what the issue already has: project membership,
+    the Feature type and a Status value.
+    """
+    fields = remote["fields"]
+    if not remote["project_item_id"]:
+        step = STEP_CREATED
+    elif remote["issue_type_id"] != GITHUB_ISSUE_TYPE_FEATURE:
+        step = STEP_IN_PROJECT
+    elif fields.get(FIELD_STATUS):
+        step = STEP_DONE
+    else:
+        step = STEP_TYPED
+    
+    iteration_keys = {iteration_id: key for key, iteration_id in ITERATION_MAP.items()}
+    snapshot = {
+        "title": remote["title"],
+        "body_hash": hashlib.sha256(remote["body"].encode("utf-8")).hexdigest()[:16],
+        "labels": sorted(remote["labels"]),
+        "milestone": remote["milestone"],
+        "iteration": iteration_keys.get(fields.get(FIELD_ITERATION), ""),
+        "blocked_by": fields.get(FIELD_BLOCKED_BY) or "",
+    }
+    return {
+        "step": step,
+        "issue_number": remote["number"],
+        "node_id": remote["node_id"],
+        "project_item_id": remote["project_item_id"],
+        "snapshot": json.dumps(snapshot, sort_keys=True),
+    }
+
+
+def adopt_remote_issue(task_key: str, remote: Dict, record: Optional[Dict]) -> Dict:
+    """
+    Turn a prefetched issue into a sync record so it is resumed or diffed, never re-created.
+    
+    The snapshot reflects what is on GitHub now, so incremental sync pushes
+    exactly the fields that differ from the planning data.
+    """
+    if record:
+        # Known from an earlier run - only fill in IDs the record is missing
+        missing = {
+            "node_id": remote["node_id"] if not record.get("node_id") else None,
+            "project_item_id": remote["project_item_id"] if not record.get("project_item_id") else None,
+        }
+        if not any(missing.values()):
+            return record
+        return advance(task_key, record, record["step"], **missing)
+    
+    adopted = remote_record(remote)
+    step = adopted.pop("step")
+    print(f"   🔎 {task_key} already exists as #{remote['number']} (adopted, step '{step}')")
+    return advance(task_key, {}, step, **adopted)
+
+
+def known_relationships() -> set:
+    """Relationship edges already set on GitHub (sync state plus prefetched issues)."""
+    linked = sync_state.linked_relationships() if sync_state is not None else set()
+    return linked | remote_relationships
+
+
+def create_github_issue(
+    task_key: str,
+    task_data: Dict,
+    milestone_key: str,
+    spec_file: Optional[Path] = None,
+    provision_mode: str = "graphql",
+    link_parent: bool = True,
+    incremental: bool = False,
+) -> Optional[int]:
+    """
+    Create a GitHub issue with full project integration.
+    
+    provision_mode:
+        "graphql" - createIssue (type + project in one call), then one aliased
+                    mutation for all project fields and the parent link (2 calls)
+        "rest"    - one call per step (REST create, node ID lookup, project, type, fields)
+    
+    link_parent: Set the PARENT_MAPPING sub-issue link now (False when the
+    batched relationship phase links parents after all issues exist).
+    
+    With a sync state store open, finished tasks are skipped and partially
+    provisioned ones resume after the last completed step. With `incremental`,
+    finished tasks whose content hash changed get only the changed fields
+    pushed (unchanged tasks make no API calls).
+    """
+    title, body, labels = build_issue_content(task_key, task_data, spec_file)
+    
     # Get milestone number
     milestone_num = get_milestone_number(milestone_key)
+    snapshot = build_sync_snapshot(title, body, labels, milestone_num, task_data)
+    sync_fields = {
+        "content_hash": compute_content_hash(snapshot, task_data),
+        "snapshot": json.dumps(snapshot, sort_keys=True),
+    }
     
-    # Create issue via REST API
-    print(f"   Creating {task_key}...", end=" ", flush=True)
-    issue_number = create_issue_rest(title, body, labels, milestone_num)
+    record = sync_state.get(task_key) if sync_state is not None else None
+    if task_key in remote_index:
+        record = adopt_remote_issue(task_key, remote_index[task_key], record)
+    if record and record["step"] == STEP_DONE:
+        record_created_issue(task_key, record["issue_number"], record["node_id"])
+        if record.get("content_hash") == sync_fields["content_hash"]:
+            print(f"   ⏭️  {task_key} already synced as #{record['issue_number']}")
+        elif not incremental:
+            print(f"   ⏭️  {task_key} already synced as #{record['issue_number']} "
+                  f"(planning changed - run with --incremental to update)")
+        elif update_github_issue(task_key, record, title, body, labels, milestone_num, snapshot):
+            advance(task_key, record, STEP_DONE, **sync_fields)
+        return record["issue_number"]
+    if record:
+        print(f"   ↩️  Resuming {task_key} (#{record['issue_number']}) after step '{record['step']}'")
+    
+    if provision_mode == "graphql":
+        issue_number = provision_issue_graphql(
+            task_key, task_data, title, body, labels, milestone_num, sync_fields, record, link_parent
+        )
+    else:
+        issue_number = provision_issue_rest(
+            task_key, task_data, title, body, labels, milestone_num, sync_fields, record, link_parent
+        )
     
-    if not issue_number:
-        print("❌ Failed")
-        return None
+    return issue_number
+
+
+@instrumented("provision_issue_graphql")
+def provision_issue_graphql(
+    task_key: str,
+    task_data: Dict,
+    title: str,
+    body: str,
+    labels: List[str],
+    milestone_num: Optional[int],
+    sync_fields: Dict,
+    record: Optional[Dict] = None,
+    link_parent: bool = True,
+) -> Optional[int]:
+    """Create issue and set all project fields in two GraphQL round trips."""
+    if record:
+        needs_type = not step_reached(record, STEP_TYPED)
+    else:
+        print(f"   Creating {task_key}...", end=" ", flush=True)
+        created = create_issue_graphql(title, body, labels, milestone_num, GITHUB_ISSUE_TYPE_FEATURE)
+        if not created:
+            print("❌ Failed")
+            return None
+        
+        print(f"✅ Issue #{created['number']} (type: Feature)")
+        # createIssue also set the type and, when an item came back, project membership
+        record = advance(
+            task_key, {}, STEP_TYPED if created["project_item_id"] else STEP_CREATED,
+            issue_number=created["number"],
+            node_id=created["node_id"],
+            project_item_id=created["project_item_id"],
+            **sync_fields,
+        )
+        needs_type = False
+    
+    issue_number = record["issue_number"]
+    issue_node_id = record.get("node_id") or get_issue_node_id(issue_number)
+    if not issue_node_id:
+        print("   ⚠️ Could not get node ID, skipping project assignment")
+        return issue_number
+    
+    project_item_id = record.get("project_item_id")
+    if not project_item_id:
+        # Project membership not returned by createIssue - fall back to explicit add
+        print(f"   Adding to project...", end=" ", flush=True)
+        project_item_id = add_issue_to_project(issue_node_id)
+        print("✅" if project_item_id else "❌ Failed")
+        if project_item_id:
+            record = advance(task_key, record, STEP_IN_PROJECT, node_id=issue_node_id, project_item_id=project_item_id)
+    
+    # All field updates + parent link in one aliased mutation
+    operations = []
+    labels_by_alias = {}
+    if needs_type:
+        operations.append(mutation_op(
+            "issue_type", "updateIssue", "UpdateIssueInput",
+            {"id": issue_node_id, "issueTypeId": GITHUB_ISSUE_TYPE_FEATURE}, "issue { id }",
+        ))
+        labels_by_alias["issue_type"] = "type Feature"
+    
+    if project_item_id:
+        operations.append(field_value_op("status", project_item_id, FIELD_STATUS, {"singleSelectOptionId": STATUS_TODO_ID}))
+        labels_by_alias["status"] = "status Todo"
+        
+        iteration_key = task_data.get("iteration", "")
+        if iteration_key and iteration_key in ITERATION_MAP:
+            operations.append(field_value_op(
+                "iteration", project_item_id, FIELD_ITERATION, {"iterationId": ITERATION_MAP[iteration_key]}
+            ))
+            labels_by_alias["iteration"] = ITERATION_NAMES.get(iteration_key, iteration_key)
+        
+        blocked_by_text, missing_deps = build_blocked_by_text(task_data)
+        if blocked_by_text:
+            operations.append(field_value_op("blocked_by", project_item_id, FIELD_BLOCKED_BY, {"text": blocked_by_text}))
+            labels_by_alias["blocked_by"] = f"blocked by {blocked_by_text}"
+        if missing_deps:
+            print(f"   ⚠️  Missing dependencies (not yet created): {', '.join(missing_deps)}")
+    
+    parent_key = PARENT_MAPPING.get(task_key) if link_parent else None
+    if parent_key and parent_key in created_issues_node_ids:
+        operations.append(sub_issue_op("parent", created_issues_node_ids[parent_key], issue_node_id))
+        labels_by_alias["parent"] = f"parent #{created_issues_cache[parent_key]} ({parent_key})"
+    elif parent_key:
+        print(f"   ⚠️  Parent {parent_key} not yet created, skipping parent link")
+    
+    failed = []
+    if operations:
+        print(f"   Setting {', '.join(labels_by_alias.values())}...", end=" ", flush=True)
+        results = apply_project_updates(operations)
+        failed = [labels_by_alias[alias] for alias, ok in results.items() if not ok]
+        print(f"❌ Failed: {', '.join(failed)}" if failed else "✅")
     
-    print(f"✅ Issue #{issue_number}")
+    # Only a fully provisioned issue is marked done - failures are retried on the next run
+    if project_item_id and not failed:
+        advance(task_key, record, STEP_DONE, node_id=issue_node_id)
+        if parent_key and "parent" in labels_by_alias and sync_state is not None:
+            sync_state.record_relationships([("parent", task_key, parent_key)])
+    
+    # Cache issue number and node ID for future references
+    record_created_issue(task_key, issue_number, issue_node_id)
+    
+    return issue_number
+
+
+@instrumented("provision_issue_rest")
+def provision_issue_rest(
+    task_key: str,
+    task_data: Dict,
+    title: str,
+    body: str,
+    labels: List[str],
+    milestone_num: Optional[int],
+    sync_fields: Dict,
+    record: Optional[Dict] = None,
+    link_parent: bool = True,
+) -> Optional[int]:
+    """Create issue via REST, then set type and project fields one call at a time."""
+    if not record:
+        # Create issue via REST API
+        print(f"   Creating {task_key}...", end=" ", flush=True)
+        issue_number = create_issue_rest(title, body, labels, milestone_num)
+        
+        if not issue_number:
+            print("❌ Failed")
+            return None
+        
+        print(f"✅ Issue #{issue_number}")
+        record = advance(task_key, {}, STEP_CREATED, issue_number=issue_number, **sync_fields)
+    
+    issue_number = record["issue_number"]
     
     # Get issue node ID for GraphQL
-    issue_node_id = get_issue_node_id(issue_number)
+    issue_node_id = record.get("node_id") or get_issue_node_id(issue_number)
     if not issue_node_id:
         print("   ⚠️ Could not get node ID, skipping project assignment")
         return issue_number
     
     # Add to project
-    print(f"   Adding to project...", end=" ", flush=True)
-    project_item_id = add_issue_to_project(issue_node_id)
+    project_item_id = record.get("project_item_id")
     if not project_item_id:
-        print("❌ Failed")
-        return issue_number
+        print(f"   Adding to project...", end=" ", flush=True)
+        project_item_id = add_issue_to_project(issue_node_id)
+        if not project_item_id:
+            print("❌ Failed")
+            advance(task_key, record, record["step"], node_id=issue_node_id)
+            return issue_number
+        
+        print("✅")
+        record = advance(task_key, record, STEP_IN_PROJECT, node_id=issue_node_id, project_item_id=project_item_id)
     
-    print("✅")
+    all_ok = True
     
     # Set GitHub Issue Type to "Feature" (native GitHub feature)
-    print(f"   Setting issue type to Feature...", end=" ", flush=True)
-    if set_issue_type(issue_node_id, GITHUB_ISSUE_TYPE_FEATURE):
-        print("✅")
-    else:
-        print("❌")
+    if not step_reached(record, STEP_TYPED):
+        print(f"   Setting issue type to Feature...", end=" ", flush=True)
+        if set_issue_type(issue_node_id, GITHUB_ISSUE_TYPE_FEATURE):
+            print("✅")
+            record = advance(task_key, record, STEP_TYPED)
+        else:
+            print("❌")
+            all_ok = False
     
     # Set status to "Todo"
     print(f"   Setting status to Todo...", end=" ", flush=True)
@@ -571,89 +1483,466 @@ def create_github_issue(
         print("✅")
     else:
         print("❌")
+        all_ok = False
     
     # Set Iteration (I1-I7) if specified
     iteration_key = task_data.get("iteration", "")
     if iteration_key and iteration_key in ITERATION_MAP:
         iteration_id = ITERATION_MAP[iteration_key]
-        iteration_name = {
-            "I1": "I1 - Infrastructure",
-            "I2": "I2 - Backend Core", 
-            "I3": "I3 - ML Foundation",
-            "I4": "I4 - Generation Pipeline",
-            "I5": "I5 - Dashboard & Assembly",
-            "I6": "I6 - Commerce & Distribution",
-            "I7": "I7 - Launch & Release",
-        }.get(iteration_key, iteration_key)
+        iteration_name = ITERATION_NAMES.get(iteration_key, iteration_key)
         print(f"   Setting iteration to {iteration_name}...", end=" ", flush=True)
         if set_project_iteration_field(project_item_id, FIELD_ITERATION, iteration_id):
             print("✅")
         else:
             print("❌")
+            all_ok = False
     
     # Set "Blocked By" field if dependencies exist in cache
-    dependencies = task_data.get("dependencies", [])
-    if dependencies and project_item_id:
-        # Build blocked by text (e.g., "#36 (T24)")
-        blocked_by_items = []
-        missing_deps = []
-        for dep in dependencies:
-            if dep in created_issues_cache:
-                issue_num = created_issues_cache[dep]
-                blocked_by_items.append(f"#{issue_num}")
-            else:
-                missing_deps.append(dep)
-        
-        if blocked_by_items:
-            blocked_by_text = ", ".join(blocked_by_items)
-            print(f"   Setting blocked by: {blocked_by_text}...", end=" ", flush=True)
-            if set_project_text_field(project_item_id, FIELD_BLOCKED_BY, blocked_by_text):
-                print("✅")
-            else:
-                print("❌")
-        
-        if missing_deps:
-            print(f"   ⚠️  Missing dependencies (not yet created): {', '.join(missing_deps)}")
+    blocked_by_text, missing_deps = build_blocked_by_text(task_data)
+    if blocked_by_text:
+        print(f"   Setting blocked by: {blocked_by_text}...", end=" ", flush=True)
+        if set_project_text_field(project_item_id, FIELD_BLOCKED_BY, blocked_by_text):
+            print("✅")
+        else:
+            print("❌")
+            all_ok = False
+    
+    if missing_deps:
+        print(f"   ⚠️  Missing dependencies (not yet created): {', '.join(missing_deps)}")
     
     # Cache issue number and node ID for future references
-    created_issues_cache[task_key] = issue_number
-    created_issues_node_ids[task_key] = issue_node_id
+    record_created_issue(task_key, issue_number, issue_node_id)
     
     # Set parent issue if defined in PARENT_MAPPING
-    parent_key = PARENT_MAPPING.get(task_key)
+    parent_key = PARENT_MAPPING.get(task_key) if link_parent else None
     if parent_key and parent_key in created_issues_node_ids:
         parent_node_id = created_issues_node_ids[parent_key]
         parent_issue_num = created_issues_cache[parent_key]
         print(f"   Setting parent to #{parent_issue_num} ({parent_key})...", end=" ", flush=True)
-        if set_parent_issue(issue_node_id, parent_node_id):
+        if set_parent_issue(parent_node_id, issue_node_id):
             print("✅")
+            if sync_state is not None:
+                sync_state.record_relationships([("parent", task_key, parent_key)])
         else:
             print("❌")
+            all_ok = False
     elif parent_key and parent_key not in created_issues_node_ids:
         print(f"   ⚠️  Parent {parent_key} not yet created, skipping parent link")
     
-    # Small delay to avoid rate limits
-    time.sleep(0.5)
+    # Only a fully provisioned issue is marked done - failures are retried on the next run
+    if all_ok and step_reached(record, STEP_TYPED):
+        advance(task_key, record, STEP_DONE)
     
     return issue_number
 
 
+@instrumented("link_relationships_sequential")
+def link_relationships_sequential(filtered_tasks: List[tuple]) -> int:
+    """Set blocking relationships one addBlockedBy call per dependency edge."""
+    relationships_count = 0
+    linked = known_relationships()
+    
+    for task_key, task_data in filtered_tasks:
+        dependencies = task_data.get("dependencies", [])
+        if not dependencies:
+            continue
+        
+        # Get this issue's node ID
+        blocked_issue_node_id = created_issues_node_ids.get(task_key)
+        if not blocked_issue_node_id:
+            continue
+        
+        blocked_issue_num = created_issues_cache.get(task_key)
+        
+        # Set blocking relationship for each dependency
+        for dep_key in dependencies:
+            blocking_issue_node_id = created_issues_node_ids.get(dep_key)
+            blocking_issue_num = created_issues_cache.get(dep_key)
+            
+            if ("blocked_by", task_key, dep_key) in linked:
+                continue
+            
+            if blocking_issue_node_id and blocking_issue_num:
+                print(f"   #{blocked_issue_num} ({task_key}) blocked by #{blocking_issue_num} ({dep_key})...", end=" ", flush=True)
+                if link_issue_dependency(blocked_issue_node_id, blocking_issue_node_id):
+                    print("✅")
+                    relationships_count += 1
+                    if sync_state is not None:
+                        sync_state.record_relationships([("blocked_by", task_key, dep_key)])
+                else:
+                    print("❌")
+    
+    return relationships_count
+
+
+def build_relationship_operations(
+    filtered_tasks: List[tuple],
+    linked: Optional[set] = None,
+) -> Tuple[List[Dict], Dict[str, str], Dict[str, Tuple[str, str, str]]]:
+    """
+    Collect addBlockedBy (dependsOn) and addSubIssue (PARENT_MAPPING) operations
+    for every created issue, skipping (kind, task, target) edges in `linked`.
+    
+    Returns:
+        (operations, alias -> human-readable description, alias -> (kind, task, target))
+    """
+    linked = linked or set()
+    operations = []
+    descriptions = {}
+    edges = {}
+    
+    for task_key, task_data in filtered_tasks:
+        blocked_issue_node_id = created_issues_node_ids.get(task_key)
+        if not blocked_issue_node_id:
+            continue
+        blocked_issue_num = created_issues_cache.get(task_key)
+        
+        for dep_key in task_data.get("dependencies", []):
+            blocking_issue_node_id = created_issues_node_ids.get(dep_key)
+            if not blocking_issue_node_id or ("blocked_by", task_key, dep_key) in linked:
+                continue
+            alias = f"blocked_{len(operations)}"
+            operations.append(mutation_op(
+                alias,
+                "addBlockedBy",
+                "AddBlockedByInput",
+                {"issueId": blocked_issue_node_id, "blockingIssueId": blocking_issue_node_id},
+                "issue { id }",
+            ))
+            descriptions[alias] = (
+                f"#{blocked_issue_num} ({task_key}) blocked by #{created_issues_cache.get(dep_key)} ({dep_key})"
+            )
+            edges[alias] = ("blocked_by", task_key, dep_key)
+        
+        parent_key = PARENT_MAPPING.get(task_key)
+        if parent_key and parent_key in created_issues_node_ids and ("parent", task_key, parent_key) not in linked:
+            alias = f"parent_{len(operations)}"
+            operations.append(sub_issue_op(alias, created_issues_node_ids[parent_key], blocked_issue_node_id))
+            descriptions[alias] = (
+                f"#{blocked_issue_num} ({task_key}) sub-issue of #{created_issues_cache[parent_key]} ({parent_key})"
+            )
+            edges[alias] = ("parent", task_key, parent_key)
+    
+    return operations, descriptions, edges
+
+
+@instrumented("link_relationships_batched")
+def link_relationships_batched(filtered_tasks: List[tuple], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Set blocking and parent relationships via chunked aliased mutations."""
+    linked = known_relationships()
+    operations, descriptions, edges = build_relationship_operations(filtered_tasks, linked)
+    if not operations:
+        return 0
+    
+    chunk_number = 0
+    
+    def report_chunk(chunk: List[Dict], results: Dict[str, bool]) -> None:
+        nonlocal chunk_number
+        chunk_number += 1
+        succeeded = sum(results.values())
+        status = "✅" if succeeded == len(chunk) else "⚠️ "
+        print(f"   {status} Chunk {chunk_number}: {succeeded}/{len(chunk)} relationships set")
+        for alias, ok in results.items():
+            if not ok:
+                print(f"      ❌ {descriptions[alias]}")
+        if sync_state is not None:
+            sync_state.record_relationships(edges[alias] for alias, ok in results.items() if ok)
+    
+    results = run_aliased_batches(
+        operations,
+        lambda document, variables: run_graphql(document, variables=variables),
+        chunk_size=chunk_size,
+        on_chunk=report_chunk,
+    )
+    return sum(results.values())
+
+
 def find_spec_file(task_key: str, milestone: str) -> Optional[Path]:
-    """Find detailed spec file for a task."""
-    milestone_dir = milestone.lower().replace(" ", "-").split("-")[0]  # M0, M1, etc.
+    """Find detailed spec file for a task (prefers the milestone's docs directory)."""
+    return load_docs_index(DOCS_DIR).find(task_key, milestone)
+
+
+def planned_record(task_key: str) -> Optional[Dict]:
+    """Sync record a task will start from (sync state merged with the prefetched issue), without saving it."""
+    record = sync_state.get(task_key) if sync_state is not None else None
+    remote = remote_index.get(task_key)
+    if remote is None:
+        return record
+    if record is None:
+        return remote_record(remote)
+    return {
+        **record,
+        "node_id": record.get("node_id") or remote["node_id"],
+        "project_item_id": record.get("project_item_id") or remote["project_item_id"],
+    }
+
+
+def plan_sync_cost(
+    filtered_tasks: List[tuple],
+    provision_mode: str = "graphql",
+    link_mode: str = "batched",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    incremental: bool = False,
+) -> Tuple[Callable[[int], ApiCost], Dict[str, int]]:
+    """
+    Count the API calls a sync of `filtered_tasks` (in dependency order) will
+    make, without calling the API.
     
-    # Try multiple patterns
-    patterns = [
-        f"{milestone_dir}*/{task_key.lower()}-*.md",
-        f"*/{task_key.lower()}-*.md",
-    ]
+    Mirrors create_github_issue() and the relationship phase, starting from the
+    sync state and the prefetched issues:
+    - new issues: label creation (GraphQL mode), create, project fields, parent link
+    - partially provisioned issues: only the missing steps
+    - synced issues: nothing, or the changed fields with `incremental`
+    - dependency/parent edges not yet linked, chunked like run_aliased_batches()
+    - the Copilot assignment when the run creates issues
+    
+    Returns:
+        (cost_of_prefix, summary) - cost_of_prefix(k) is the cost of syncing the
+        first k tasks; summary counts tasks per action and relationship links
+    """
+    repo_labels = set(get_repository_ids().get("labels", {}))
+    linked = known_relationships()
+    available = set(created_issues_node_ids)
+    positions = {task_key: position for position, (task_key, _) in enumerate(filtered_tasks)}
+    task_costs = []
+    link_counts = [0] * len(filtered_tasks)
+    first_new = None
+    summary = {"create": 0, "resume": 0, "update": 0, "unchanged": 0, "relationships": 0}
+    
+    for position, (task_key, task_data) in enumerate(filtered_tasks):
+        record = planned_record(task_key)
+        dependencies = task_data.get("dependencies", [])
+        cost = ApiCost()
+        
+        if record and record["step"] == STEP_DONE:
+            spec_file = find_spec_file(task_key, task_data.get("milestone", ""))
+            title, body, labels = build_issue_content(task_key, task_data, spec_file)
+            milestone_num = get_milestone_number(task_data.get("milestone", ""))
+            snapshot = build_sync_snapshot(title, body, labels, milestone_num, task_data)
+            # Dependencies created by this run change the "Blocked By" text
+            new_blockers = any(dep in available and dep not in created_issues_cache for dep in dependencies)
+            changed = new_blockers or record.get("content_hash") != compute_content_hash(snapshot, task_data)
+            if changed and incremental:
+                update = plan_issue_update(record, title, body, milestone_num, snapshot)
+                field_count = len(update["field_ops"])
+                if new_blockers and record.get("project_item_id") and not any(
+                    op["alias"] == "blocked_by" for op in update["field_ops"]
+                ):
+                    field_count += 1
+                cost += rest_cost(writes=bool(update["patch"]) + bool(update["added_labels"]) + len(update["removed_labels"]))
+                if field_count:
+                    cost += mutation_cost(field_count)
+            summary["update" if cost else "unchanged"] += 1
+        else:
+            summary["create" if record is None else "resume"] += 1
+            first_new = position if first_new is None else first_new
+            
+            if record is None and provision_mode == "graphql":
+                _, _, labels = build_issue_content(task_key, task_data, None)
+                missing_labels = set(labels) - repo_labels
+                repo_labels |= missing_labels
+                cost += rest_cost(writes=len(missing_labels)) + mutation_cost()
+                typed = True
+            elif record is None:
+                # REST create, node ID lookup, add to project
+                cost += rest_cost(writes=1, reads=1) + mutation_cost()
+                typed = False
+            else:
+                cost += rest_cost(reads=0 if record.get("node_id") else 1)
+                if not record.get("project_item_id"):
+                    cost += mutation_cost()
+                typed = step_reached(record, STEP_TYPED)
+            
+            parent_key = PARENT_MAPPING.get(task_key) if link_mode == "sequential" else None
+            field_count = (
+                (0 if typed else 1)
+                + 1  # status
+                + (1 if task_data.get("iteration", "") in ITERATION_MAP else 0)
+                + (1 if any(dep in available for dep in dependencies) else 0)
+                + (1 if parent_key and parent_key in available else 0)
+            )
+            if provision_mode == "graphql":
+                cost += mutation_cost(field_count)
+            else:
+                cost += mutation_cost(field_count, documents=field_count)
+        
+        available.add(task_key)
+        
+        # Relationship edges become linkable once both ends exist
+        edges = sum(
+            1 for dep in dependencies
+            if dep in available and ("blocked_by", task_key, dep) not in linked
+        )
+        if link_mode == "sequential":
+            cost += mutation_cost(edges, documents=edges)
+        else:
+            link_counts[position] += edges
+            parent_key = PARENT_MAPPING.get(task_key)
+            if parent_key and ("parent", task_key, parent_key) not in linked:
+                if parent_key in available:
+                    link_counts[position] += 1
+                    edges += 1
+                elif positions.get(parent_key, -1) > position:
+                    link_counts[positions[parent_key]] += 1
+                    edges += 1
+        summary["relationships"] += edges
+        task_costs.append(cost)
+    
+    prefix_costs = [ApiCost()]
+    prefix_links = [0]
+    for cost, links in zip(task_costs, link_counts):
+        prefix_costs.append(prefix_costs[-1] + cost)
+        prefix_links.append(prefix_links[-1] + links)
+    
+    def cost_of_prefix(count: int) -> ApiCost:
+        cost = prefix_costs[count]
+        links = prefix_links[count]
+        if links:
+            cost += mutation_cost(links, documents=estimate_batch_count(links, chunk_size))
+        if first_new is not None and first_new < count:
+            # Copilot assignment: bot lookup + assign mutation
+            cost += query_cost() + mutation_cost()
+        return cost
+    
+    return cost_of_prefix, summary
+
+
+def sync_metadata(args) -> Optional[Dict[str, int]]:
+    """Reconcile repository milestones and labels with the planning files (milestone title -> number)."""
+    return reconcile_metadata(
+        REPO_OWNER, REPO_NAME, MILESTONES_PATH, LABELS_PATH,
+        prune=args.prune_milestones,
+        concurrency=args.concurrency,
+    )
+
+
+def sync_tasks(filtered_tasks: List[tuple], args) -> Tuple[Dict[str, Optional[int]], int]:
+    """
+    Create or update the issues for dependency-ordered tasks, then link their relationships.
+    
+    Returns:
+        (task key -> issue number, relationships linked)
+    """
+    # Create issues - each task starts once its dependencies have issue numbers/node IDs
+    print(f"\n🚀 Creating issues (concurrency: {args.concurrency})...\n")
+    
+    def create_task_issue(task_key: str, task_data: Dict) -> Optional[int]:
+        milestone = task_data.get("milestone", "")
+        spec_file = find_spec_file(task_key, milestone)
+        return create_github_issue(
+            task_key, task_data, milestone, spec_file,
+            provision_mode=args.provision,
+            link_parent=args.link_mode == "sequential",
+            incremental=args.incremental,
+        )
     
-    for pattern in patterns:
-        matches = list(DOCS_DIR.glob(pattern))
-        if matches:
-            return matches[0]
+    with phase("issue_creation"):
+        results = run_dependency_ordered(filtered_tasks, create_task_issue, max_workers=args.concurrency)
+    success_count = sum(1 for issue_number in results.values() if issue_number)
     
-    return None
+    print(f"\n✅ Complete: {success_count}/{len(filtered_tasks)} issues created")
+    
+    # Phase 2: Set blocking relationships (and parent links in batched mode)
+    print("\n🔗 Setting blocking relationships...\n")
+    with phase("relationship_linking"):
+        if args.link_mode == "batched":
+            relationships_count = link_relationships_batched(filtered_tasks, args.link_chunk_size)
+        else:
+            relationships_count = link_relationships_sequential(filtered_tasks)
+    record_count("relationships_linked", relationships_count)
+    
+    print(f"\n✅ Set {relationships_count} relationships")
+    return results, relationships_count
+
+
+def watch_planning(args, tasks: Dict[str, Dict], issue_files: Dict[Path, Dict[str, Dict]]) -> None:
+    """
+    Push planning edits to GitHub as they are saved, until Ctrl-C.
+    
+    Each debounced burst of changes re-parses only the changed files, diffs
+    them against the previously parsed version to find the affected tasks,
+    and syncs just those (incrementally - only fields that differ from the
+    sync state are pushed).
+    """
+    docs = dict(load_docs_index(DOCS_DIR).docs)
+    milestones = load_milestone_definitions()
+    watcher = create_watcher(PLANNING_DIR, polling=args.watch_poll, interval=args.poll_interval)
+    mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    print(f"\n👀 Watching {PLANNING_DIR} for changes ({mode}, {args.debounce:.1f}s debounce) - Ctrl-C to stop")
+    
+    try:
+        while True:
+            changed = wait_for_changes(watcher, args.debounce)
+            affected = set()
+            docs_changed = False
+            metadata_changed = False
+            
+            for path in sorted(changed):
+                if is_docs_path(PLANNING_DIR, path):
+                    docs_changed = True
+                    continue
+                name = path.relative_to(PLANNING_DIR).as_posix()
+                try:
+                    if path == EFFORT_MAP_PATH:
+                        if not path.exists():
+                            continue  # Mid-save (temp file + rename) - the rename comes next
+                        new_tasks = load_effort_map().get("estimates", {})
+                        affected |= {
+                            key for key in new_tasks.keys() | tasks.keys()
+                            if estimate_fields(new_tasks.get(key) or {}) != estimate_fields(tasks.get(key) or {})
+                        }
+                        tasks = new_tasks
+                    elif path.parent == ISSUES_DIR:
+                        previous = issue_files.pop(path, {})
+                        entries = parse_issue_file(path) if path.exists() else {}
+                        if path.exists():
+                            issue_files[path] = entries
+                        affected |= {
+                            key for key in previous.keys() | entries.keys() if previous.get(key) != entries.get(key)
+                        }
+                    elif path == MILESTONES_PATH:
+                        new_milestones = load_milestone_definitions()
+                        metadata_changed = metadata_changed or new_milestones != milestones
+                        # Only tasks of added/removed titles get a different milestone number
+                        retitled = new_milestones.keys() ^ milestones.keys()
+                        milestones = new_milestones
+                        affected |= {key for key, data in tasks.items() if data.get("milestone") in retitled}
+                    elif path == LABELS_PATH:
+                        metadata_changed = True
+                except (OSError, yaml.YAMLError) as e:
+                    print(f"   ⚠️  Skipping {name} until its next save: {' '.join(str(e).split())}")
+            
+            if metadata_changed:
+                print("\n📅 Reconciling milestones and labels...")
+                if sync_metadata(args) is not None:
+                    # New or renamed milestones/labels get new IDs in the project schema
+                    resolve_project_ids(refresh=True)
+            
+            if docs_changed:
+                index = load_docs_index(DOCS_DIR, refresh=True)
+                affected |= {key for key in index.docs.keys() | docs.keys() if index.docs.get(key) != docs.get(key)}
+                docs = dict(index.docs)
+            
+            issue_entries = merge_issue_entries(issue_files)
+            # Tasks waiting on a dependency that gets its issue now: their "Blocked By" text changes
+            affected |= {
+                key for key, entry in issue_entries.items()
+                if any(dep in affected and dep not in created_issues_cache for dep in entry["dependencies"])
+            }
+            batch = select_tasks(tasks, issue_entries, args, keys=affected)
+            names = ", ".join(sorted(path.relative_to(PLANNING_DIR).as_posix() for path in changed))
+            if not batch:
+                print(f"\n📝 Changed: {names} - no tasks affected")
+                continue
+            
+            print(f"\n📝 Changed: {names} - syncing {len(batch)} task(s)")
+            batch = topological_sort_tasks(batch, known_keys=set(tasks) | set(issue_entries))
+            sync_tasks(batch, args)
+            print("\n👀 Watching for changes...")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
 
 
 def main():
@@ -665,9 +1954,61 @@ def main():
     parser.add_argument("--milestone", type=str, help="Filter by milestone (e.g., M0)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be created")
     parser.add_argument("--update-relationships", action="store_true", help="Update relationships for existing issues")
+    parser.add_argument("--provision", choices=["graphql", "rest"], default="graphql",
+                        help="graphql: 2 calls per issue (createIssue + aliased field updates); rest: one call per step")
+    parser.add_argument("--link-mode", choices=["batched", "sequential"], default="batched",
+                        help="batched: chunked aliased addBlockedBy/addSubIssue mutations; sequential: one call per edge")
+    parser.add_argument("--link-chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Initial mutations per batched document (adapts to API limits)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Issues created in parallel (a task waits for its dependencies)")
+    parser.add_argument("--transport", choices=TRANSPORT_MODES, default=None,
+                        help="GitHub API transport: pooled HTTP session, gh CLI subprocesses, or auto-detect")
+    parser.add_argument("--state-file", type=Path, default=SYNC_STATE_PATH,
+                        help="SQLite sync state used to skip finished work and resume interrupted runs")
+    parser.add_argument("--no-state", action="store_true", help="Ignore and don't record sync state")
+    parser.add_argument("--refresh-schema", action="store_true",
+                        help="Refetch project field/option/milestone IDs instead of using the cached schema")
+    parser.add_argument("--no-prefetch", action="store_true",
+                        help="Skip the bulk lookup of existing issues/project items (dedupe relies on sync state only)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Update already-synced issues whose planning changed (only the changed fields)")
+    parser.add_argument("--plan-cost", action="store_true",
+                        help="Estimate REST/GraphQL calls against the remaining rate-limit budget, print the schedule and exit")
+    parser.add_argument("--ignore-budget", action="store_true",
+                        help="Skip the pre-flight budget check (may stop halfway when the hourly limit runs out)")
+    parser.add_argument("--metrics-json", type=Path,
+                        help="Write per-operation API metrics (latency, bytes, retries, GraphQL cost) as JSON")
+    parser.add_argument("--prometheus-file", type=Path,
+                        help="Write the API metrics as a Prometheus textfile (node_exporter textfile collector)")
+    parser.add_argument("--reconcile-metadata", action="store_true",
+                        help="Before syncing issues, create/update milestones and labels from planning/milestones.yaml and labels.yaml (skipped with --plan-cost)")
+    parser.add_argument("--prune-milestones", action="store_true",
+                        help="With --reconcile-metadata/--watch: close open milestones milestones.yaml no longer lists")
+    parser.add_argument("--watch", action="store_true",
+                        help="After syncing, keep watching planning files and push each edit's affected tasks")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE_SECONDS,
+                        help="Watch mode: seconds of quiet before a burst of edits is synced")
+    parser.add_argument("--watch-poll", action="store_true", help="Watch mode: poll file mtimes instead of inotify")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help="Watch mode: seconds between polls (with --watch-poll or without inotify)")
+    parser.add_argument("--yes", action="store_true", help="Don't ask for confirmation")
     parser.add_argument("task_keys", nargs="*", help="Specific task keys (e.g., T24 T25)")
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
+    start_profiling(args, "create-issues-api")
+    
+    if args.watch:
+        if args.dry_run or args.no_state:
+            print("❌ --watch needs the sync state to diff against (drop --dry-run/--no-state)")
+            return
+        args.incremental = True
+    
+    if args.transport:
+        configure_transport(args.transport)
+    if not args.dry_run:
+        report_at_exit(args.metrics_json, args.prometheus_file)
     
     # If updating relationships only
     if args.update_relationships:
@@ -677,60 +2018,39 @@ def main():
         print("\n✅ Tip: Dependencies are shown in issue body with links.")
         return
     
-    # Load task data
-    effort_map = load_effort_map()
-    tasks = effort_map.get("estimates", {})  # Changed from "tasks" to "estimates"
-    
-    # Extract AI effectiveness from reasoning field (contains "AI Impact: HIGH/MEDIUM/LOW")
-    def extract_ai_effectiveness(task_data: Dict) -> str:
-        """Extract AI effectiveness from reasoning field."""
-        reasoning = task_data.get("reasoning", "")
-        if "AI Impact: HIGH" in reasoning or "AI effectiveness: HIGH" in reasoning:
-            return "high"
-        elif "AI Impact: MEDIUM" in reasoning:
-            return "medium"
-        elif "AI Impact: LOW" in reasoning:
-            return "low"
-        return "unknown"
-    
-    # Load dependencies from planning/issues/*.yaml
-    dependencies_map = {}
-    for issue_file in (WORKSPACE_ROOT / "planning/issues").glob("*.yaml"):
-        with open(issue_file, "r", encoding="utf-8") as f:
-            milestone_data = yaml.safe_load(f)
-            for issue in milestone_data.get("issues", []):
-                task_key = issue.get("key")
-                if task_key:
-                    dependencies_map[task_key] = issue.get("dependsOn", [])
-    
-    # Filter tasks
-    filtered_tasks = []
-    for task_key, task_data in tasks.items():
-        # Extract AI effectiveness from reasoning
-        ai_effectiveness = extract_ai_effectiveness(task_data)
-        
-        # Skip if specific keys requested and not in list
-        if args.task_keys and task_key not in args.task_keys:
-            continue
+    # Load task data from the compiled planning store (rebuilt if the YAML changed)
+    with phase("yaml_load"):
+        store = open_store(PLANNING_DIR)
+        tasks = store.estimates()
         
-        # Skip if milestone filter and doesn't match
-        if args.milestone and not task_data.get("milestone", "").startswith(args.milestone):
-            continue
-        
-        # Skip if HIGH AI only and not HIGH
-        if args.ai_high_only and ai_effectiveness.lower() != "high":
-            continue
-        
-        # Merge AI data and dependencies into task_data
-        task_data["ai_effectiveness"] = ai_effectiveness
-        task_data["task"] = task_data.get("title", "")  # Map title -> task
-        task_data["dependencies"] = dependencies_map.get(task_key, [])
-        
-        filtered_tasks.append((task_key, task_data))
+        # Dependencies and agent content/planning hashes from planning/issues/*.yaml
+        issue_files = load_issue_files(store)
+    issue_entries = merge_issue_entries(issue_files)
+    
+    # Filter tasks (indexed query on key, milestone and AI effectiveness)
+    with phase("filter"):
+        matching = store.query(
+            keys=args.task_keys or None,
+            milestone_prefix=args.milestone,
+            ai_effectiveness="high" if args.ai_high_only else None,
+            estimated_only=True,
+            columns=["key"],
+        )
+        filtered_tasks = select_tasks(tasks, issue_entries, args, keys={row["key"] for row in matching})
+    store.close()
+    
+    # Refuse to sync tasks whose planning data would fail halfway (unchanged files come from the validation cache)
+    with phase("validate"):
+        if not check_planning(PLANNING_DIR, keys={task_key for task_key, _ in filtered_tasks}):
+            sys.exit(1)
     
     # Sort by dependencies (topological sort) - tasks without deps first
     print(f"📊 Sorting {len(filtered_tasks)} tasks by dependencies...")
-    filtered_tasks = topological_sort_tasks(filtered_tasks)
+    with phase("topological_sort"):
+        filtered_tasks = topological_sort_tasks(filtered_tasks, known_keys=set(tasks) | set(issue_entries))
+    record_count("tasks", len(tasks))
+    record_count("filtered_tasks", len(filtered_tasks))
+    record_count("dependency_edges", sum(len(data.get("dependencies", [])) for _, data in filtered_tasks))
     
     print(f"\n📊 Found {len(filtered_tasks)} issue(s) to create\n")
     
@@ -743,104 +2063,130 @@ def main():
         return
     
     # Confirm
-    if len(filtered_tasks) > 5:
+    if len(filtered_tasks) > 5 and not args.yes and not args.plan_cost:
         confirm = input(f"Create {len(filtered_tasks)} GitHub issue(s)? (y/n): ")
         if confirm.lower() != "y":
             print("❌ Cancelled")
             return
     
-    # Create issues
-    print("\n🚀 Creating issues...\n")
-    success_count = 0
-    
-    for task_key, task_data in filtered_tasks:
-        milestone = task_data.get("milestone", "")
-        spec_file = find_spec_file(task_key, milestone)
-        
-        issue_number = create_github_issue(task_key, task_data, milestone, spec_file)
-        if issue_number:
-            success_count += 1
-    
-    print(f"\n✅ Complete: {success_count}/{len(filtered_tasks)} issues created")
+    # Project/field/option/milestone/iteration IDs (cached project schema, no lookups on the hot path)
+    with phase("project_schema"):
+        schema_ok = resolve_project_ids(refresh=args.refresh_schema)
+    if not schema_ok:
+        print("❌ Cannot continue without the project schema")
+        return
     
-    # Phase 2: Set blocking relationships using persisted queries
-    print("\n🔗 Setting blocking relationships...\n")
-    relationships_count = 0
+    # Resume from earlier runs: known issues are skipped and their IDs satisfy dependents
+    global sync_state
+    previously_synced = set()
+    if args.incremental and args.no_state:
+        print("❌ --incremental needs the sync state (drop --no-state)")
+        return
+    if not args.no_state:
+        sync_state = SyncState(args.state_file)
+        for record in sync_state.all():
+            if record["node_id"]:
+                record_created_issue(record["task_key"], record["issue_number"], record["node_id"])
+            if record["step"] == STEP_DONE:
+                previously_synced.add(record["task_key"])
+        if previously_synced:
+            print(f"📂 Sync state: {len(previously_synced)} issue(s) already synced ({args.state_file})")
+    
+    # Learn what already exists so nothing is created twice and IDs need no per-issue lookups
+    if not args.no_prefetch:
+        with phase("prefetch"):
+            prefetch_remote_index()
+        previously_synced |= set(remote_index)
+        for task_key, remote in remote_index.items():
+            if task_key not in created_issues_node_ids:
+                record_created_issue(task_key, remote["number"], remote["node_id"])
+    
+    # Pre-flight: run only what fits the remaining hourly budget, so a large sync
+    # doesn't stop halfway with half-provisioned issues
+    if args.plan_cost or not args.ignore_budget:
+        print("\n💰 Planning API budget...")
+        with phase("budget_plan"):
+            cost_of_prefix, summary = plan_sync_cost(
+                filtered_tasks, args.provision, args.link_mode, args.link_chunk_size, args.incremental
+            )
+        print(f"   📋 {summary['create']} to create, {summary['resume']} to resume, {summary['update']} to update, "
+              f"{summary['unchanged']} unchanged; {summary['relationships']} relationship link(s)")
+        with phase("budget_plan"):
+            plan = plan_schedule(len(filtered_tasks), cost_of_prefix, fetch_budget())
+        print_budget_plan(plan)
+        if args.plan_cost:
+            sys.exit(1 if plan.decision == SCHEDULE_REFUSE else 0)
+        if plan.decision == SCHEDULE_REFUSE:
+            print("❌ Not enough API budget left (wait for the reset or use --ignore-budget)")
+            return
+        if plan.decision == SCHEDULE_SPLIT:
+            filtered_tasks = filtered_tasks[:plan.runnable]
+    
+    # Milestones/labels only once the run is going ahead (--plan-cost never writes),
+    # then refresh the schema so issues can reference the planned ones
+    if args.reconcile_metadata:
+        print("\n📅 Reconciling milestones and labels...")
+        with phase("metadata_reconcile"):
+            if sync_metadata(args) is None:
+                print("❌ Cannot continue without the repository milestones")
+                return
+        with phase("project_schema"):
+            if not resolve_project_ids(refresh=True):
+                print("❌ Cannot continue without the project schema")
+                return
+    
+    sync_tasks(filtered_tasks, args)
+    
+    # Phase 3: Assign Copilot agent to first ready task (issues synced by earlier runs were already considered)
+    print("\n🤖 Assigning Copilot agent to first ready task...\n")
     
-    for task_key, task_data in filtered_tasks:
-        dependencies = task_data.get("dependencies", [])
-        if not dependencies:
-            continue
-        
-        # Get this issue's node ID
-        blocked_issue_node_id = created_issues_node_ids.get(task_key)
-        if not blocked_issue_node_id:
-            continue
-        
-        blocked_issue_num = created_issues_cache.get(task_key)
+    with phase("copilot_assignment"):
+        ready_task = find_first_ready_task(
+            [(key, data) for key, data in filtered_tasks if key not in previously_synced],
+            created_issues_cache,
+            created_issues_node_ids,
+        )
         
-        # Set blocking relationship for each dependency
-        for dep_key in dependencies:
-            blocking_issue_node_id = created_issues_node_ids.get(dep_key)
-            blocking_issue_num = created_issues_cache.get(dep_key)
+        if ready_task:
+            task_key, issue_num, node_id = ready_task
+            task_data = next((data for key, data in filtered_tasks if key == task_key), None)
             
-            if blocking_issue_node_id and blocking_issue_num:
-                print(f"   #{blocked_issue_num} ({task_key}) blocked by #{blocking_issue_num} ({dep_key})...", end=" ", flush=True)
-                if link_issue_dependency(blocked_issue_node_id, blocking_issue_node_id):
+            if task_data:
+                # Generate custom instructions
+                custom_instructions = generate_copilot_instructions(task_key, task_data)
+                
+                # Select appropriate custom agent
+                custom_agent = select_custom_agent(task_data)
+                agent_info = f" with {custom_agent}" if custom_agent else ""
+                
+                # Assign Copilot
+                print(f"   Assigning Copilot{agent_info} to #{issue_num} ({task_key})...", end=" ", flush=True)
+                if assign_copilot_agent(
+                    node_id, 
+                    custom_instructions, 
+                    base_ref="main", 
+                    repo_owner=REPO_OWNER, 
+                    repo_name=REPO_NAME,
+                    custom_agent=custom_agent,
+                ):
                     print("✅")
-                    relationships_count += 1
+                    print(f"\n   📝 Custom instructions sent ({len(custom_instructions)} characters)")
+                    if custom_agent:
+                        print(f"   🤖 Custom agent: {custom_agent}")
+                    print(f"   🔗 View: https://github.com/{REPO_OWNER}/{REPO_NAME}/issues/{issue_num}")
+                    print(f"   ⚠️  NOTE: Copilot for Issues is in beta - bot may not appear as assignee yet")
                 else:
                     print("❌")
-                time.sleep(0.3)  # Rate limit protection
-    
-    print(f"\n✅ Set {relationships_count} blocking relationships")
-    
-    # Phase 3: Assign Copilot agent to first ready task
-    print("\n🤖 Assigning Copilot agent to first ready task...\n")
-    
-    ready_task = find_first_ready_task(
-        filtered_tasks,
-        created_issues_cache,
-        created_issues_node_ids,
-    )
-    
-    if ready_task:
-        task_key, issue_num, node_id = ready_task
-        task_data = next((data for key, data in filtered_tasks if key == task_key), None)
-        
-        if task_data:
-            # Generate custom instructions
-            custom_instructions = generate_copilot_instructions(task_key, task_data)
-            
-            # Select appropriate custom agent
-            custom_agent = select_custom_agent(task_data)
-            agent_info = f" with {custom_agent}" if custom_agent else ""
-            
-            # Assign Copilot
-            print(f"   Assigning Copilot{agent_info} to #{issue_num} ({task_key})...", end=" ", flush=True)
-            if assign_copilot_agent(
-                node_id, 
-                custom_instructions, 
-                base_ref="main", 
-                repo_owner=REPO_OWNER, 
-                repo_name=REPO_NAME,
-                custom_agent=custom_agent,
-            ):
-                print("✅")
-                print(f"\n   📝 Custom instructions sent ({len(custom_instructions)} characters)")
-                if custom_agent:
-                    print(f"   🤖 Custom agent: {custom_agent}")
-                print(f"   🔗 View: https://github.com/{REPO_OWNER}/{REPO_NAME}/issues/{issue_num}")
-                print(f"   ⚠️  NOTE: Copilot for Issues is in beta - bot may not appear as assignee yet")
-            else:
-                print("❌")
-                print("   ℹ️  Copilot API integration ready, waiting for beta graduation")
-    else:
-        print("   ⚠️  No ready tasks found for Copilot assignment")
-        print("   💡 All tasks have dependencies or are not yet created")
+                    print("   ℹ️  Copilot API integration ready, waiting for beta graduation")
+        else:
+            print("   ⚠️  No ready tasks found for Copilot assignment")
+            print("   💡 All tasks have dependencies or are not yet created")
     
     print(f"\n🔗 View issues: https://github.com/{REPO_OWNER}/{REPO_NAME}/issues")
     print(f"🔗 View project: https://github.com/orgs/{REPO_OWNER}/projects/{PROJECT_NUMBER}")
+    
+    if args.watch:
+        watch_planning(args, tasks, issue_files)
 
 
 
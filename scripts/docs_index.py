@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Planning Docs Index
+
+Task key -> markdown doc lookup for planning/docs, shared by
+create-issues-api.py, create-github-issues.py, task-automation-agent.py and
+automation/generators/setup-supabase.sh:
+- One directory scan builds the whole index ("T57" -> m3---.../T57-*.md)
+- Cached on disk (planning/.cache/docs-index.json) and reused while the
+  mtimes of planning/docs and its subdirectories are unchanged; adding,
+  removing or renaming a doc changes its directory's mtime and triggers a
+  rescan
+- Lookups are dictionary hits; keys are matched case-insensitively
+
+Usage:
+    python scripts/docs_index.py T57                 # print the doc path
+    python scripts/docs_index.py T12 T57 --milestone "M3 - Content"
+    python scripts/docs_index.py --list --rebuild
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from cache_utils import CACHE_DIR, read_json_cache, write_json_cache
+
+INDEX_VERSION = 1
+INDEX_CACHE_FILE = CACHE_DIR / "docs-index.json"
+DEFAULT_DOCS_DIR = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press")) / "planning/docs"
+
+
+class DocsIndex:
+    """Task key -> doc paths (relative to docs_dir), plus the directory mtimes it was built from."""
+
+    def __init__(self, docs_dir: Path, docs: Dict[str, List[str]], directories: Dict[str, int]):
+        self.docs_dir = docs_dir
+        self.docs = docs
+        self.directories = directories
+
+    def find(self, task_key: str, milestone: str = "") -> Optional[Path]:
+        """
+        Doc for a task, or None.
+
+        With a milestone ("M3 - Content Generation"), a doc in the matching
+        milestone directory (m3---...) is preferred over one elsewhere.
+        """
+        paths = self.docs.get(task_key.upper())
+        if not paths:
+            return None
+        prefix = milestone_prefix(milestone)
+        if prefix:
+            for path in paths:
+                if path.lower().startswith(prefix):
+                    return self.docs_dir / path
+        return self.docs_dir / paths[0]
+
+    def is_current(self) -> bool:
+        """True when no indexed directory changed since the scan (one stat per directory)."""
+        for relative, mtime in self.directories.items():
+            try:
+                if (self.docs_dir / relative).stat().st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def to_json(self) -> Dict:
+        return {
+            "version": INDEX_VERSION,
+            "docs_dir": str(self.docs_dir),
+            "directories": self.directories,
+            "docs": self.docs,
+        }
+
+
+def milestone_prefix(milestone: str) -> str:
+    """Docs directory prefix of a milestone: "M3 - Content Generation" -> "m3"."""
+    return milestone.lower().replace(" ", "-").split("-")[0]
+
+
+def doc_key(filename: str) -> Optional[str]:
+    """Task key of a doc file name ("T57-generation-progress-tracking.md" -> "T57")."""
+    if not filename.endswith(".md") or "-" not in filename:
+        return None
+    return filename.split("-", 1)[0].upper() or None
+
+
+def scan_docs(docs_dir: Path) -> DocsIndex:
+    """Walk docs_dir once, recording every doc and every directory's mtime."""
+    docs: Dict[str, List[str]] = {}
+    directories: Dict[str, int] = {}
+    pending = [docs_dir]
+    while pending:
+        directory = pending.pop()
+        try:
+            directories[directory.relative_to(docs_dir).as_posix()] = directory.stat().st_mtime_ns
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(Path(entry.path))
+                continue
+            key = doc_key(entry.name)
+            if key:
+                docs.setdefault(key, []).append(Path(entry.path).relative_to(docs_dir).as_posix())
+
+    for paths in docs.values():
+        paths.sort()
+    return DocsIndex(docs_dir, docs, directories)
+
+
+_indexes: Dict[Path, DocsIndex] = {}
+
+
+def load_docs_index(docs_dir: Path = DEFAULT_DOCS_DIR, refresh: bool = False) -> DocsIndex:
+    """
+    Index for docs_dir: from memory, else from the disk cache if still current, else rescanned.
+
+    The in-memory index is checked once per process; pass refresh=True in
+    long-running processes to pick up changed docs.
+    """
+    docs_dir = Path(docs_dir)
+    index = _indexes.get(docs_dir)
+    if index is not None and not (refresh and not index.is_current()):
+        return index
+
+    cached = read_json_cache(INDEX_CACHE_FILE)
+    index = None
+    if cached and cached.get("version") == INDEX_VERSION and cached.get("docs_dir") == str(docs_dir):
+        index = DocsIndex(docs_dir, cached["docs"], cached["directories"])
+        if not index.is_current():
+            index = None
+
+    if index is None:
+        index = scan_docs(docs_dir)
+        try:
+            write_json_cache(INDEX_CACHE_FILE, index.to_json())
+        except OSError as e:
+            print(f"⚠️  Could not cache docs index: {e}", file=sys.stderr)
+
+    _indexes[docs_dir] = index
+    return index
+
+
+def find_task_doc(task_key: str, docs_dir: Path = DEFAULT_DOCS_DIR, milestone: str = "") -> Optional[Path]:
+    """Doc for a task (see DocsIndex.find), or None."""
+    return load_docs_index(docs_dir).find(task_key, milestone)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up planning docs by task key")
+    parser.add_argument("task_keys", nargs="*", help="Task keys (e.g. T57)")
+    parser.add_argument("--docs-dir", type=Path, default=DEFAULT_DOCS_DIR, help="Planning docs directory")
+    parser.add_argument("--milestone", default="", help="Prefer docs in this milestone's directory")
+    parser.add_argument("--rebuild", action="store_true", help="Rescan the docs directory")
+    parser.add_argument("--list", action="store_true", help="Print every indexed task key and doc")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        index = scan_docs(args.docs_dir)
+        write_json_cache(INDEX_CACHE_FILE, index.to_json())
+        _indexes[args.docs_dir] = index
+        print(f"✅ Indexed {sum(len(paths) for paths in index.docs.values())} docs "
+              f"in {len(index.directories)} directories", file=sys.stderr)
+    else:
+        index = load_docs_index(args.docs_dir)
+
+    if args.list:
+        for key in sorted(index.docs, key=lambda k: (len(k), k)):
+            for path in index.docs[key]:
+                print(f"{key}\t{index.docs_dir / path}")
+
+    missing = []
+    for task_key in args.task_keys:
+        path = index.find(task_key, args.milestone)
+        if path is None:
+            missing.append(task_key)
+        else:
+            print(path)
+    if missing:
+        print(f"❌ No doc found for: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
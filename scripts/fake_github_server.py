@@ -0,0 +1,1051 @@
+#!/usr/bin/env python3
+"""
+Fake GitHub API Server
+
+Local stand-in for the parts of the GitHub REST and GraphQL APIs used by the
+planning sync scripts, for offline tests and throughput benchmarks:
+
+REST:
+- POST/GET/PATCH /repos/{owner}/{repo}/issues[/{number}]
+- POST /repos/{owner}/{repo}/issues/{number}/labels, DELETE .../labels/{name}
+- GET/POST /repos/{owner}/{repo}/labels, PATCH .../labels/{name}
+- GET/POST /repos/{owner}/{repo}/milestones, PATCH .../milestones/{number}
+- GET /rate_limit (free, like on GitHub)
+
+GraphQL (a small executor over the documents the scripts send):
+- repository { id labels milestones issueTypes issues suggestedActors owner { projectV2 } }
+- createIssue, updateIssue, addProjectV2ItemById, updateProjectV2ItemFieldValue,
+  clearProjectV2ItemFieldValue, addBlockedBy, addSubIssue, addAssigneesToAssignable
+- rateLimit { cost limit remaining resetAt }
+
+Configurable per-request latency, primary (hourly) limits and a secondary
+points-per-minute limit. Every request is logged with its duration for the
+benchmark harness (benchmark_sync.py).
+
+Usage:
+    python scripts/fake_github_server.py --port 8765 --latency-ms 20
+    GITHUB_API_URL=http://127.0.0.1:8765 GITHUB_TOKEN=fake python scripts/create-issues-api.py --yes
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+# GraphQL secondary-limit points (matches rate_limit.py)
+QUERY_POINTS = 1
+MUTATION_POINTS = 5
+
+DEFAULT_MILESTONES = [
+    "M0 - Infrastructure & Setup",
+    "M1 - Backend Services",
+    "M2 - ML Training & Development",
+    "M3 - Content Generation Pipeline",
+    "M4 - Dashboard & UI",
+]
+DEFAULT_ITERATIONS = [
+    "I1 - Infrastructure",
+    "I2 - Backend Core",
+    "I3 - ML Foundation",
+    "I4 - Generation Pipeline",
+    "I5 - Dashboard & Assembly",
+    "I6 - Commerce & Distribution",
+    "I7 - Launch & Release",
+]
+DEFAULT_LABELS = ["from-planning"]
+DEFAULT_ISSUE_TYPES = ["Task", "Bug", "Feature"]
+DEFAULT_STATUS_OPTIONS = ["Todo", "In Progress", "Done"]
+
+# Interfaces implemented by the object types the fake returns
+INTERFACES = {
+    "ProjectV2Field": {"ProjectV2FieldCommon"},
+    "ProjectV2SingleSelectField": {"ProjectV2FieldCommon"},
+    "ProjectV2IterationField": {"ProjectV2FieldCommon"},
+    "Issue": {"Assignable", "Node"},
+    "Bot": {"Actor"},
+    "User": {"Actor"},
+}
+
+
+class GraphQLError(Exception):
+    """Field-level error reported in the response's `errors` list."""
+
+    def __init__(self, message: str, error_type: str = "UNPROCESSABLE"):
+        super().__init__(message)
+        self.type = error_type
+
+
+# ---------------------------------------------------------------------------
+# GraphQL parsing and execution
+# ---------------------------------------------------------------------------
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<ignore>[\s,]+|\#[^\n]*)
+    |(?P<spread>\.\.\.)
+    |(?P<string>"(?:[^"\\]|\\.)*")
+    |(?P<number>-?\d+(?:\.\d+)?)
+    |(?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    |(?P<punct>[!$():=@\[\]{}|])
+    """,
+    re.VERBOSE,
+)
+
+
+def tokenize(document: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    while position < len(document):
+        match = TOKEN_PATTERN.match(document, position)
+        if not match:
+            raise GraphQLError(f"Syntax error at offset {position}", "PARSE_ERROR")
+        position = match.end()
+        kind = match.lastgroup
+        if kind != "ignore":
+            tokens.append((kind, match.group()))
+    return tokens
+
+
+class Parser:
+    """Recursive-descent parser for the executable subset of GraphQL."""
+
+    def __init__(self, document: str):
+        self.tokens = tokenize(document)
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> Tuple[str, str]:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else ("eof", "")
+
+    def take(self, value: Optional[str] = None) -> Tuple[str, str]:
+        token = self.peek()
+        if value is not None and token[1] != value:
+            raise GraphQLError(f"Expected '{value}', found '{token[1]}'", "PARSE_ERROR")
+        self.position += 1
+        return token
+
+    def parse_document(self) -> Tuple[Dict, Dict[str, Dict]]:
+        """Returns (operation, fragments)."""
+        operation = None
+        fragments = {}
+        while self.peek()[0] != "eof":
+            if self.peek()[1] == "fragment":
+                self.take()
+                name = self.take()[1]
+                self.take("on")
+                type_condition = self.take()[1]
+                fragments[name] = {"on": type_condition, "selections": self.parse_selection_set()}
+            else:
+                operation = self.parse_operation()
+        if operation is None:
+            raise GraphQLError("Document has no operation", "PARSE_ERROR")
+        return operation, fragments
+
+    def parse_operation(self) -> Dict:
+        op_type = "query"
+        if self.peek()[1] in ("query", "mutation"):
+            op_type = self.take()[1]
+            if self.peek()[0] == "name":
+                self.take()
+            if self.peek()[1] == "(":
+                self.take("(")
+                while self.peek()[1] != ")":
+                    self.take("$")
+                    self.take()
+                    self.take(":")
+                    self.parse_type()
+                    if self.peek()[1] == "=":
+                        self.take()
+                        self.parse_value()
+                self.take(")")
+        return {"type": op_type, "selections": self.parse_selection_set()}
+
+    def parse_type(self) -> None:
+        if self.peek()[1] == "[":
+            self.take("[")
+            self.parse_type()
+            self.take("]")
+        else:
+            self.take()
+        if self.peek()[1] == "!":
+            self.take()
+
+    def parse_selection_set(self) -> List[Dict]:
+        self.take("{")
+        selections = []
+        while self.peek()[1] != "}":
+            if self.peek()[0] == "spread":
+                self.take()
+                if self.peek()[1] == "on":
+                    self.take()
+                    type_condition = self.take()[1]
+                    selections.append({"kind": "inline", "on": type_condition, "selections": self.parse_selection_set()})
+                else:
+                    selections.append({"kind": "spread", "name": self.take()[1]})
+                continue
+
+            name = self.take()[1]
+            alias = None
+            if self.peek()[1] == ":":
+                self.take()
+                alias, name = name, self.take()[1]
+            arguments = {}
+            if self.peek()[1] == "(":
+                self.take("(")
+                while self.peek()[1] != ")":
+                    arg_name = self.take()[1]
+                    self.take(":")
+                    arguments[arg_name] = self.parse_value()
+                self.take(")")
+            children = self.parse_selection_set() if self.peek()[1] == "{" else []
+            selections.append({"kind": "field", "name": name, "alias": alias or name,
+                               "arguments": arguments, "selections": children})
+        self.take("}")
+        return selections
+
+    def parse_value(self) -> Any:
+        kind, value = self.peek()
+        if value == "$":
+            self.take()
+            return ("var", self.take()[1])
+        if value == "[":
+            self.take()
+            items = []
+            while self.peek()[1] != "]":
+                items.append(self.parse_value())
+            self.take("]")
+            return items
+        if value == "{":
+            self.take()
+            obj = {}
+            while self.peek()[1] != "}":
+                key = self.take()[1]
+                self.take(":")
+                obj[key] = self.parse_value()
+            self.take("}")
+            return obj
+        self.take()
+        if kind == "string":
+            return json.loads(value)
+        if kind == "number":
+            return float(value) if "." in value else int(value)
+        if value in ("true", "false"):
+            return value == "true"
+        if value == "null":
+            return None
+        return value  # Enum value
+
+
+def resolve_arguments(value: Any, variables: Dict[str, Any]) -> Any:
+    """Substitute variables into a parsed argument value."""
+    if isinstance(value, tuple) and value[:1] == ("var",):
+        return variables.get(value[1])
+    if isinstance(value, list):
+        return [resolve_arguments(item, variables) for item in value]
+    if isinstance(value, dict):
+        return {key: resolve_arguments(item, variables) for key, item in value.items()}
+    return value
+
+
+def type_matches(typename: Optional[str], condition: str) -> bool:
+    return typename == condition or condition in INTERFACES.get(typename or "", set())
+
+
+def expand_selections(selections: List[Dict], typename: Optional[str], fragments: Dict[str, Dict]) -> List[Dict]:
+    """Flatten inline fragments and fragment spreads that apply to `typename`."""
+    fields = []
+    for selection in selections:
+        if selection["kind"] == "field":
+            fields.append(selection)
+        elif selection["kind"] == "inline":
+            if type_matches(typename, selection["on"]):
+                fields.extend(expand_selections(selection["selections"], typename, fragments))
+        else:
+            fragment = fragments.get(selection["name"])
+            if fragment and type_matches(typename, fragment["on"]):
+                fields.extend(expand_selections(fragment["selections"], typename, fragments))
+    return fields
+
+
+def project(value: Any, selections: List[Dict], variables: Dict[str, Any], fragments: Dict[str, Dict]) -> Any:
+    """
+    Shape a resolved value by a selection set.
+
+    Object values are dicts; a callable entry is a field with arguments and
+    is called with the resolved arguments.
+    """
+    if value is None or not selections:
+        return value
+    if isinstance(value, list):
+        return [project(item, selections, variables, fragments) for item in value]
+
+    result = {}
+    for field in expand_selections(selections, value.get("__typename"), fragments):
+        if field["name"] == "__typename":
+            result[field["alias"]] = value.get("__typename")
+            continue
+        raw = value.get(field["name"])
+        if callable(raw):
+            raw = raw(resolve_arguments(field["arguments"], variables))
+        result[field["alias"]] = project(raw, field["selections"], variables, fragments)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# In-memory GitHub
+# ---------------------------------------------------------------------------
+
+class FakeGitHub:
+    """Thread-safe in-memory repository, project and rate-limit state."""
+
+    def __init__(
+        self,
+        owner: str = "neutrico",
+        repo: str = "morpheus-press",
+        milestones: Optional[List[str]] = None,
+        iterations: Optional[List[str]] = None,
+        labels: Optional[List[str]] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        primary_limit: int = 5000,
+        secondary_points_per_minute: int = 0,
+    ):
+        self.owner = owner
+        self.repo = repo
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.primary_limit = primary_limit
+        self.secondary_points_per_minute = secondary_points_per_minute
+
+        self._lock = threading.RLock()
+        self._ids = 0
+        self.repository_id = self._new_id("R")
+        self.project_id = self._new_id("PVT")
+        self.copilot_bot_id = self._new_id("BOT")
+
+        self.labels: Dict[str, Dict] = {}
+        for name in labels if labels is not None else DEFAULT_LABELS:
+            self._create_label(name)
+
+        self.milestones: Dict[int, Dict] = {}
+        for title in milestones if milestones is not None else DEFAULT_MILESTONES:
+            self._create_milestone({"title": title})
+
+        self.issue_types = {name: self._new_id("IT") for name in DEFAULT_ISSUE_TYPES}
+
+        status_options = [{"id": self._new_id("OPT"), "name": name} for name in DEFAULT_STATUS_OPTIONS]
+        iteration_values = [
+            {"id": self._new_id("ITER"), "title": title, "startDate": "2026-01-01", "duration": 14}
+            for title in (iterations if iterations is not None else DEFAULT_ITERATIONS)
+        ]
+        self.fields: Dict[str, Dict] = {}
+        for name, typename, data_type, extra in (
+            ("Title", "ProjectV2Field", "TITLE", {}),
+            ("Status", "ProjectV2SingleSelectField", "SINGLE_SELECT", {"options": status_options}),
+            ("Milestone", "ProjectV2Field", "MILESTONE", {}),
+            ("Parent issue", "ProjectV2Field", "PARENT_ISSUE", {}),
+            ("Blocked By", "ProjectV2Field", "TEXT", {}),
+            ("Iteration", "ProjectV2IterationField", "ITERATION", {"iterations": iteration_values}),
+        ):
+            field_id = self._new_id("PVTF")
+            self.fields[field_id] = {"id": field_id, "name": name, "typename": typename,
+                                     "dataType": data_type, **extra}
+
+        self.issues: Dict[int, Dict] = {}
+        self.issue_numbers_by_node: Dict[str, int] = {}
+        self.items: Dict[str, Dict] = {}
+
+        # Rate limits: hourly primary budget per resource, sliding-minute secondary points
+        self._window_start = time.time()
+        self._primary_used = {"core": 0, "graphql": 0}
+        self._secondary = deque()
+
+        self.request_log: List[Dict] = []
+
+    # -- helpers ------------------------------------------------------------
+
+    def _new_id(self, prefix: str) -> str:
+        with self._lock:
+            self._ids += 1
+            return f"{prefix}_fake{self._ids}"
+
+    def _create_label(self, name: str, color: str = "ededed", description: str = "") -> Dict:
+        label = {"id": self._new_id("LA"), "name": name, "color": color, "description": description}
+        self.labels[name] = label
+        return label
+
+    def _create_milestone(self, data: Dict) -> Dict:
+        number = len(self.milestones) + 1
+        milestone = {
+            "id": self._new_id("MI"),
+            "number": number,
+            "title": data["title"],
+            "description": data.get("description", ""),
+            "state": data.get("state", "open"),
+            "due_on": data.get("due_on"),
+        }
+        self.milestones[number] = milestone
+        return milestone
+
+    def _issue_by_node(self, node_id: str) -> Dict:
+        number = self.issue_numbers_by_node.get(node_id)
+        if number is None:
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{node_id}'", "NOT_FOUND")
+        return self.issues[number]
+
+    def _create_issue(self, title: str, body: str = "", labels: Optional[List[str]] = None,
+                      milestone: Optional[int] = None, issue_type_id: Optional[str] = None) -> Dict:
+        number = len(self.issues) + 1
+        for name in labels or []:
+            if name not in self.labels:
+                self._create_label(name)
+        issue = {
+            "number": number,
+            "node_id": self._new_id("I"),
+            "title": title,
+            "body": body,
+            "state": "open",
+            "labels": list(dict.fromkeys(labels or [])),
+            "milestone": milestone if milestone in self.milestones else None,
+            "issue_type_id": issue_type_id,
+            "parent": None,
+            "blocked_by": [],
+            "assignees": [],
+            "project_items": [],
+        }
+        self.issues[number] = issue
+        self.issue_numbers_by_node[issue["node_id"]] = number
+        return issue
+
+    def _add_to_project(self, issue: Dict) -> Dict:
+        for item_id in issue["project_items"]:
+            return self.items[item_id]
+        item = {"id": self._new_id("PVTI"), "issue": issue["number"], "values": {}}
+        self.items[item["id"]] = item
+        issue["project_items"].append(item["id"])
+        return item
+
+    # -- REST views ---------------------------------------------------------
+
+    def issue_json(self, issue: Dict) -> Dict:
+        milestone = self.milestones.get(issue["milestone"]) if issue["milestone"] else None
+        return {
+            "number": issue["number"],
+            "node_id": issue["node_id"],
+            "title": issue["title"],
+            "body": issue["body"],
+            "state": issue["state"],
+            "labels": [self.label_json(self.labels[name]) for name in issue["labels"]],
+            "milestone": self.milestone_json(milestone) if milestone else None,
+            "html_url": f"https://github.com/{self.owner}/{self.repo}/issues/{issue['number']}",
+        }
+
+    def label_json(self, label: Dict) -> Dict:
+        return {"node_id": label["id"], "name": label["name"], "color": label["color"],
+                "description": label["description"]}
+
+    def milestone_json(self, milestone: Dict) -> Dict:
+        return {"node_id": milestone["id"], "number": milestone["number"], "title": milestone["title"],
+                "description": milestone["description"], "state": milestone["state"],
+                "due_on": milestone["due_on"]}
+
+    # -- GraphQL views ------------------------------------------------------
+
+    def issue_node(self, issue: Dict) -> Dict:
+        milestone = self.milestones.get(issue["milestone"]) if issue["milestone"] else None
+        parent = self.issues.get(issue["parent"]) if issue["parent"] else None
+        return {
+            "__typename": "Issue",
+            "id": issue["node_id"],
+            "number": issue["number"],
+            "title": issue["title"],
+            "body": issue["body"],
+            "state": issue["state"].upper(),
+            "issueType": {"id": issue["issue_type_id"]} if issue["issue_type_id"] else None,
+            "milestone": {"id": milestone["id"], "number": milestone["number"],
+                          "title": milestone["title"]} if milestone else None,
+            "labels": lambda args: connection(
+                [{"id": self.labels[name]["id"], "name": name} for name in issue["labels"]], args),
+            "parent": {"id": parent["node_id"], "number": parent["number"]} if parent else None,
+            "blockedBy": lambda args: connection(
+                [{"id": self.issues[n]["node_id"], "number": n} for n in issue["blocked_by"]], args),
+            "assignees": lambda args: connection([{"login": login} for login in issue["assignees"]], args),
+            "projectItems": lambda args: connection(
+                [self.item_node(self.items[item_id]) for item_id in issue["project_items"]], args),
+        }
+
+    def item_node(self, item: Dict) -> Dict:
+        return {
+            "id": item["id"],
+            "project": {"id": self.project_id},
+            "fieldValues": lambda args: connection(
+                [self.field_value_node(field_id, value) for field_id, value in item["values"].items()], args),
+        }
+
+    def field_node(self, field: Dict) -> Dict:
+        node = {"__typename": field["typename"], "id": field["id"], "name": field["name"],
+                "dataType": field["dataType"]}
+        if "options" in field:
+            node["options"] = lambda args: field["options"]
+        if "iterations" in field:
+            node["configuration"] = {"iterations": field["iterations"], "completedIterations": []}
+        return node
+
+    def field_value_node(self, field_id: str, value: Dict) -> Dict:
+        field = self.fields[field_id]
+        field_ref = {"__typename": field["typename"], "id": field_id, "name": field["name"]}
+        if "singleSelectOptionId" in value:
+            return {"__typename": "ProjectV2ItemFieldSingleSelectValue", "optionId": value["singleSelectOptionId"],
+                    "field": field_ref}
+        if "iterationId" in value:
+            return {"__typename": "ProjectV2ItemFieldIterationValue", "iterationId": value["iterationId"],
+                    "field": field_ref}
+        return {"__typename": "ProjectV2ItemFieldTextValue", "text": value.get("text"), "field": field_ref}
+
+    def project_node(self) -> Dict:
+        return {
+            "__typename": "ProjectV2",
+            "id": self.project_id,
+            "title": "Fake Project",
+            "fields": lambda args: connection([self.field_node(f) for f in self.fields.values()], args),
+        }
+
+    def repository_node(self) -> Dict:
+        return {
+            "__typename": "Repository",
+            "id": self.repository_id,
+            "name": self.repo,
+            "labels": lambda args: connection(
+                [{"id": l["id"], "name": l["name"], "color": l["color"], "description": l["description"]}
+                 for l in self.labels.values()],
+                args,
+            ),
+            "milestones": lambda args: connection(
+                [{"id": m["id"], "number": m["number"], "title": m["title"], "description": m["description"],
+                  "state": m["state"].upper(), "dueOn": m["due_on"]}
+                 for m in self.milestones.values()
+                 if not args.get("states") or m["state"].upper() in args["states"]],
+                args,
+            ),
+            "issueTypes": lambda args: connection(
+                [{"id": type_id, "name": name} for name, type_id in self.issue_types.items()], args),
+            "issues": lambda args: connection(
+                [self.issue_node(issue) for issue in self.issues.values()
+                 if not args.get("states") or issue["state"].upper() in args["states"]],
+                args,
+            ),
+            "suggestedActors": lambda args: connection(
+                [{"__typename": "Bot", "login": "copilot-swe-agent", "id": self.copilot_bot_id}], args),
+            "owner": {"__typename": "Organization", "login": self.owner,
+                      "projectV2": lambda args: self.project_node()},
+        }
+
+    # -- GraphQL mutations --------------------------------------------------
+
+    def mutation_resolvers(self) -> Dict[str, Callable[[Dict], Dict]]:
+        return {
+            "createIssue": self.m_create_issue,
+            "updateIssue": self.m_update_issue,
+            "addProjectV2ItemById": self.m_add_project_item,
+            "updateProjectV2ItemFieldValue": self.m_update_field_value,
+            "clearProjectV2ItemFieldValue": self.m_clear_field_value,
+            "addBlockedBy": self.m_add_blocked_by,
+            "addSubIssue": self.m_add_sub_issue,
+            "addAssigneesToAssignable": self.m_add_assignees,
+        }
+
+    def _project_item(self, input_value: Dict) -> Dict:
+        if input_value.get("projectId") != self.project_id:
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{input_value.get('projectId')}'",
+                               "NOT_FOUND")
+        item = self.items.get(input_value.get("itemId"))
+        if item is None:
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{input_value.get('itemId')}'",
+                               "NOT_FOUND")
+        if input_value.get("fieldId") not in self.fields:
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{input_value.get('fieldId')}'",
+                               "NOT_FOUND")
+        return item
+
+    def m_create_issue(self, args: Dict) -> Dict:
+        data = args["input"]
+        if data.get("repositoryId") != self.repository_id:
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{data.get('repositoryId')}'",
+                               "NOT_FOUND")
+        labels_by_id = {label["id"]: name for name, label in self.labels.items()}
+        milestones_by_id = {m["id"]: number for number, m in self.milestones.items()}
+        issue = self._create_issue(
+            data["title"],
+            data.get("body", ""),
+            [labels_by_id[label_id] for label_id in data.get("labelIds") or [] if label_id in labels_by_id],
+            milestones_by_id.get(data.get("milestoneId")),
+            data.get("issueTypeId"),
+        )
+        if self.project_id in (data.get("projectV2Ids") or []):
+            self._add_to_project(issue)
+        return {"issue": self.issue_node(issue)}
+
+    def m_update_issue(self, args: Dict) -> Dict:
+        data = args["input"]
+        issue = self._issue_by_node(data["id"])
+        for key, target in (("title", "title"), ("body", "body"), ("issueTypeId", "issue_type_id")):
+            if key in data:
+                issue[target] = data[key]
+        return {"issue": self.issue_node(issue)}
+
+    def m_add_project_item(self, args: Dict) -> Dict:
+        data = args["input"]
+        if data.get("projectId") != self.project_id:
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{data.get('projectId')}'",
+                               "NOT_FOUND")
+        item = self._add_to_project(self._issue_by_node(data["contentId"]))
+        return {"item": self.item_node(item)}
+
+    def m_update_field_value(self, args: Dict) -> Dict:
+        data = args["input"]
+        item = self._project_item(data)
+        item["values"][data["fieldId"]] = dict(data.get("value") or {})
+        return {"projectV2Item": self.item_node(item)}
+
+    def m_clear_field_value(self, args: Dict) -> Dict:
+        data = args["input"]
+        item = self._project_item(data)
+        item["values"].pop(data["fieldId"], None)
+        return {"projectV2Item": self.item_node(item)}
+
+    def m_add_blocked_by(self, args: Dict) -> Dict:
+        data = args["input"]
+        issue = self._issue_by_node(data["issueId"])
+        blocking = self._issue_by_node(data["blockingIssueId"])
+        if blocking["number"] in issue["blocked_by"]:
+            raise GraphQLError("Issue is already blocked by this issue")
+        issue["blocked_by"].append(blocking["number"])
+        return {"issue": self.issue_node(issue), "blockingIssue": self.issue_node(blocking)}
+
+    def m_add_sub_issue(self, args: Dict) -> Dict:
+        data = args["input"]
+        parent = self._issue_by_node(data["issueId"])
+        sub_issue = self._issue_by_node(data["subIssueId"])
+        if sub_issue["parent"] and not data.get("replaceParent"):
+            raise GraphQLError("Sub-issue already has a parent")
+        sub_issue["parent"] = parent["number"]
+        return {"issue": self.issue_node(parent), "subIssue": self.issue_node(sub_issue)}
+
+    def m_add_assignees(self, args: Dict) -> Dict:
+        data = args["input"]
+        issue = self._issue_by_node(data["assignableId"])
+        for assignee_id in data.get("assigneeIds") or []:
+            if assignee_id == self.copilot_bot_id and "copilot-swe-agent" not in issue["assignees"]:
+                issue["assignees"].append("copilot-swe-agent")
+        return {"assignable": self.issue_node(issue)}
+
+    # -- GraphQL execution --------------------------------------------------
+
+    def execute_graphql(self, query: str, variables: Optional[Dict]) -> Tuple[Dict, int]:
+        """Run a document. Returns (response body, secondary-limit points)."""
+        variables = variables or {}
+        try:
+            operation, fragments = Parser(query).parse_document()
+        except GraphQLError as e:
+            return {"errors": [{"type": e.type, "message": str(e)}]}, QUERY_POINTS
+
+        root_fields = expand_selections(operation["selections"], None, fragments)
+        is_mutation = operation["type"] == "mutation"
+        points = MUTATION_POINTS * len(root_fields) if is_mutation else QUERY_POINTS
+
+        data: Dict[str, Any] = {}
+        errors = []
+        with self._lock:
+            for field in root_fields:
+                arguments = resolve_arguments(field["arguments"], variables)
+                try:
+                    if is_mutation:
+                        resolver = self.mutation_resolvers().get(field["name"])
+                        if resolver is None:
+                            raise GraphQLError(f"Field '{field['name']}' doesn't exist on type 'Mutation'",
+                                               "undefinedField")
+                        value = resolver(arguments)
+                    elif field["name"] == "repository":
+                        if (arguments.get("owner"), arguments.get("name")) != (self.owner, self.repo):
+                            raise GraphQLError(
+                                f"Could not resolve to a Repository with the name "
+                                f"'{arguments.get('owner')}/{arguments.get('name')}'.", "NOT_FOUND")
+                        value = self.repository_node()
+                    elif field["name"] == "rateLimit":
+                        value = self.rate_limit_node(points)
+                    else:
+                        raise GraphQLError(f"Field '{field['name']}' doesn't exist on type 'Query'", "undefinedField")
+                    data[field["alias"]] = project(value, field["selections"], variables, fragments)
+                except GraphQLError as e:
+                    data[field["alias"]] = None
+                    errors.append({"type": e.type, "path": [field["alias"]], "message": str(e)})
+
+        body: Dict[str, Any] = {"data": data}
+        if errors:
+            body["errors"] = errors
+        return body, points
+
+    def rate_limit_node(self, cost: int) -> Dict:
+        reset_at = datetime.fromtimestamp(self._window_start + 3600, tz=timezone.utc)
+        return {
+            "cost": cost,
+            "limit": self.primary_limit,
+            "remaining": max(0, self.primary_limit - self._primary_used["graphql"]),
+            "resetAt": reset_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "used": self._primary_used["graphql"],
+        }
+
+    def rate_limit_status(self) -> Dict:
+        """GET /rate_limit body (primary budget per resource)."""
+        with self._lock:
+            reset = int(self._window_start + 3600)
+            resources = {
+                resource: {
+                    "limit": self.primary_limit,
+                    "used": used,
+                    "remaining": max(0, self.primary_limit - used),
+                    "reset": reset,
+                }
+                for resource, used in self._primary_used.items()
+            }
+        return {"resources": resources, "rate": resources["core"]}
+
+    # -- REST execution -----------------------------------------------------
+
+    def execute_rest(self, method: str, path: str, payload: Any) -> Tuple[int, Any]:
+        prefix = f"/repos/{self.owner}/{self.repo}"
+        if not path.startswith(prefix):
+            return 404, {"message": "Not Found"}
+        parts = [unquote(part) for part in path[len(prefix):].strip("/").split("/") if part]
+        payload = payload or {}
+
+        with self._lock:
+            if parts == ["issues"] and method == "POST":
+                if not payload.get("title"):
+                    return 422, {"message": "Validation Failed"}
+                issue = self._create_issue(payload["title"], payload.get("body", ""),
+                                           payload.get("labels"), payload.get("milestone"))
+                return 201, self.issue_json(issue)
+            if parts == ["issues"] and method == "GET":
+                return 200, [self.issue_json(issue) for issue in self.issues.values()]
+
+            if len(parts) >= 2 and parts[0] == "issues":
+                issue = self.issues.get(int(parts[1])) if parts[1].isdigit() else None
+                if issue is None:
+                    return 404, {"message": "Not Found"}
+                if len(parts) == 2 and method == "GET":
+                    return 200, self.issue_json(issue)
+                if len(parts) == 2 and method == "PATCH":
+                    for key in ("title", "body", "state"):
+                        if key in payload:
+                            issue[key] = payload[key]
+                    if "milestone" in payload:
+                        issue["milestone"] = payload["milestone"]
+                    if "labels" in payload:
+                        issue["labels"] = []
+                        self._add_labels(issue, payload["labels"])
+                    return 200, self.issue_json(issue)
+                if parts[2:] == ["labels"] and method == "POST":
+                    self._add_labels(issue, payload.get("labels", []))
+                    return 200, [self.label_json(self.labels[name]) for name in issue["labels"]]
+                if len(parts) == 4 and parts[2] == "labels" and method == "DELETE":
+                    if parts[3] not in issue["labels"]:
+                        return 404, {"message": "Label does not exist"}
+                    issue["labels"].remove(parts[3])
+                    return 200, [self.label_json(self.labels[name]) for name in issue["labels"]]
+
+            if parts == ["labels"]:
+                if method == "GET":
+                    return 200, [self.label_json(label) for label in self.labels.values()]
+                if method == "POST":
+                    if payload.get("name") in self.labels:
+                        return 422, {"message": "Validation Failed", "errors": [{"code": "already_exists"}]}
+                    label = self._create_label(payload["name"], payload.get("color", "ededed"),
+                                               payload.get("description", ""))
+                    return 201, self.label_json(label)
+            if len(parts) == 2 and parts[0] == "labels" and method == "PATCH":
+                label = self.labels.get(parts[1])
+                if label is None:
+                    return 404, {"message": "Not Found"}
+                for key in ("color", "description"):
+                    if key in payload:
+                        label[key] = payload[key]
+                if payload.get("new_name") and payload["new_name"] != label["name"]:
+                    del self.labels[label["name"]]
+                    label["name"] = payload["new_name"]
+                    self.labels[label["name"]] = label
+                return 200, self.label_json(label)
+
+            if parts == ["milestones"]:
+                if method == "GET":
+                    return 200, [self.milestone_json(m) for m in self.milestones.values()]
+                if method == "POST":
+                    if any(m["title"] == payload.get("title") for m in self.milestones.values()):
+                        return 422, {"message": "Validation Failed", "errors": [{"code": "already_exists"}]}
+                    return 201, self.milestone_json(self._create_milestone(payload))
+            if len(parts) == 2 and parts[0] == "milestones" and method == "PATCH":
+                milestone = self.milestones.get(int(parts[1])) if parts[1].isdigit() else None
+                if milestone is None:
+                    return 404, {"message": "Not Found"}
+                for key in ("title", "description", "state", "due_on"):
+                    if key in payload:
+                        milestone[key] = payload[key]
+                return 200, self.milestone_json(milestone)
+
+        return 404, {"message": "Not Found"}
+
+    def _add_labels(self, issue: Dict, names: List[str]) -> None:
+        for name in names:
+            if name not in self.labels:
+                self._create_label(name)
+            if name not in issue["labels"]:
+                issue["labels"].append(name)
+
+    # -- rate limits --------------------------------------------------------
+
+    def check_limits(self, resource: str, points: int) -> Tuple[Optional[int], Dict[str, str], Optional[Dict]]:
+        """
+        Charge a request against the limits.
+
+        Returns (error status or None, rate-limit headers, error body or None).
+        """
+        now = time.time()
+        with self._lock:
+            if now - self._window_start >= 3600:
+                self._window_start = now
+                self._primary_used = {"core": 0, "graphql": 0}
+            reset = int(self._window_start + 3600)
+            used = self._primary_used[resource]
+
+            if self.secondary_points_per_minute:
+                while self._secondary and now - self._secondary[0][0] >= 60:
+                    self._secondary.popleft()
+                spent = sum(p for _, p in self._secondary)
+                if spent + points > self.secondary_points_per_minute:
+                    retry_after = max(1, int(60 - (now - self._secondary[0][0])) + 1)
+                    headers = {"Retry-After": str(retry_after)}
+                    return 403, headers, {"message": "You have exceeded a secondary rate limit. Please wait a few minutes before you try again."}
+                self._secondary.append((now, points))
+
+            if used >= self.primary_limit:
+                headers = self._primary_headers(resource, 0, reset)
+                return 403, headers, {"message": "API rate limit exceeded"}
+
+            self._primary_used[resource] = used + 1
+            headers = self._primary_headers(resource, self.primary_limit - used - 1, reset)
+            return None, headers, None
+
+    def _primary_headers(self, resource: str, remaining: int, reset: int) -> Dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.primary_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+            "X-RateLimit-Resource": resource,
+        }
+
+    def simulate_latency(self) -> None:
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    # -- stats --------------------------------------------------------------
+
+    def log_request(self, entry: Dict) -> None:
+        with self._lock:
+            self.request_log.append(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            log = list(self.request_log)
+        durations = sorted(entry["duration"] for entry in log)
+        by_operation: Dict[str, int] = {}
+        for entry in log:
+            by_operation[entry["operation"]] = by_operation.get(entry["operation"], 0) + 1
+        return {
+            "requests": len(log),
+            "rest": sum(1 for entry in log if entry["kind"] == "rest"),
+            "graphql": sum(1 for entry in log if entry["kind"] == "graphql"),
+            "rate_limited": sum(1 for entry in log if entry["status"] in (403, 429)),
+            "p50_ms": percentile(durations, 50) * 1000,
+            "p99_ms": percentile(durations, 99) * 1000,
+            "by_operation": dict(sorted(by_operation.items(), key=lambda item: -item[1])),
+            "issues": len(self.issues),
+            "project_items": len(self.items),
+        }
+
+
+def connection(nodes: List[Any], args: Dict) -> Dict:
+    """Cursor-paginated connection over a node list (cursors are list offsets)."""
+    start = int(args.get("after") or 0)
+    first = args.get("first")
+    page = nodes[start:start + first] if first else nodes[start:]
+    end = start + len(page)
+    return {
+        "nodes": page,
+        "totalCount": len(nodes),
+        "pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end)},
+    }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def operation_name(kind: str, method: str, path: str, query: str = "") -> str:
+    """Short label for the request log ("POST /issues", "mutation updateProjectV2ItemFieldValue x3")."""
+    if kind == "rest":
+        normalized = re.sub(r"^/repos/[^/]+/[^/]+", "", urlsplit(path).path)
+        normalized = re.sub(r"/\d+", "/{n}", normalized)
+        normalized = re.sub(r"/labels/[^/]+$", "/labels/{name}", normalized)
+        return f"{method} {normalized}"
+    try:
+        operation, fragments = Parser(query).parse_document()
+    except GraphQLError:
+        return "graphql (unparseable)"
+    names = [field["name"] for field in expand_selections(operation["selections"], None, fragments)
+             if field["name"] != "rateLimit"]
+    counts: Dict[str, int] = {}
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+    label = ", ".join(f"{name} x{count}" if count > 1 else name for name, count in counts.items())
+    return f"{operation['type']} {label}"
+
+
+# ---------------------------------------------------------------------------
+# HTTP server
+# ---------------------------------------------------------------------------
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeGitHubServer"
+
+    def _handle(self) -> None:
+        started = time.perf_counter()
+        fake = self.server.fake
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(raw) if raw else None
+        except json.JSONDecodeError:
+            self._send(400, {"message": "Problems parsing JSON"}, {})
+            return
+
+        path = urlsplit(self.path).path
+        if path == "/_fake/stats":
+            self._send(200, fake.stats(), {})
+            return
+        if path == "/rate_limit" and self.command == "GET":
+            # Like GitHub: reports the budget without spending it
+            self._send(200, fake.rate_limit_status(), {})
+            return
+
+        is_graphql = path == "/graphql" and self.command == "POST"
+        kind = "graphql" if is_graphql else "rest"
+        query = (payload or {}).get("query", "") if is_graphql else ""
+        points = MUTATION_POINTS if self.command != "GET" else QUERY_POINTS
+        if is_graphql and query.lstrip().startswith("mutation"):
+            points = MUTATION_POINTS * max(1, len(re.findall(r"\(\s*input\s*:", query)))
+        elif is_graphql:
+            points = QUERY_POINTS
+
+        fake.simulate_latency()
+        error_status, headers, error_body = fake.check_limits(kind if is_graphql else "core", points)
+        if error_status:
+            status, body = error_status, error_body
+        elif is_graphql:
+            body, _ = fake.execute_graphql(query, (payload or {}).get("variables"))
+            status = 200
+        else:
+            status, body = fake.execute_rest(self.command, path, payload)
+
+        self._send(status, body, headers)
+        fake.log_request({
+            "kind": kind,
+            "operation": operation_name(kind, self.command, path, query),
+            "status": status,
+            "duration": time.perf_counter() - started,
+            "bytes": len(raw),
+        })
+
+    def _send(self, status: int, body: Any, headers: Dict[str, str]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class FakeGitHubServer(ThreadingHTTPServer):
+    """Threaded HTTP server exposing a FakeGitHub instance."""
+
+    daemon_threads = True
+
+    def __init__(self, fake: FakeGitHub, host: str = "127.0.0.1", port: int = 0, verbose: bool = False):
+        super().__init__((host, port), FakeGitHubHandler)
+        self.fake = fake
+        self.verbose = verbose
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local fake GitHub REST/GraphQL API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--owner", default="neutrico")
+    parser.add_argument("--repo", default="morpheus-press")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added to every request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency (0..jitter)")
+    parser.add_argument("--primary-limit", type=int, default=5000, help="Requests per hour per resource")
+    parser.add_argument("--secondary-points", type=int, default=0,
+                        help="Secondary limit in points per minute (0 = disabled)")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    fake = FakeGitHub(
+        owner=args.owner,
+        repo=args.repo,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        primary_limit=args.primary_limit,
+        secondary_points_per_minute=args.secondary_points,
+    )
+    server = FakeGitHubServer(fake, args.host, args.port, verbose=args.verbose)
+    print(f"🧪 Fake GitHub API for {args.owner}/{args.repo} at {server.url}")
+    print(f"   GITHUB_API_URL={server.url} GITHUB_TOKEN=fake")
+    print(f"   Stats: {server.url}/_fake/stats")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n" + json.dumps(fake.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ generate test code from human-defined test scenarios in the planning phase.
 
 Usage:
     python scripts/generate_tests_from_scenarios.py --scenarios test_scenarios.yaml --changed-files src/services/database.ts
+    python scripts/generate_tests_from_scenarios.py ... --profile   # Time each phase (JSON report)
 
 Environment:
     OPENAI_API_KEY - Required for LLM test generation
@@ -21,6 +22,8 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 import openai
 
+from profiling import add_profile_arguments, phase, record_count, start_profiling
+
 # Configure OpenAI
 openai.api_key = os.getenv('OPENAI_API_KEY')
 if not openai.api_key:
@@ -160,21 +163,22 @@ class TestGenerator:
         
         # Call OpenAI API
         try:
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",  # Fast and cheap for code generation
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert TypeScript/Vitest test engineer. Generate complete, production-ready test files that follow best practices: AAA pattern, proper mocking, descriptive names, comprehensive coverage."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,  # Low temperature for consistent code
-                max_tokens=4000
-            )
+            with phase('llm_call'):
+                response = openai.chat.completions.create(
+                    model="gpt-4o-mini",  # Fast and cheap for code generation
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are an expert TypeScript/Vitest test engineer. Generate complete, production-ready test files that follow best practices: AAA pattern, proper mocking, descriptive names, comprehensive coverage."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=0.3,  # Low temperature for consistent code
+                    max_tokens=4000
+                )
             
             test_code = response.choices[0].message.content
             
@@ -352,7 +356,7 @@ class TestGenerator:
         test_file_path = test_dir / test_file_name
         
         # Save test file
-        with open(test_file_path, 'w', encoding='utf-8') as f:
+        with phase('file_write'), open(test_file_path, 'w', encoding='utf-8') as f:
             f.write(test_code)
         
         print(f"   ✅ Saved: {test_file_path.relative_to(self.workspace_root)}")
@@ -363,7 +367,9 @@ class TestGenerator:
         """Generate test files for all changed files"""
         
         print("\n🔍 Matching scenarios to changed files...")
-        matched = self.match_scenarios_to_files(changed_files)
+        with phase('filter'):
+            matched = self.match_scenarios_to_files(changed_files)
+        record_count('matched_files', len(matched))
         
         if not matched:
             print("⚠️  No scenarios matched to changed files")
@@ -410,8 +416,10 @@ def main():
         default='/workspaces/morpheus',
         help='Workspace root directory'
     )
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
+    start_profiling(args, 'generate_tests_from_scenarios')
     
     # Parse changed files
     changed_files = [f.strip() for f in args.changed_files.split(',')]
@@ -427,7 +435,8 @@ def main():
     generator = TestGenerator(args.scenarios, args.workspace)
     
     try:
-        generator.load_scenarios()
+        with phase('yaml_load'):
+            generator.load_scenarios()
         generated_files = generator.generate_all(changed_files)
         
         if generated_files:
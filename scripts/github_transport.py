@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+GitHub API Transport
+
+Shared transport for the planning sync scripts:
+- Persistent keep-alive HTTP session (connection pooling, HTTP/2 when httpx + h2 are installed)
+- Token resolved once per process (GITHUB_TOKEN / GH_TOKEN, then `gh auth token`)
+- `gh api` subprocess fallback when no token is available or when forced
+- Every call paced by the shared rate-limit governor (rate_limit.py) and
+  retried with backoff on rate-limit responses
+- Every call recorded in the per-operation API metrics (api_metrics.py)
+
+Select the transport with MORPHEUS_GH_TRANSPORT=auto|http|gh (default: auto).
+"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+from http.client import HTTPConnection, HTTPException, HTTPSConnection, RemoteDisconnected
+from typing import Any, Dict, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from api_metrics import get_metrics, graphql_operation_name, rest_operation_name
+from rate_limit import (
+    MAX_RETRIES,
+    MUTATION_POINTS,
+    QUERY_POINTS,
+    get_governor,
+    graphql_points,
+    is_rate_limited,
+    retry_after_seconds,
+)
+
+try:
+    import httpx
+except ImportError:  # Optional dependency - fall back to http.client keep-alive
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = httpx is not None
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Errors a call reports as ApiResponse(0, ..., "Connection error") instead of raising
+CONNECTION_ERRORS = (HTTPException, OSError) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# A reused keep-alive connection the server already closed fails with one of these
+# before any response arrives - the only case where a request is sent again
+STALE_CONNECTION_ERRORS = (RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+USER_AGENT = "morpheus-press-planning-sync"
+TRANSPORT_MODES = ("auto", "http", "gh")
+
+
+class ApiResponse(NamedTuple):
+    """Normalized response shared by the HTTP and `gh` transports."""
+
+    status: int
+    data: Any
+    headers: Dict[str, str]
+    error: str = ""
+    sent_bytes: int = 0
+    received_bytes: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300 and not self.error
+
+
+class GitHubTransport:
+    """Pooled HTTP client for the GitHub REST and GraphQL APIs."""
+
+    def __init__(self, token: str, api_url: str = API_URL, timeout: float = 30.0):
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.default_headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+
+        parts = urlsplit(self.api_url)
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._base_path = parts.path.rstrip("/")
+
+        # httpx.Client is thread-safe and pools connections itself;
+        # http.client connections are kept one per thread.
+        self._client = None
+        if httpx is not None:
+            self._client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                timeout=timeout,
+                headers=self.default_headers,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+        self._local = threading.local()
+
+    @property
+    def http_version(self) -> str:
+        return "HTTP/2" if self._client is not None and HTTP2_AVAILABLE else "HTTP/1.1"
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> ApiResponse:
+        """Send one request over the pooled session and decode the JSON body."""
+        path = endpoint if endpoint.startswith("/") else f"/{endpoint}"
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+
+        if self._client is not None:
+            response = self._client.request(
+                method,
+                f"{self.api_url}{path}",
+                content=body,
+                headers={"Content-Type": "application/json", **(headers or {})},
+            )
+            return _build_response(response.status_code, dict(response.headers), response.content, len(body or b""))
+
+        status, response_headers, raw = self._send_http_client(method, path, body, headers)
+        return _build_response(status, response_headers, raw, len(body or b""))
+
+    def _send_http_client(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+    ):
+        request_headers = {**self.default_headers, "Content-Type": "application/json", **(headers or {})}
+
+        # Reuse the thread's keep-alive connection; resend once only when a reused
+        # connection turned out to be closed before any response arrived. Timeouts and
+        # failures on a fresh connection are not retried: the server may already have
+        # applied the request (a second POST would create a duplicate issue).
+        for attempt in range(2):
+            conn = self._connection()
+            reused = conn.sock is not None
+            responded = False
+            try:
+                conn.request(method, f"{self._base_path}{path}", body=body, headers=request_headers)
+                response = conn.getresponse()
+                responded = True
+                raw = response.read()
+                return response.status, {k.lower(): v for k, v in response.getheaders()}, raw
+            except (HTTPException, OSError) as e:
+                conn.close()
+                self._local.conn = None
+                if attempt == 1 or not reused or responded or not isinstance(e, STALE_CONNECTION_ERRORS):
+                    raise
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            connection_class = HTTPSConnection if self._scheme == "https" else HTTPConnection
+            conn = connection_class(self._host, self._port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _build_response(status: int, headers: Dict[str, str], raw: bytes, sent_bytes: int = 0) -> ApiResponse:
+    headers = {k.lower(): v for k, v in headers.items()}
+    try:
+        data = json.loads(raw) if raw else {}
+    except json.JSONDecodeError:
+        data = {}
+
+    error = ""
+    if not 200 <= status < 300:
+        message = data.get("message", "") if isinstance(data, dict) else ""
+        error = f"HTTP {status}: {message or raw[:200].decode('utf-8', 'replace')}"
+    elif isinstance(data, dict) and data.get("errors"):
+        error = _format_graphql_errors(data["errors"])
+    return ApiResponse(status, data, headers, error, sent_bytes, len(raw))
+
+
+def _format_graphql_errors(errors: Any) -> str:
+    if not isinstance(errors, list):
+        return str(errors)
+    return "; ".join(str(e.get("message", e)) if isinstance(e, dict) else str(e) for e in errors)
+
+
+# ---------------------------------------------------------------------------
+# Transport selection
+# ---------------------------------------------------------------------------
+
+_transport_lock = threading.Lock()
+_transport: Optional[GitHubTransport] = None
+_transport_resolved = False
+_transport_mode = os.environ.get("MORPHEUS_GH_TRANSPORT", "auto")
+
+
+def configure(mode: str = "auto", token: Optional[str] = None, api_url: Optional[str] = None) -> None:
+    """Select the transport mode ("auto", "http" or "gh") before the first API call."""
+    global _transport, _transport_resolved, _transport_mode, API_URL
+    if mode not in TRANSPORT_MODES:
+        raise ValueError(f"Unknown transport mode: {mode} (expected one of {', '.join(TRANSPORT_MODES)})")
+
+    with _transport_lock:
+        if _transport is not None:
+            _transport.close()
+        _transport = None
+        _transport_resolved = False
+        _transport_mode = mode
+        if api_url:
+            API_URL = api_url
+        if token and mode != "gh":
+            _transport = GitHubTransport(token, API_URL)
+            _transport_resolved = True
+
+
+def resolve_token() -> Optional[str]:
+    """Find a GitHub token without spawning `gh` more than once."""
+    for var in ("GITHUB_TOKEN", "GH_TOKEN"):
+        if os.environ.get(var):
+            return os.environ[var]
+
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+def get_transport() -> Optional[GitHubTransport]:
+    """Return the shared HTTP transport, or None when the `gh` fallback is in use."""
+    global _transport, _transport_resolved
+    if _transport_resolved:
+        return _transport
+
+    with _transport_lock:
+        if not _transport_resolved:
+            if _transport_mode != "gh":
+                token = resolve_token()
+                if token:
+                    _transport = GitHubTransport(token, API_URL)
+                elif _transport_mode == "http":
+                    raise RuntimeError("HTTP transport requested but no GitHub token found (set GITHUB_TOKEN)")
+            _transport_resolved = True
+    return _transport
+
+
+# ---------------------------------------------------------------------------
+# API calls
+# ---------------------------------------------------------------------------
+
+def rest_call(
+    endpoint: str,
+    method: str = "GET",
+    payload: Optional[Any] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> ApiResponse:
+    """Call a REST endpoint (e.g. "/repos/{owner}/{repo}/issues")."""
+    points = QUERY_POINTS if method == "GET" else MUTATION_POINTS
+    name = rest_operation_name(method, endpoint)
+
+    def send() -> ApiResponse:
+        transport = get_transport()
+        if transport is not None:
+            try:
+                return transport.request(method, endpoint, payload, headers)
+            except CONNECTION_ERRORS as e:
+                return ApiResponse(0, {}, {}, f"Connection error: {e}")
+
+        cmd = ["gh", "api", endpoint, "-X", method, "--include"]
+        for name, value in (headers or {}).items():
+            cmd.extend(["-H", f"{name}: {value}"])
+        if payload is not None:
+            cmd.extend(["--input", "-"])
+        return _run_gh(cmd, payload)
+
+    return _governed(send, points, "core", name)
+
+
+def graphql_call(
+    query: str,
+    variables: Optional[Dict] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> ApiResponse:
+    """Run a GraphQL document. Partial data is returned alongside `error` when the API reports errors."""
+    payload = {"query": query, "variables": variables or {}}
+
+    def send() -> ApiResponse:
+        transport = get_transport()
+        if transport is not None:
+            try:
+                return transport.request("POST", "/graphql", payload, headers)
+            except CONNECTION_ERRORS as e:
+                return ApiResponse(0, {}, {}, f"Connection error: {e}")
+
+        cmd = ["gh", "api", "graphql", "--include", "--input", "-"]
+        for name, value in (headers or {}).items():
+            cmd.extend(["-H", f"{name}: {value}"])
+        return _run_gh(cmd, payload)
+
+    return _governed(send, graphql_points(query), "graphql", graphql_operation_name(query))
+
+
+def _governed(send, points: float, resource: str, name: str) -> ApiResponse:
+    """Pace a call through the shared governor, retrying with backoff when rate limited."""
+    governor = get_governor()
+    latencies = []
+    waited = 0.0
+    sent_bytes = received_bytes = 0
+    for attempt in range(MAX_RETRIES + 1):
+        waited += governor.acquire(points, resource)
+        started = time.perf_counter()
+        response = send()
+        latencies.append(time.perf_counter() - started)
+        sent_bytes += response.sent_bytes
+        received_bytes += response.received_bytes
+        governor.observe_headers(response.headers)
+        governor.observe_graphql(response.data)
+
+        if attempt == MAX_RETRIES or not is_rate_limited(response.status, response.headers, response.error):
+            break
+
+        delay = governor.backoff(attempt, retry_after_seconds(response.headers))
+        print(f"   ⏳ Rate limited, backing off {delay:.1f}s (retry {attempt + 1}/{MAX_RETRIES})")
+
+    rate_limit = _response_rate_limit(response)
+    get_metrics().record_call(
+        name,
+        "graphql" if resource == "graphql" else "rest",
+        latencies,
+        response.ok,
+        wait_seconds=waited,
+        bytes_sent=sent_bytes,
+        bytes_received=received_bytes,
+        graphql_cost=rate_limit.get("cost") if rate_limit else None,
+        rate_limit=rate_limit,
+    )
+    return response
+
+
+def _response_rate_limit(response: ApiResponse) -> Optional[Dict[str, Any]]:
+    """Primary budget reported by a response (GraphQL rateLimit selection, else X-RateLimit headers)."""
+    data = response.data
+    rate_limit = ((data.get("data") or {}).get("rateLimit") if isinstance(data, dict) else None) or {}
+    if rate_limit.get("remaining") is not None:
+        return {
+            "resource": "graphql",
+            "remaining": rate_limit["remaining"],
+            "limit": rate_limit.get("limit"),
+            "reset": rate_limit.get("resetAt"),
+            "cost": rate_limit.get("cost"),
+        }
+    headers = response.headers
+    if headers.get("x-ratelimit-remaining") is None:
+        return None
+    return {
+        "resource": headers.get("x-ratelimit-resource", "core"),
+        "remaining": int(headers["x-ratelimit-remaining"]),
+        "limit": int(headers.get("x-ratelimit-limit", 0)) or None,
+        "reset": headers.get("x-ratelimit-reset"),
+    }
+
+
+def _run_gh(cmd: list, payload: Optional[Any]) -> ApiResponse:
+    request_body = json.dumps(payload) if payload is not None else None
+    result = subprocess.run(
+        cmd,
+        input=request_body,
+        capture_output=True,
+        text=True,
+    )
+    sizes = (len(request_body.encode("utf-8")) if request_body else 0, len(result.stdout.encode("utf-8")))
+
+    # --include prints the status line and headers before the body
+    status, headers, body = _split_included_response(result.stdout)
+
+    # `gh api` exits non-zero on GraphQL errors but still prints the response body
+    try:
+        data = json.loads(body) if body.strip() else {}
+    except json.JSONDecodeError:
+        data = {}
+
+    if result.returncode != 0:
+        error = result.stderr.strip() or "gh api failed"
+        if not status:
+            status = 200 if isinstance(data, dict) and "data" in data else 0
+        if 200 <= status < 300 and not (isinstance(data, dict) and data.get("errors")):
+            status = 0
+        return ApiResponse(status, data, headers, error, *sizes)
+
+    error = _format_graphql_errors(data["errors"]) if isinstance(data, dict) and data.get("errors") else ""
+    return ApiResponse(status or 200, data, headers, error, *sizes)
+
+
+def _split_included_response(output: str):
+    """Split `gh api --include` output into (status, headers, body)."""
+    if not output.startswith("HTTP/"):
+        return 0, {}, output
+
+    head, _, body = output.replace("\r\n", "\n").partition("\n\n")
+    lines = head.split("\n")
+    try:
+        status = int(lines[0].split()[1])
+    except (IndexError, ValueError):
+        status = 0
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Aliased GraphQL Mutation Helpers
+
+Functions to:
+- Pack several mutations into one document (one alias per operation)
+- Report success per alias from a (possibly partial) GraphQL response
+- Run long operation lists in chunks sized to the GraphQL resource limits
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Chunk sizing: start conservative, double after clean chunks, halve on limit errors.
+# Every mutation also costs 5 points against the 2,000 points/minute secondary limit,
+# so very large documents buy nothing.
+DEFAULT_CHUNK_SIZE = 25
+MAX_CHUNK_SIZE = 100
+MAX_NODES_PER_DOCUMENT = 250  # Estimated payload nodes (sum of op "nodes")
+
+# Document-level failures that mean "too much in one request"
+LIMIT_ERROR_TYPES = {"MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED", "EXCESSIVE_PAGINATION"}
+LIMIT_ERROR_MARKERS = ("timeout", "timed out", "complexity", "too many", "limit exceeded")
+
+
+def mutation_op(
+    alias: str,
+    mutation: str,
+    input_type: str,
+    input_value: Dict[str, Any],
+    selection: str = "clientMutationId",
+    nodes: int = 1,
+) -> Dict[str, Any]:
+    """
+    Describe one mutation for an aliased document.
+
+    Args:
+        alias: Unique alias in the document (letters, digits, underscore)
+        mutation: Mutation field name (e.g., "addBlockedBy")
+        input_type: GraphQL input type (e.g., "AddBlockedByInput")
+        input_value: Input object, sent as a variable
+        selection: Selection set for the payload (without braces)
+        nodes: Estimated payload nodes, used to bound chunk size
+
+    Returns:
+        Operation dict for build_aliased_mutation()
+    """
+    return {
+        "alias": alias,
+        "mutation": mutation,
+        "input_type": input_type,
+        "input": input_value,
+        "selection": selection,
+        "nodes": nodes,
+    }
+
+
+def build_aliased_mutation(operations: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build a single mutation document running every operation under its alias.
+
+    Each input is passed as its own typed variable, so values never need escaping.
+
+    Returns:
+        (document, variables)
+    """
+    variable_defs = []
+    fields = []
+    variables: Dict[str, Any] = {}
+
+    for op in operations:
+        var_name = f"in_{op['alias']}"
+        variable_defs.append(f"${var_name}: {op['input_type']}!")
+        fields.append(f"  {op['alias']}: {op['mutation']}(input: ${var_name}) {{ {op['selection']} }}")
+        variables[var_name] = op["input"]
+
+    document = f"mutation({', '.join(variable_defs)}) {{\n" + "\n".join(fields) + "\n}"
+    return document, variables
+
+
+def alias_results(result: Dict[str, Any], aliases: List[str]) -> Dict[str, bool]:
+    """
+    Map each alias to True when its payload came back non-null without errors.
+
+    GraphQL reports failures per field: the aliased field is null and an
+    error entry carries the alias as the first element of its `path`.
+    """
+    data = result.get("data") or {}
+    failed = {
+        error["path"][0]
+        for error in result.get("errors") or []
+        if isinstance(error, dict) and error.get("path")
+    }
+    return {alias: bool(data.get(alias)) and alias not in failed for alias in aliases}
+
+
+def is_limit_error(result: Dict[str, Any]) -> bool:
+    """True when a response failed as a whole because the document was too large or slow."""
+    if not result:
+        # Transport failure (timeouts surface here) - retry smaller
+        return True
+    if result.get("data"):
+        return False
+    for error in result.get("errors") or []:
+        if not isinstance(error, dict):
+            continue
+        message = str(error.get("message", "")).lower()
+        if error.get("type") in LIMIT_ERROR_TYPES or any(marker in message for marker in LIMIT_ERROR_MARKERS):
+            return True
+    return False
+
+
+def run_aliased_batches(
+    operations: List[Dict[str, Any]],
+    run: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_chunk_size: int = MAX_CHUNK_SIZE,
+    max_nodes: int = MAX_NODES_PER_DOCUMENT,
+    on_chunk: Optional[Callable[[List[Dict[str, Any]], Dict[str, bool]], None]] = None,
+) -> Dict[str, bool]:
+    """
+    Run operations as chunked aliased mutation documents.
+
+    Chunk size adapts to the API: it doubles (up to max_chunk_size) after a
+    chunk that completes, and halves when a chunk fails as a whole with a
+    node/cost/timeout limit error, in which case the chunk is retried smaller
+    and the rejected size becomes the new ceiling.
+
+    Args:
+        operations: mutation_op() dicts with unique aliases
+        run: Executes (document, variables) and returns the GraphQL response dict
+        chunk_size: Initial operations per document
+        max_chunk_size: Upper bound for operations per document
+        max_nodes: Upper bound for estimated payload nodes per document
+        on_chunk: Called with (chunk_operations, alias_results) after each chunk
+
+    Returns:
+        Dict of alias -> success for every operation
+    """
+    results: Dict[str, bool] = {}
+    ceiling = max(1, max_chunk_size)
+    size = max(1, min(chunk_size, ceiling))
+    position = 0
+
+    while position < len(operations):
+        # Take up to `size` operations without exceeding the node budget
+        chunk = []
+        nodes = 0
+        for op in operations[position:position + size]:
+            if chunk and nodes + op.get("nodes", 1) > max_nodes:
+                break
+            chunk.append(op)
+            nodes += op.get("nodes", 1)
+
+        document, variables = build_aliased_mutation(chunk)
+        result = run(document, variables)
+
+        if is_limit_error(result) and len(chunk) > 1:
+            # Never grow back to a size the API already rejected
+            ceiling = len(chunk) - 1
+            size = max(1, len(chunk) // 2)
+            continue
+
+        chunk_results = alias_results(result, [op["alias"] for op in chunk])
+        results.update(chunk_results)
+        if on_chunk:
+            on_chunk(chunk, chunk_results)
+
+        position += len(chunk)
+        if all(chunk_results.values()):
+            size = min(ceiling, size * 2)
+
+    return results
+
+
+def estimate_batch_count(
+    operation_count: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_chunk_size: int = MAX_CHUNK_SIZE,
+    max_nodes: int = MAX_NODES_PER_DOCUMENT,
+    nodes_per_operation: int = 1,
+) -> int:
+    """
+    Number of documents run_aliased_batches() sends for `operation_count`
+    operations when every chunk succeeds (chunk size doubling up to the cap).
+    """
+    ceiling = max(1, min(max_chunk_size, max_nodes // max(1, nodes_per_operation)))
+    size = max(1, min(chunk_size, ceiling))
+    remaining = operation_count
+    documents = 0
+    while remaining > 0:
+        remaining -= size
+        documents += 1
+        size = min(ceiling, size * 2)
+    return documents
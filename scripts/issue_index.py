@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Planning Issue Index
+
+Task key -> byte range lookup for single-task reads of the planning YAML,
+used by task-automation-agent.py, api-generator.py, test_full_flow_t4.py and
+the copilot-task-automation workflow:
+- Each planning/issues/*.yaml item ("- key: T4" ...) and each
+  estimates/effort-map.yaml entry ("  T4:" ...) is recorded as
+  (file, offset, length, sha256) in planning/.cache/issue-index.json
+- Indexing scans raw lines for block boundaries - no YAML parsing - and only
+  files whose size/mtime (or, for fresh mtimes, content hash) changed are
+  rescanned
+- A lookup reads and parses just the task's block, so startup cost does not
+  grow with the backlog; blocks that fail to verify fall back to a full load
+
+Usage:
+    python scripts/issue_index.py T4                   # issue entry as JSON
+    python scripts/issue_index.py T4 --estimate --field title
+    python scripts/issue_index.py --list --rebuild
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from cache_utils import CACHE_DIR, read_json_cache, write_json_cache
+from planning_yaml import RACY_WINDOW_SECONDS, load_yaml, parse_yaml
+
+INDEX_VERSION = 1
+INDEX_CACHE_FILE = CACHE_DIR / "issue-index.json"
+DEFAULT_PLANNING_DIR = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press")) / "planning"
+
+ISSUES = "issues"        # planning/issues/*.yaml: top-level list of {key: ...}
+ESTIMATES = "estimates"  # estimates/effort-map.yaml: top-level mapping of key -> estimate
+
+BLOCK_KEY_PATTERN = re.compile(rb"""^\s*(?:-\s+)?key:\s*["']?([^"'\s#]+)""")
+MAPPING_KEY_PATTERN = re.compile(rb"""^\s*["']?([^"':\s#]+)["']?\s*:""")
+
+
+class BlockLocation(NamedTuple):
+    """Where one task's YAML block lives."""
+    path: Path
+    offset: int
+    length: int
+    sha256: str
+
+
+def _indent(line: bytes) -> int:
+    return len(line) - len(line.lstrip(b" "))
+
+
+def _is_content(line: bytes) -> bool:
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith(b"#")
+
+
+def iter_blocks(data: bytes, collection: str) -> List[Tuple[Optional[str], int, int]]:
+    """
+    (task key, offset, length) of every entry of the top-level `collection`
+    (a list of mappings with "key", or a mapping keyed by task key), in file
+    order; the key is None when it cannot be read off the raw lines.
+
+    Returns [] when the collection is missing or not in block style.
+    """
+    lines = data.splitlines(keepends=True)
+    offsets = []
+    position = 0
+    for line in lines:
+        offsets.append(position)
+        position += len(line)
+
+    header = collection.encode() + b":"
+    start = next((i + 1 for i, line in enumerate(lines) if line.rstrip() == header), None)
+    if start is None:
+        return []
+    first = next((i for i in range(start, len(lines)) if _is_content(lines[i])), None)
+    if first is None:
+        return []
+    indent = _indent(lines[first])
+    is_sequence = lines[first][indent:].startswith(b"- ")
+
+    # Entry starts: content lines at the collection's indentation; the
+    # collection ends at the first content line indented less (or a new
+    # top-level key when the sequence sits at column 0)
+    starts = []
+    end = len(lines)
+    for i in range(first, len(lines)):
+        line = lines[i]
+        if not _is_content(line):
+            continue
+        column = _indent(line)
+        if column < indent or (column == indent and is_sequence and not line[column:].startswith(b"- ")):
+            end = i
+            break
+        if column == indent:
+            starts.append(i)
+
+    blocks: List[Tuple[Optional[str], int, int]] = []
+    for number, first_line in enumerate(starts):
+        last_line = starts[number + 1] if number + 1 < len(starts) else end
+        key = None
+        if is_sequence:
+            for line in lines[first_line:last_line]:
+                column = _indent(line)
+                if column in (indent, indent + 2) and (match := BLOCK_KEY_PATTERN.match(line)):
+                    key = match.group(1)
+                    break
+        elif match := MAPPING_KEY_PATTERN.match(lines[first_line]):
+            key = match.group(1)
+        block_end = offsets[last_line] if last_line < len(lines) else len(data)
+        blocks.append((key.decode("utf-8") if key else None, offsets[first_line], block_end - offsets[first_line]))
+    return blocks
+
+
+def scan_blocks(data: bytes, collection: str) -> Dict[str, List[int]]:
+    """
+    Task key -> [offset, length] for the entries of `collection` (see iter_blocks).
+
+    Entries whose key cannot be read off the raw lines are skipped (lookups
+    of them fall back to a full load).
+    """
+    return {key: [offset, length] for key, offset, length in iter_blocks(data, collection) if key}
+
+
+def index_file(path: Path, collection: str) -> Dict:
+    """Index entry for one file: its signature plus [offset, length, sha256] per task key."""
+    stat = path.stat()
+    data = path.read_bytes()
+    blocks = {}
+    for key, (offset, length) in scan_blocks(data, collection).items():
+        blocks[key] = [offset, length, hashlib.sha256(data[offset:offset + length]).hexdigest()]
+    return {
+        "collection": collection,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "indexed_at": time.time(),
+        "blocks": blocks,
+    }
+
+
+def indexed_files(planning_dir: Path) -> Dict[Path, str]:
+    """Files covered by the index -> the collection they hold."""
+    files = {path: ISSUES for path in sorted((planning_dir / "issues").glob("*.yaml"))}
+    effort_map = planning_dir / "estimates/effort-map.yaml"
+    if effort_map.exists():
+        files[effort_map] = ESTIMATES
+    return files
+
+
+def _is_unchanged(path: Path, entry: Dict) -> bool:
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    if stat.st_size != entry["size"]:
+        return False
+    if stat.st_mtime_ns == entry["mtime_ns"] and entry["indexed_at"] - stat.st_mtime_ns / 1e9 > RACY_WINDOW_SECONDS:
+        return True
+    # Modified around indexing time (or touched): decide by content
+    return hashlib.sha256(path.read_bytes()).hexdigest() == entry["sha256"]
+
+
+class IssueIndex:
+    """Block locations for every task in a planning directory."""
+
+    def __init__(self, planning_dir: Path, files: Optional[Dict[str, Dict]] = None):
+        self.planning_dir = Path(planning_dir)
+        self.files: Dict[str, Dict] = files or {}
+
+    def refresh(self, force: bool = False) -> bool:
+        """Rescan files that were added or changed (all with force); True if anything changed."""
+        current = indexed_files(self.planning_dir)
+        changed = set(self.files) != {str(path) for path in current}
+        files = {}
+        for path, collection in current.items():
+            entry = self.files.get(str(path))
+            if force or not entry or entry.get("collection") != collection or not _is_unchanged(path, entry):
+                entry = index_file(path, collection)
+                changed = True
+            files[str(path)] = entry
+        self.files = files
+        return changed
+
+    def locate(self, task_key: str, collection: str = ISSUES) -> Optional[BlockLocation]:
+        """Block of a task (the last file wins, like a merged load), or None."""
+        location = None
+        for path, entry in self.files.items():
+            block = entry["blocks"].get(task_key) if entry["collection"] == collection else None
+            if block:
+                location = BlockLocation(Path(path), *block)
+        return location
+
+    def keys(self, collection: str = ISSUES) -> List[str]:
+        keys: Dict[str, None] = {}
+        for entry in self.files.values():
+            if entry["collection"] == collection:
+                keys.update(dict.fromkeys(entry["blocks"]))
+        return list(keys)
+
+    def to_json(self) -> Dict:
+        return {"version": INDEX_VERSION, "planning_dir": str(self.planning_dir), "files": self.files}
+
+
+_indexes: Dict[Path, IssueIndex] = {}
+
+
+def load_issue_index(planning_dir: Path = DEFAULT_PLANNING_DIR, rebuild: bool = False) -> IssueIndex:
+    """Index for planning_dir (from memory or the disk cache), with changed files rescanned."""
+    planning_dir = Path(planning_dir)
+    index = _indexes.get(planning_dir)
+    if index is None:
+        cached = read_json_cache(INDEX_CACHE_FILE)
+        if cached and cached.get("version") == INDEX_VERSION and cached.get("planning_dir") == str(planning_dir):
+            index = IssueIndex(planning_dir, cached["files"])
+        else:
+            index = IssueIndex(planning_dir)
+
+    if index.refresh(force=rebuild):
+        try:
+            write_json_cache(INDEX_CACHE_FILE, index.to_json())
+        except OSError as e:
+            print(f"⚠️  Could not cache issue index: {e}", file=sys.stderr)
+    _indexes[planning_dir] = index
+    return index
+
+
+def read_block(location: BlockLocation) -> Optional[bytes]:
+    """The block's bytes, or None if they no longer match the recorded hash."""
+    try:
+        with open(location.path, "rb") as f:
+            f.seek(location.offset)
+            data = f.read(location.length)
+    except OSError:
+        return None
+    if hashlib.sha256(data).hexdigest() != location.sha256:
+        return None
+    return data
+
+
+def _full_load(task_key: str, planning_dir: Path, collection: str) -> Optional[Dict]:
+    """Fallback: the entry from a full load of every file (last file wins)."""
+    found = None
+    for path, file_collection in indexed_files(planning_dir).items():
+        if file_collection != collection:
+            continue
+        data = load_yaml(path) or {}
+        if collection == ESTIMATES:
+            found = (data.get(ESTIMATES) or {}).get(task_key, found)
+            continue
+        for issue in data.get(ISSUES) or []:
+            if issue.get("key") == task_key:
+                found = issue
+    return found
+
+
+def load_entry(task_key: str, planning_dir: Path = DEFAULT_PLANNING_DIR, collection: str = ISSUES) -> Optional[Dict]:
+    """One task's entry from the issue files (ISSUES) or the effort map (ESTIMATES), or None."""
+    planning_dir = Path(planning_dir)
+    location = load_issue_index(planning_dir).locate(task_key, collection)
+    if location is None:
+        return None
+    data = read_block(location)
+    if data is not None:
+        try:
+            parsed = parse_yaml(data, f"{location.path} (bytes {location.offset}-{location.offset + location.length})")
+        except Exception:
+            parsed = None
+        if collection == ISSUES and isinstance(parsed, list) and len(parsed) == 1:
+            if isinstance(parsed[0], dict) and parsed[0].get("key") == task_key:
+                return parsed[0]
+        if collection == ESTIMATES and isinstance(parsed, dict) and list(parsed) == [task_key]:
+            return parsed[task_key]
+    return _full_load(task_key, planning_dir, collection)
+
+
+def load_issue(task_key: str, planning_dir: Path = DEFAULT_PLANNING_DIR) -> Optional[Dict]:
+    """A task's planning/issues/*.yaml entry, or None."""
+    return load_entry(task_key, planning_dir, ISSUES)
+
+
+def load_estimate(task_key: str, planning_dir: Path = DEFAULT_PLANNING_DIR) -> Optional[Dict]:
+    """A task's effort-map.yaml entry, or None."""
+    return load_entry(task_key, planning_dir, ESTIMATES)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up single planning entries by task key")
+    parser.add_argument("task_keys", nargs="*", help="Task keys (e.g. T4)")
+    parser.add_argument("--planning-dir", type=Path, default=DEFAULT_PLANNING_DIR)
+    parser.add_argument("--estimate", action="store_true", help="Look up effort-map.yaml instead of issues/*.yaml")
+    parser.add_argument("--field", help="Print only this field of the entry")
+    parser.add_argument("--rebuild", action="store_true", help="Rescan every file")
+    parser.add_argument("--list", action="store_true", help="Print every indexed block")
+    args = parser.parse_args()
+
+    index = load_issue_index(args.planning_dir, rebuild=args.rebuild)
+    collection = ESTIMATES if args.estimate else ISSUES
+    if args.rebuild:
+        print(f"✅ Indexed {len(index.keys(ISSUES))} issues and {len(index.keys(ESTIMATES))} estimates "
+              f"in {len(index.files)} files", file=sys.stderr)
+
+    if args.list:
+        for key in index.keys(collection):
+            location = index.locate(key, collection)
+            print(f"{key}\t{location.path.name}\t{location.offset}+{location.length}")
+
+    missing = []
+    for task_key in args.task_keys:
+        entry = load_entry(task_key, args.planning_dir, collection)
+        if entry is None:
+            missing.append(task_key)
+        elif args.field:
+            print(entry.get(args.field, ""))
+        else:
+            print(json.dumps(entry, indent=2, default=str))
+    if missing:
+        print(f"❌ Not found in {'effort-map.yaml' if args.estimate else 'planning/issues/'}: {', '.join(missing)}",
+              file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Dependency-Aware Issue Scheduler
+
+Runs one worker per task on a bounded thread pool. A task starts as soon as
+every dependency inside the task set has finished, so independent tasks
+(same dependency depth, separate branches) are created concurrently while
+dependents still see their blockers' issue numbers and node IDs.
+"""
+
+import heapq
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_CONCURRENCY = 4
+
+
+class ThreadBufferedStdout:
+    """
+    sys.stdout proxy that buffers each worker's output and writes it in one piece.
+
+    Keeps the per-task progress lines (printed with end=" ") readable when
+    several tasks run at once.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def begin(self) -> None:
+        self._local.buffer = []
+
+    def end(self) -> None:
+        buffer = getattr(self._local, "buffer", None)
+        self._local.buffer = None
+        if buffer:
+            with self._lock:
+                self._stream.write("".join(buffer))
+                self._stream.flush()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            with self._lock:
+                return self._stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Strongly connected components of graph (node -> successors inside graph).
+
+    Iterative Tarjan, so deep dependency chains don't hit the recursion limit;
+    components come out in reverse topological order (a component after every
+    component it reaches), each as a sorted list of nodes.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    components = []
+
+    for root in sorted(graph):
+        if root in index:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, child_pos = work[-1]
+            if child_pos == 0:
+                index[node] = lowlink[node] = len(index)
+                stack.append(node)
+                on_stack.add(node)
+
+            children = graph[node]
+            if child_pos < len(children):
+                work[-1] = (node, child_pos + 1)
+                child = children[child_pos]
+                if child not in index:
+                    work.append((child, 0))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+
+    return components
+
+
+def run_dependency_ordered(
+    tasks: List[Tuple[str, Dict]],
+    worker: Callable[[str, Dict], Any],
+    max_workers: int = DEFAULT_CONCURRENCY,
+    dependencies: Optional[Callable[[Dict], List[str]]] = None,
+) -> Dict[str, Any]:
+    """
+    Run worker(task_key, task_data) for every task, respecting dependencies.
+
+    Args:
+        tasks: (task_key, task_data) tuples; their order is the tie-breaker
+               among ready tasks (pass topologically sorted tasks)
+        worker: Called once per task; its return value is collected
+        max_workers: Maximum tasks in flight
+        dependencies: Extracts dependency keys from task_data
+                      (default: task_data["dependencies"])
+
+    Returns:
+        Dict of task_key -> worker result (None if the worker raised)
+
+    A dependency cycle is scheduled as one unit: once nothing outside it is
+    pending, its members run one after another in their original order, and
+    tasks that depend on any member wait for the whole cycle.
+    """
+    get_deps = dependencies or (lambda data: data.get("dependencies", []))
+    order = {task_key: index for index, (task_key, _) in enumerate(tasks)}
+    task_map = dict(tasks)
+
+    graph = {
+        task_key: [dep for dep in get_deps(task_data) if dep in task_map and dep != task_key]
+        for task_key, task_data in tasks
+    }
+    # Units: single tasks, or the members of a cycle in original order
+    unit_of: Dict[str, int] = {}
+    members: List[List[str]] = []
+    for component in strongly_connected_components(graph):
+        for task_key in component:
+            unit_of[task_key] = len(members)
+        members.append(sorted(component, key=order.get))
+
+    waiting_on = [0] * len(members)
+    dependents: List[List[int]] = [[] for _ in members]
+    for task_key, deps in graph.items():
+        for dep in set(deps):
+            if unit_of[dep] != unit_of[task_key]:
+                waiting_on[unit_of[task_key]] += 1
+                dependents[unit_of[dep]].append(unit_of[task_key])
+
+    # Ready tasks in original order; a unit releases its next member when the previous one finished
+    ready = [(order[unit[0]], unit[0]) for unit, count in zip(members, waiting_on) if count == 0]
+    heapq.heapify(ready)
+    remaining = [len(unit) for unit in members]
+    results: Dict[str, Any] = {}
+    running: Dict[Future, str] = {}
+
+    original_stdout = sys.stdout
+    output = ThreadBufferedStdout(original_stdout) if max_workers > 1 else None
+
+    def run_task(task_key: str) -> Any:
+        if output:
+            output.begin()
+        try:
+            return worker(task_key, task_map[task_key])
+        finally:
+            if output:
+                output.end()
+
+    if output:
+        sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while ready or running:
+                while ready and len(running) < max_workers:
+                    _, task_key = heapq.heappop(ready)
+                    running[executor.submit(run_task, task_key)] = task_key
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_key = running.pop(future)
+                    try:
+                        results[task_key] = future.result()
+                    except Exception as e:
+                        print(f"   ❌ {task_key} failed: {e}")
+                        results[task_key] = None
+
+                    unit = unit_of[task_key]
+                    remaining[unit] -= 1
+                    if remaining[unit]:
+                        next_key = members[unit][len(members[unit]) - remaining[unit]]
+                        heapq.heappush(ready, (order[next_key], next_key))
+                        continue
+                    for dependent in dependents[unit]:
+                        waiting_on[dependent] -= 1
+                        if waiting_on[dependent] == 0:
+                            first = members[dependent][0]
+                            heapq.heappush(ready, (order[first], first))
+    finally:
+        sys.stdout = original_stdout
+
+    return results
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Markdown -> YAML
+
+Writes edited planning/docs/**/T<n>-*.md back into planning/issues/*.yaml
+(see planning_convert.py). Only docs changed since the last conversion are
+read, and only the tasks that actually changed are rewritten in their file.
+
+Usage:
+    python scripts/markdown-to-yaml.py               # edited docs
+    python scripts/markdown-to-yaml.py T23           # just this task
+    python scripts/markdown-to-yaml.py --dry-run
+"""
+
+from planning_convert import cli, markdown_to_yaml
+
+if __name__ == "__main__":
+    cli(markdown_to_yaml, "Write edited markdown docs back into the planning YAML")
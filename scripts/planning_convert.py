@@ -0,0 +1,743 @@
+#!/usr/bin/env python3
+"""
+Planning YAML <-> Markdown Converter
+
+Engine behind yaml-to-markdown.py and markdown-to-yaml.py: every task in
+planning/issues/*.yaml is mirrored as planning/docs/<milestone>/T<n>-<title>.md
+(YAML frontmatter for the metadata, one "##" section per structured field):
+- Incremental: each doc's frontmatter records source_hash, the hash of the
+  task's "- key:" block it was rendered from (plus the agent content_hash /
+  planning_hash), and render_hash, the hash of the doc as written. YAML ->
+  Markdown re-renders only tasks whose block hash differs from the doc's; Markdown -> YAML skips docs whose size/mtime/hash
+  match the last conversion (planning/.cache/convert.json) without reading them
+- Parallel: renders and parses run in a process pool once a batch is big
+  enough to pay for it (PARALLEL_THRESHOLD); a single edited task converts
+  one file in-process
+- Lossless: sections are parsed back guided by the current YAML value (prose
+  stays prose, checklists become criteria/tasks again); anything markdown
+  cannot represent exactly is kept as a fenced ```yaml block. Changed tasks
+  are written back as their own block (same yaml.dump style as the files),
+  so the rest of the file is untouched
+- Safe: every file is written atomically; a doc edited since it was
+  rendered (its render_hash no longer matches) or not rendered by the
+  converter at all is not overwritten, and a doc rendered from an older YAML
+  block is not written back, unless forced
+
+Usage:
+    from planning_convert import markdown_to_yaml, yaml_to_markdown
+    yaml_to_markdown(planning_dir, keys=["T23"])
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+from cache_utils import CACHE_DIR, atomic_write, read_json_cache, write_json_cache
+from docs_index import doc_key
+from issue_index import ISSUES, iter_blocks
+from planning_yaml import RACY_WINDOW_SECONDS, parse_yaml
+from yaml_patch import render_scalar
+
+CONVERT_VERSION = 1
+CONVERT_CACHE_FILE = CACHE_DIR / "convert.json"
+DEFAULT_PLANNING_DIR = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press")) / "planning"
+
+# Batches smaller than this are converted in-process (a pool costs ~50ms to start)
+PARALLEL_THRESHOLD = 8
+
+# Top-level fields rendered as "## <heading>" sections, in document order;
+# other structured fields get a section named after the field
+SECTIONS = (
+    ("description", "Description"),
+    ("acceptance_criteria", "Acceptance Criteria"),
+    ("technical_notes", "Technical Notes"),
+    ("testing", "Testing"),
+    ("documentation", "Documentation"),
+    ("risks", "Risks"),
+    ("estimates", "Estimates"),
+    ("progress", "Progress"),
+    ("agent_notes", "Agent Notes"),
+)
+# agent_notes fields shown in the frontmatter (and read back from it)
+AGENT_HASH_FIELDS = ("content_hash", "planning_hash")
+SOURCE_HASH_FIELD = "source_hash"
+RENDER_HASH_FIELD = "render_hash"
+
+FRONT_MATTER_PATTERN = re.compile(r"\A---\n(.*?\n)?---\n", re.DOTALL)
+SOURCE_HASH_PATTERN = re.compile(r"""^source_hash:\s*["']?([0-9a-f]+)["']?\s*$""", re.MULTILINE)
+RENDER_HASH_PATTERN = re.compile(r"""^render_hash:\s*["']?([0-9a-f]+)["']?\s*\n""", re.MULTILINE)
+HEADING_PATTERN = re.compile(r"^(#{2,3}) (.+?)\s*$")
+CHECKBOX_PATTERN = re.compile(r"^- \[([ xX])\] (.*)$")
+VERIFICATION_PATTERN = re.compile(r"^\s+- Verification: ?(.*)$")
+BOLD_ITEM_PATTERN = re.compile(r"^- \*\*(.+?)\*\*: ?(.*)$")
+FENCE_OPEN = "```yaml"
+FENCE_CLOSE = "```"
+
+
+class ConvertResult(NamedTuple):
+    converted: List[str]        # task keys written
+    unchanged: int              # tasks/docs skipped as already in sync
+    conflicts: List[str]        # "T23: reason" - left alone (use force)
+
+
+# Hashing and paths
+
+def block_hash(block: bytes) -> str:
+    return hashlib.sha256(block).hexdigest()[:16]
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def doc_hash(text: str) -> str:
+    """Hash of a doc without its render_hash line (what render_hash records when the doc is written)."""
+    match = FRONT_MATTER_PATTERN.match(text)
+    if match:
+        text = RENDER_HASH_PATTERN.sub("", match.group(0), count=1) + text[match.end():]
+    return block_hash(text.encode("utf-8"))
+
+
+def stamp_render_hash(text: str) -> str:
+    """The doc with its render_hash set to the hash of its current content."""
+    match = FRONT_MATTER_PATTERN.match(text)
+    if match is None:
+        return text
+    front = RENDER_HASH_PATTERN.sub("", match.group(0), count=1)
+    text = front + text[match.end():]
+    line = f"{RENDER_HASH_FIELD}: {doc_hash(text)}\n"
+    return front[:-len("---\n")] + line + "---\n" + text[len(front):]
+
+
+def edited_since_render(data: bytes) -> bool:
+    """True unless the doc still hashes to the render_hash it was written with."""
+    text = data.decode("utf-8", errors="replace")
+    match = RENDER_HASH_PATTERN.search(split_frontmatter_text(data))
+    return match is None or match.group(1) != doc_hash(text)
+
+
+def doc_filename(issue: Dict) -> str:
+    """T11 + "Test Environments Setup (Staging + Production)" -> T11-test-environments-setup-(staging-+-production).md"""
+    title = str(issue.get("title") or "untitled").lower().replace(" ", "-").replace("/", "-")
+    return f"{issue['key']}-{title}.md"
+
+
+def milestone_dirname(milestone: str) -> str:
+    """"M0 - Infrastructure & Setup" -> "m0---infrastructure-&-setup"."""
+    return str(milestone or "unassigned").lower().replace(" ", "-").replace("/", "-")
+
+
+def doc_path(docs_dir: Path, issue: Dict) -> Path:
+    return docs_dir / milestone_dirname(issue.get("milestone", "")) / doc_filename(issue)
+
+
+def heading(name: str) -> str:
+    """Section title of a field ("research_findings" -> "Research Findings"); the raw name when that would not map back."""
+    title = " ".join(word.capitalize() for word in name.split("_"))
+    return title if field_name(title) == name else name
+
+
+def field_name(title: str) -> str:
+    return title.strip().lower().replace(" ", "_")
+
+
+def split_frontmatter(text: str) -> Tuple[Optional[Dict], str]:
+    """(frontmatter mapping or None, body) of a markdown document."""
+    match = FRONT_MATTER_PATTERN.match(text)
+    if match is None:
+        return None, text
+    try:
+        data = yaml.safe_load(match.group(1) or "") or {}
+    except yaml.YAMLError:
+        return None, text
+    return (data if isinstance(data, dict) else None), text[match.end():]
+
+
+def split_frontmatter_text(data: bytes) -> str:
+    """The raw frontmatter of a doc ("" when it has none)."""
+    text = data.decode("utf-8", errors="replace")
+    match = FRONT_MATTER_PATTERN.match(text)
+    return match.group(0) if match else ""
+
+
+# Rendering (YAML -> Markdown)
+
+def _is_line(value: Any) -> bool:
+    return isinstance(value, str) and "\n" not in value
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _checklist_style(items: Any) -> Optional[str]:
+    """"criterion" / "task" when a list renders as checkboxes, else None."""
+    if not isinstance(items, list) or not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for style, allowed in (("criterion", {"criterion", "verification", "done"}), ("task", {"task", "done"})):
+        if all(
+            _is_line(item.get(style)) and item[style].strip() == item[style] and item[style]
+            and set(item) <= allowed
+            and _is_line(item.get("verification", "")) and item.get("verification", "x").strip()
+            and isinstance(item.get("done", False), bool)
+            # "- [ ] text" always reads back with done; bold text reads back as a criterion
+            and (style == "criterion" or ("done" in item and not item[style].startswith("**")))
+            for item in items
+        ):
+            return style
+    return None
+
+
+def _is_prose(value: str) -> bool:
+    """Strings that would be misread as markdown structure are fenced instead."""
+    lines = value.strip("\n").splitlines()
+    return not any(line.startswith(("#", FENCE_CLOSE)) for line in lines) and (
+        not lines or not CHECKBOX_PATTERN.match(lines[0])
+    )
+
+
+def _is_bullet(item: Any) -> bool:
+    """Strings that read back unchanged from a "- item" line."""
+    if not _is_line(item) or not item.strip() or item != item.strip():
+        return False
+    line = f"- {item}"
+    return not CHECKBOX_PATTERN.match(line) and not BOLD_ITEM_PATTERN.match(line)
+
+
+def _fenced(value: Any) -> str:
+    return f"{FENCE_OPEN}\n{yaml.dump(value, sort_keys=False, allow_unicode=True)}{FENCE_CLOSE}"
+
+
+def render_value(value: Any, level: int) -> str:
+    """Markdown for one field; level 2 values may use "###" subsections."""
+    if _is_empty(value):
+        return ""
+    if isinstance(value, str):
+        return value.strip("\n") if _is_prose(value) else _fenced(value)
+    style = _checklist_style(value)
+    if style:
+        lines = []
+        for item in value:
+            text = f"**{item[style]}**" if style == "criterion" else item[style]
+            lines.append(f"- [{'x' if item.get('done') else ' '}] {text}")
+            if "verification" in item:
+                lines.append(f"  - Verification: {item['verification']}")
+        return "\n".join(lines)
+    if isinstance(value, list) and all(_is_bullet(item) for item in value):
+        return "\n".join(f"- {item}" for item in value)
+    if isinstance(value, dict) and all(isinstance(name, str) for name in value):
+        scalars = all(not isinstance(item, (dict, list)) and (not isinstance(item, str) or _is_line(item)) for item in value.values())
+        if scalars:
+            return "\n".join(f"- **{heading(str(name))}**: {render_scalar(item)}" for name, item in value.items())
+        if level == 2:
+            parts = []
+            for name, item in value.items():
+                body = render_value(item, 3)
+                parts.append(f"### {heading(name)}\n\n{body}\n" if body else f"### {heading(name)}\n")
+            return "\n".join(parts).rstrip("\n")
+    return _fenced(value)
+
+
+def render_markdown(issue: Dict, source_hash: str) -> str:
+    """The doc for one task: frontmatter (scalar fields + hashes), title, one section per structured field."""
+    agent_notes = issue.get("agent_notes") if isinstance(issue.get("agent_notes"), dict) else None
+    sections = dict(SECTIONS)
+    front: Dict[str, Any] = {}
+    body_fields = []
+    for name, value in issue.items():
+        simple = not isinstance(value, dict) and not (isinstance(value, str) and "\n" in value) and not (
+            isinstance(value, list) and not all(not isinstance(item, (dict, list)) for item in value)
+        )
+        if name not in sections and simple:
+            front[name] = value
+        else:
+            body_fields.append(name)
+    for name in AGENT_HASH_FIELDS:
+        if agent_notes is not None and name in agent_notes:
+            front[name] = agent_notes[name]
+    front[SOURCE_HASH_FIELD] = source_hash
+
+    order = {name: index for index, (name, _) in enumerate(SECTIONS)}
+    body_fields.sort(key=lambda name: order.get(name, len(order)))
+    parts = [f"---\n{yaml.dump(front, sort_keys=False, allow_unicode=True)}---\n", f"# {issue.get('title', issue['key'])}\n"]
+    for name in body_fields:
+        value = issue[name]
+        if name == "agent_notes" and agent_notes is not None:
+            value = {field: item for field, item in agent_notes.items() if field not in AGENT_HASH_FIELDS}
+        body = render_value(value, 2)
+        title = sections.get(name, name)
+        parts.append(f"## {title}\n\n{body}\n" if body else f"## {title}\n")
+    return stamp_render_hash("\n".join(parts))
+
+
+# Parsing (Markdown -> YAML)
+
+def _split_sections(body: str, level: int) -> List[Tuple[str, str]]:
+    """(heading, text) of the sections at `level` ("##" = 2), ignoring headings inside ```yaml fences."""
+    marker = "#" * level
+    sections: List[Tuple[str, List[str]]] = []
+    fenced = False
+    for line in body.splitlines():
+        if (line == FENCE_CLOSE) if fenced else line.startswith(FENCE_OPEN):
+            fenced = not fenced
+        match = None if fenced else HEADING_PATTERN.match(line)
+        if match and match.group(1) == marker:
+            sections.append((match.group(2), []))
+        elif sections:
+            sections[-1][1].append(line)
+    return [(title, "\n".join(lines).strip("\n")) for title, lines in sections]
+
+
+def _match_field(title: str, like: Optional[Dict]) -> str:
+    for name in like or {}:
+        if isinstance(name, str) and (heading(name) == title or name == title):
+            return name
+    return field_name(title) if heading(field_name(title)) == title else title
+
+
+def parse_value(text: str, like: Any = None, level: int = 2) -> Any:
+    """A field back from its markdown, shaped like the current YAML value where that is ambiguous."""
+    stripped = text.strip("\n")
+    lines = stripped.splitlines()
+    if not lines:
+        return type(like)() if isinstance(like, (str, list, dict)) else ""
+    if lines[0] == FENCE_OPEN and lines[-1] == FENCE_CLOSE:
+        return yaml.safe_load("\n".join(lines[1:-1]) + "\n")
+    if isinstance(like, str):
+        return stripped
+    if CHECKBOX_PATTERN.match(lines[0]):
+        items = _parse_checklist(lines, like if isinstance(like, list) else [])
+        if items is not None:
+            return items
+    if all(BOLD_ITEM_PATTERN.match(line) for line in lines):
+        like_dict = like if isinstance(like, dict) else {}
+        result = {}
+        for line in lines:
+            title, raw = BOLD_ITEM_PATTERN.match(line).groups()
+            result[_match_field(title, like_dict)] = yaml.safe_load(raw) if raw.strip() else None
+        return result
+    if level == 2 and any(HEADING_PATTERN.match(line) and line.startswith("### ") for line in lines):
+        like_dict = like if isinstance(like, dict) else {}
+        result = {}
+        for title, section in _split_sections(stripped, 3):
+            name = _match_field(title, like_dict)
+            result[name] = parse_value(section, like_dict.get(name), 3)
+        return result
+    if all(line.startswith("- ") for line in lines):
+        return [line[2:] for line in lines]
+    return stripped
+
+
+def _parse_checklist(lines: List[str], like: List) -> Optional[List[Dict]]:
+    items: List[Dict] = []
+    for line in lines:
+        checkbox = CHECKBOX_PATTERN.match(line)
+        verification = VERIFICATION_PATTERN.match(line)
+        if checkbox:
+            done, text = checkbox.group(1).lower() == "x", checkbox.group(2)
+            previous = like[len(items)] if len(items) < len(like) and isinstance(like[len(items)], dict) else {}
+            if text.startswith("**") and text.endswith("**") and len(text) > 4:
+                item: Dict[str, Any] = {"criterion": text[2:-2]}
+                if done or "done" in previous:
+                    item["done"] = done
+            else:
+                item = {"task": text, "done": done}
+            items.append(item)
+        elif verification and items and "criterion" in items[-1]:
+            items[-1]["verification"] = verification.group(1)
+        elif line.strip():
+            return None
+    return items
+
+
+def parse_markdown(text: str, like: Optional[Dict] = None) -> Tuple[Dict, Optional[str]]:
+    """
+    (issue, source_hash) from a doc; `like` is the current YAML entry.
+
+    Raises ValueError when the doc has no frontmatter or key.
+    """
+    front, body = split_frontmatter(text)
+    if not front or not front.get("key"):
+        raise ValueError("No valid YAML frontmatter found")
+    like = like or {}
+    source_hash = front.pop(SOURCE_HASH_FIELD, None)
+    front.pop(RENDER_HASH_FIELD, None)
+    hashes = {name: front.pop(name) for name in AGENT_HASH_FIELDS if name in front}
+    issue = dict(front)
+    titles = {title: name for name, title in SECTIONS}
+    for title, section in _split_sections(body, 2):
+        name = titles.get(title) or _match_field(title, like)
+        issue[name] = parse_value(section, like.get(name), 2)
+    if hashes:
+        agent_notes = issue.get("agent_notes")
+        issue["agent_notes"] = {**(agent_notes if isinstance(agent_notes, dict) else {}), **hashes}
+    return issue, (str(source_hash) if source_hash is not None else None)
+
+
+def _normalized(value: Any) -> Any:
+    if _is_empty(value):
+        return None
+    if isinstance(value, str):
+        return "\n".join(line.rstrip() for line in value.strip().splitlines())
+    if isinstance(value, dict):
+        return {name: _normalized(item) for name, item in value.items() if not _is_empty(item)}
+    if isinstance(value, list):
+        return [_normalized(item) for item in value]
+    return value
+
+
+def equivalent(a: Any, b: Any) -> bool:
+    """Equal up to markdown round-trip noise (surrounding whitespace, empty vs missing)."""
+    return _normalized(a) == _normalized(b)
+
+
+def merge_value(current: Any, parsed: Any) -> Any:
+    """The parsed value, reusing the current one wherever they are equivalent (keeps YAML key order and formatting)."""
+    if equivalent(current, parsed):
+        return current
+    if isinstance(current, dict) and isinstance(parsed, dict):
+        merged = {name: merge_value(current[name], parsed[name]) for name in current if name in parsed}
+        merged.update((name, value) for name, value in parsed.items() if name not in current)
+        return merged
+    if isinstance(current, list) and isinstance(parsed, list) and len(current) == len(parsed):
+        return [merge_value(old, new) for old, new in zip(current, parsed)]
+    if isinstance(current, str) and isinstance(parsed, str) and current.endswith("\n") and parsed:
+        return parsed + "\n"  # keep block scalars in "|" style
+    return parsed
+
+
+# Workers (module-level so the process pool can pickle them)
+
+def _render_job(job: Tuple[str, bytes, str, str, Optional[str], bool]) -> Dict:
+    """Render one task block to its doc. job = (key, block, yaml path, docs dir, current doc, dry run)."""
+    key, block, source, docs_dir, current, dry_run = job
+    parsed = parse_yaml(block, source)
+    issue = parsed[0] if isinstance(parsed, list) and parsed and isinstance(parsed[0], dict) else None
+    if issue is None:
+        return {"key": key, "error": "block did not parse as an issue"}
+    target = doc_path(Path(docs_dir), issue)
+    data = render_markdown(issue, block_hash(block)).encode("utf-8")
+    if not dry_run:
+        atomic_write(target, data)
+        if current and Path(current) != target:
+            Path(current).unlink(missing_ok=True)
+    return {"key": key, "path": str(target), "sha256": file_hash(data), "removed": current if current and Path(current) != target else None}
+
+
+def _parse_job(job: Tuple[str, str, Optional[bytes], str]) -> Dict:
+    """Parse one doc against its current YAML block. job = (key, doc path, block, yaml path)."""
+    key, path, block, source = job
+    data = Path(path).read_bytes()
+    current = None
+    if block is not None:
+        parsed = parse_yaml(block, source)
+        current = parsed[0] if isinstance(parsed, list) and parsed else None
+    try:
+        issue, source_hash = parse_markdown(data.decode("utf-8"), current)
+    except (ValueError, yaml.YAMLError) as e:
+        return {"key": key, "path": path, "sha256": file_hash(data), "error": str(e)}
+    if str(issue.get("key")) != key:
+        return {"key": key, "path": path, "sha256": file_hash(data), "error": f"frontmatter key {issue.get('key')!r} does not match the file name"}
+    merged = merge_value(current, issue) if current is not None else issue
+    return {
+        "key": key,
+        "path": path,
+        "sha256": file_hash(data),
+        "source_hash": source_hash,
+        "issue": None if current is not None and merged is current else merged,
+    }
+
+
+def run_jobs(worker: Callable, jobs: List, max_workers: Optional[int] = None) -> List[Dict]:
+    """worker over jobs, in a process pool for big batches (results in job order)."""
+    if max_workers == 1 or len(jobs) < PARALLEL_THRESHOLD:
+        return [worker(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(worker, jobs, chunksize=max(1, len(jobs) // ((max_workers or os.cpu_count() or 1) * 4))))
+
+
+# Conversion state
+
+def _load_state(planning_dir: Path) -> Dict:
+    cache = read_json_cache(CONVERT_CACHE_FILE)
+    if not cache or cache.get("version") != CONVERT_VERSION or cache.get("planning_dir") != str(planning_dir):
+        cache = {"version": CONVERT_VERSION, "planning_dir": str(planning_dir), "docs": {}}
+    return cache
+
+
+def _save_state(state: Dict) -> None:
+    try:
+        write_json_cache(CONVERT_CACHE_FILE, state)
+    except OSError as e:
+        print(f"⚠️  Could not save conversion state: {e}", file=sys.stderr)
+
+
+def _record(state: Dict, planning_dir: Path, path: Path, sha: str) -> None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return
+    state["docs"][os.path.relpath(path, planning_dir)] = {
+        "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha, "recorded_at": time.time(),
+    }
+
+
+def _unchanged_on_disk(stat: os.stat_result, entry: Optional[Dict]) -> bool:
+    return bool(entry) and stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"] and (
+        entry["recorded_at"] - stat.st_mtime_ns / 1e9 > RACY_WINDOW_SECONDS
+    )
+
+
+def _issue_blocks(planning_dir: Path) -> Dict[str, Tuple[Path, bytes, int, int]]:
+    """Task key -> (yaml file, file bytes, offset, length) for every issue block."""
+    blocks = {}
+    for path in sorted((planning_dir / "issues").glob("*.yaml")):
+        data = path.read_bytes()
+        for key, offset, length in iter_blocks(data, ISSUES):
+            if key:
+                blocks[key] = (path, data, offset, length)
+    return blocks
+
+
+def _existing_docs(docs_dir: Path) -> Dict[str, Path]:
+    """Task key -> doc path (first one when a key has several)."""
+    docs: Dict[str, Path] = {}
+    if docs_dir.is_dir():
+        for path in sorted(docs_dir.rglob("*.md")):
+            key = doc_key(path.name)
+            if key:
+                docs.setdefault(key, path)
+    return docs
+
+
+# Directions
+
+def yaml_to_markdown(
+    planning_dir: Path = DEFAULT_PLANNING_DIR,
+    keys: Optional[List[str]] = None,
+    force: bool = False,
+    max_workers: Optional[int] = None,
+    dry_run: bool = False,
+) -> ConvertResult:
+    """
+    Render the tasks whose YAML block changed since their doc was written.
+
+    Docs without a source_hash (not rendered by this converter) and docs
+    edited since they were rendered are reported as conflicts unless `force`.
+    """
+    planning_dir = Path(planning_dir).resolve()
+    docs_dir = planning_dir / "docs"
+    state = _load_state(planning_dir)
+    docs = _existing_docs(docs_dir)
+    wanted = {key.upper() for key in keys} if keys else None
+
+    jobs = []
+    unchanged = 0
+    conflicts = []
+    for key, (source, data, offset, length) in _issue_blocks(planning_dir).items():
+        if wanted is not None and key not in wanted:
+            continue
+        block = data[offset:offset + length]
+        current = docs.get(key)
+        if current is not None and not force:
+            text = current.read_bytes()
+            match = SOURCE_HASH_PATTERN.search(split_frontmatter_text(text))
+            if match is None:
+                conflicts.append(f"{key}: {current.name} was not generated by yaml-to-markdown.py (use --force to replace it)")
+                continue
+            if match.group(1) == block_hash(block):
+                unchanged += 1
+                continue
+            if edited_since_render(text):
+                conflicts.append(f"{key}: {current.name} was edited since it was rendered "
+                                 "(run markdown-to-yaml first, or --force)")
+                continue
+        jobs.append((key, block, str(source), str(docs_dir), str(current) if current else None, dry_run))
+
+    converted = []
+    for result in run_jobs(_render_job, jobs, max_workers):
+        if "error" in result:
+            conflicts.append(f"{result['key']}: {result['error']}")
+            continue
+        converted.append(result["key"])
+        if not dry_run:
+            if result["removed"]:
+                state["docs"].pop(os.path.relpath(result["removed"], planning_dir), None)
+            _record(state, planning_dir, Path(result["path"]), result["sha256"])
+    if not dry_run and jobs:
+        _save_state(state)
+    return ConvertResult(converted, unchanged, conflicts)
+
+
+def markdown_to_yaml(
+    planning_dir: Path = DEFAULT_PLANNING_DIR,
+    keys: Optional[List[str]] = None,
+    force: bool = False,
+    max_workers: Optional[int] = None,
+    dry_run: bool = False,
+) -> ConvertResult:
+    """Write back the docs edited since the last conversion (only changed tasks touch the YAML)."""
+    planning_dir = Path(planning_dir).resolve()
+    state = _load_state(planning_dir)
+    blocks = _issue_blocks(planning_dir)
+    wanted = {key.upper() for key in keys} if keys else None
+
+    jobs = []
+    unchanged = 0
+    conflicts = []
+    for key, path in _existing_docs(planning_dir / "docs").items():
+        if wanted is not None and key not in wanted:
+            continue
+        relative = os.path.relpath(path, planning_dir)
+        entry = state["docs"].get(relative)
+        stat = path.stat()
+        if not force and _unchanged_on_disk(stat, entry):
+            unchanged += 1
+            continue
+        data = path.read_bytes()
+        if not force and entry and entry["sha256"] == file_hash(data):
+            _record(state, planning_dir, path, entry["sha256"])
+            unchanged += 1
+            continue
+        match = SOURCE_HASH_PATTERN.search(split_frontmatter_text(data))
+        located = blocks.get(key)
+        if located and match is None:
+            conflicts.append(f"{key}: {path.name} was not generated by yaml-to-markdown.py (regenerate it first)")
+            continue
+        if located and not force and match.group(1) != block_hash(located[1][located[2]:located[2] + located[3]]):
+            conflicts.append(f"{key}: the YAML changed since {path.name} was rendered (use --force to overwrite it)")
+            continue
+        block = located[1][located[2]:located[2] + located[3]] if located else None
+        jobs.append((key, str(path), block, str(located[0]) if located else ""))
+
+    # Parse in parallel, then splice the changed blocks into their files
+    updates: Dict[Path, Dict[str, Dict]] = {}
+    new_tasks: List[Dict] = []
+    parsed = []
+    for result in run_jobs(_parse_job, jobs, max_workers):
+        if "error" in result:
+            conflicts.append(f"{result['key']}: {result['error']}")
+            continue
+        parsed.append(result)
+        if result["issue"] is None:
+            unchanged += 1
+        elif result["key"] in blocks:
+            updates.setdefault(blocks[result["key"]][0], {})[result["key"]] = result["issue"]
+        else:
+            new_tasks.append(result["issue"])
+
+    new_hashes: Dict[str, str] = {}
+    for source, issues in _write_plan(planning_dir, blocks, updates, new_tasks, conflicts).items():
+        data, hashes = issues
+        if not dry_run:
+            atomic_write(source, data)
+        new_hashes.update(hashes)
+
+    converted = []
+    for result in parsed:
+        key = result["key"]
+        path = Path(result["path"])
+        if result["issue"] is not None and key not in new_hashes:
+            continue  # reported as a conflict
+        if key in new_hashes:
+            converted.append(key)
+            if dry_run:
+                continue
+            # The doc now mirrors the new block: point its source_hash at it
+            text = path.read_text(encoding="utf-8")
+            front = split_frontmatter_text(text.encode("utf-8"))
+            line = f"{SOURCE_HASH_FIELD}: {new_hashes[key]}"
+            if SOURCE_HASH_PATTERN.search(front):
+                updated_front = SOURCE_HASH_PATTERN.sub(line, front, count=1)
+            else:
+                updated_front = front[:-len("---\n")] + line + "\n---\n"
+            data = stamp_render_hash(updated_front + text[len(front):]).encode("utf-8")
+            atomic_write(path, data)
+            _record(state, planning_dir, path, file_hash(data))
+        elif not dry_run:
+            _record(state, planning_dir, path, result["sha256"])
+    if not dry_run and (jobs or unchanged):
+        _save_state(state)
+    return ConvertResult(converted, unchanged, conflicts)
+
+
+def _write_plan(
+    planning_dir: Path,
+    blocks: Dict[str, Tuple[Path, bytes, int, int]],
+    updates: Dict[Path, Dict[str, Dict]],
+    new_tasks: List[Dict],
+    conflicts: List[str],
+) -> Dict[Path, Tuple[bytes, Dict[str, str]]]:
+    """New content (and new block hashes) of every issue file that changes."""
+    files: Dict[str, Path] = {}
+    for source, data, _, _ in blocks.values():
+        match = re.search(rb"^milestone:\s*(.+?)\s*$", data, re.MULTILINE)
+        if match:
+            files.setdefault(match.group(1).decode("utf-8").strip("'\""), source)
+    appended: Dict[Path, List[Dict]] = {}
+    for issue in new_tasks:
+        source = files.get(str(issue.get("milestone")))
+        if source is None:
+            conflicts.append(f"{issue['key']}: no issues file for milestone {issue.get('milestone')!r}")
+            continue
+        appended.setdefault(source, []).append(issue)
+
+    plan = {}
+    for source in sorted(set(updates) | set(appended)):
+        data = source.read_bytes()
+        hashes = {}
+        located = sorted(
+            (offset, length, key) for key, offset, length in iter_blocks(data, ISSUES) if key in updates.get(source, {})
+        )
+        for offset, length, key in reversed(located):
+            block = yaml.dump([updates[source][key]], sort_keys=False, allow_unicode=True).encode("utf-8")
+            data = data[:offset] + block + data[offset + length:]
+            hashes[key] = block_hash(block)
+        if appended.get(source):
+            ends = [offset + length for _, offset, length in iter_blocks(data, ISSUES)]
+            end = max(ends) if ends else len(data)
+            added = b""
+            for issue in appended[source]:
+                block = yaml.dump([issue], sort_keys=False, allow_unicode=True).encode("utf-8")
+                hashes[str(issue["key"])] = block_hash(block)
+                added += block
+            data = data[:end] + added + data[end:]
+            data = re.sub(
+                rb"^task_count:\s*(\d+)\s*$",
+                lambda match: b"task_count: " + str(int(match.group(1)) + len(appended[source])).encode(),
+                data, count=1, flags=re.MULTILINE,
+            )
+        plan[source] = (data, hashes)
+    return plan
+
+
+def cli(convert: Callable[..., ConvertResult], description: str) -> None:
+    """Shared command line of yaml-to-markdown.py and markdown-to-yaml.py."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("task_keys", nargs="*", help="Only these tasks (e.g. T23)")
+    parser.add_argument("--planning-dir", type=Path, default=DEFAULT_PLANNING_DIR)
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Convert even unchanged or conflicting tasks")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be converted")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    result = convert(args.planning_dir, args.task_keys or None, args.force, args.jobs, args.dry_run)
+    elapsed = time.perf_counter() - started
+
+    verb = "Would convert" if args.dry_run else "Converted"
+    if result.converted:
+        print(f"✅ {verb} {len(result.converted)} task(s): {', '.join(result.converted)}")
+    print(f"   {result.unchanged} unchanged; {elapsed:.2f}s")
+    for conflict in result.conflicts:
+        print(f"⚠️  {conflict}")
+    if result.conflicts:
+        sys.exit(1)
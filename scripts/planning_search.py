@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Planning Full-Text Search
+
+SQLite FTS5 index (planning/.cache/planning-search.db) over the prose in the
+planning tree, keyed by task:
+- issues/*.yaml: title, description, technical_notes (approach and the rest
+  of its text), agent_notes.research_findings, implementation_approach and
+  design_decisions
+- docs/**/T*.md: the task specs (front matter stripped)
+- Updated incrementally: unchanged files (size/mtime) are skipped; changed
+  issue files are split into their "- key:" blocks and only blocks whose
+  content hash is new are parsed and re-indexed; deleted files drop their rows
+- Results are grouped per task (best BM25 score, title matches weigh more)
+  with highlighted snippets
+
+Python API (for the automation agents):
+    from planning_search import open_search
+    hits = open_search().search("row level security", limit=5)
+    related = open_search().related("T24")
+
+Usage:
+    python scripts/planning_search.py "websocket progress"
+    python scripts/planning_search.py "stripe OR paddle" --raw --kind doc
+    python scripts/planning_search.py --related T57
+    python scripts/planning_search.py --rebuild
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+from cache_utils import CACHE_DIR
+from docs_index import doc_key
+from issue_index import ISSUES, iter_blocks
+from planning_yaml import RACY_WINDOW_SECONDS, parse_yaml
+
+SEARCH_VERSION = 1
+SEARCH_PATH = CACHE_DIR / "planning-search.db"
+DEFAULT_PLANNING_DIR = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press")) / "planning"
+
+ISSUE = "issue"
+DOC = "doc"
+
+# Issue fields whose text is indexed (dotted paths; dicts and lists are flattened)
+ISSUE_TEXT_FIELDS = (
+    "description",
+    "technical_notes",
+    "agent_notes.research_findings",
+    "agent_notes.implementation_approach",
+    "agent_notes.design_decisions",
+)
+# bm25() column weights: task_key, kind (unindexed), title, body
+BM25_WEIGHTS = (0.0, 0.0, 5.0, 1.0)
+# Distinctive terms of a task used to find related ones
+RELATED_TERMS = 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    sha256 TEXT,
+    indexed_at REAL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    task_key TEXT NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_source ON entries (source);
+CREATE INDEX IF NOT EXISTS entries_task ON entries (task_key);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5(
+    task_key UNINDEXED, kind UNINDEXED, title, body, tokenize = 'porter unicode61'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS document_terms USING fts5vocab(documents, 'row');
+CREATE VIRTUAL TABLE IF NOT EXISTS document_instances USING fts5vocab(documents, 'instance');
+"""
+
+FRONT_MATTER_PATTERN = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
+HEADING_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+TITLE_PATTERN = re.compile(r"^title:\s*[\"']?(.*?)[\"']?\s*$", re.MULTILINE)
+
+
+class SearchHit(NamedTuple):
+    """One task in a result list (its best-scoring rows, issue and/or doc)."""
+    key: str
+    title: str
+    score: float                # BM25 (lower is better)
+    snippets: List[str]
+    sources: List[str]          # paths relative to the planning directory
+
+
+def flatten_text(value: Any) -> str:
+    """All strings in a value, one per line (dict keys dropped)."""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return "\n".join(filter(None, (flatten_text(item) for item in value.values())))
+    if isinstance(value, list):
+        return "\n".join(filter(None, (flatten_text(item) for item in value)))
+    return str(value)
+
+
+def issue_text(issue: Dict) -> Tuple[str, str]:
+    """(title, body) indexed for an issue."""
+    parts = []
+    for field in ISSUE_TEXT_FIELDS:
+        value: Any = issue
+        for name in field.split("."):
+            value = value.get(name) if isinstance(value, dict) else None
+        if field == "technical_notes" and isinstance(value, dict):
+            # approach first; files_to_modify etc. add paths worth matching
+            value = [value.get("approach"), {k: v for k, v in value.items() if k != "approach"}]
+        parts.append(flatten_text(value))
+    return str(issue.get("title") or ""), "\n\n".join(filter(None, parts))
+
+
+def doc_text(text: str) -> Tuple[str, str]:
+    """(title, body) indexed for a markdown spec: front matter title or first heading."""
+    front_matter = FRONT_MATTER_PATTERN.match(text)
+    title_match = TITLE_PATTERN.search(front_matter.group(0)) if front_matter else None
+    body = text[front_matter.end():] if front_matter else text
+    if title_match is None:
+        title_match = HEADING_PATTERN.search(body)
+    return (title_match.group(1).strip() if title_match else ""), body
+
+
+def match_expression(query: str, any_term: bool = False) -> str:
+    """FTS5 MATCH expression for plain words: every word quoted, all required unless any_term."""
+    words = re.findall(r"[\w'-]+", query)
+    terms = ['"' + word.replace('"', '""') + '"' for word in words]
+    return (" OR " if any_term else " ").join(terms)
+
+
+def search_sources(planning_dir: Path) -> Dict[Path, str]:
+    """Indexed files -> kind."""
+    files = {path: ISSUE for path in sorted((planning_dir / "issues").glob("*.yaml"))}
+    docs_dir = planning_dir / "docs"
+    if docs_dir.is_dir():
+        for path in sorted(docs_dir.rglob("*.md")):
+            if doc_key(path.name):
+                files[path] = DOC
+    return files
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class PlanningSearch:
+    """Full-text index over the planning prose; update() brings it up to date."""
+
+    def __init__(self, path: Path = SEARCH_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.row_factory = sqlite3.Row
+        version = self._meta("version")
+        if version is not None and version != str(SEARCH_VERSION):
+            self._conn.close()
+            self.path.unlink()
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(SEARCH_VERSION),))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _meta(self, name: str) -> Optional[str]:
+        try:
+            row = self._conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row["value"] if row else None
+
+    # Indexing
+
+    def update(self, planning_dir: Path = DEFAULT_PLANNING_DIR, force: bool = False) -> Tuple[int, int]:
+        """
+        Re-index changed files under planning_dir.
+
+        Returns (files read, entries indexed).
+        """
+        planning_dir = Path(planning_dir).resolve()
+        files = search_sources(planning_dir)
+        known = {row["path"]: row for row in self._conn.execute("SELECT * FROM sources")}
+        files_read = 0
+        entries_indexed = 0
+        with self._conn:
+            for path_name in set(known) - {str(path) for path in files}:
+                self._drop_source(path_name)
+            for path, kind in files.items():
+                entry = known.get(str(path))
+                try:
+                    stat = path.stat()
+                    if not force and entry is not None and self._unchanged(stat, entry):
+                        continue
+                    data = path.read_bytes()
+                except OSError as e:
+                    print(f"⚠️  Could not index {path}: {e}", file=sys.stderr)
+                    continue
+                files_read += 1
+                digest = sha256(data)
+                if force or entry is None or entry["sha256"] != digest:
+                    entries_indexed += self._index_file(path, kind, data, planning_dir)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                    (str(path), stat.st_size, stat.st_mtime_ns, digest, time.time()),
+                )
+        return files_read, entries_indexed
+
+    @staticmethod
+    def _unchanged(stat: os.stat_result, entry: sqlite3.Row) -> bool:
+        # A file modified around indexing time is re-read (its sha decides)
+        return (
+            stat.st_size == entry["size"]
+            and stat.st_mtime_ns == entry["mtime_ns"]
+            and entry["indexed_at"] - stat.st_mtime_ns / 1e9 > RACY_WINDOW_SECONDS
+        )
+
+    def _drop_source(self, path_name: str) -> None:
+        self._conn.execute("DELETE FROM documents WHERE rowid IN (SELECT id FROM entries WHERE source = ?)", (path_name,))
+        self._conn.execute("DELETE FROM entries WHERE source = ?", (path_name,))
+        self._conn.execute("DELETE FROM sources WHERE path = ?", (path_name,))
+
+    def _index_file(self, path: Path, kind: str, data: bytes, planning_dir: Path) -> int:
+        """Replace the rows of one file, re-parsing only entries whose hash is new."""
+        source = str(path)
+        existing = {
+            (row["task_key"], row["sha256"]): row["id"]
+            for row in self._conn.execute("SELECT id, task_key, sha256 FROM entries WHERE source = ?", (source,))
+        }
+        if kind == DOC:
+            key = doc_key(path.name)
+            new = [(key, sha256(data), lambda: doc_text(data.decode("utf-8", errors="replace")))]
+        else:
+            new = self._issue_entries(path, data)
+
+        keep = set()
+        indexed = 0
+        for key, digest, text in new:
+            entry_id = existing.get((key, digest))
+            if entry_id is not None and entry_id not in keep:
+                keep.add(entry_id)
+                continue
+            title, body = text()
+            cursor = self._conn.execute("INSERT INTO entries (source, task_key, sha256) VALUES (?, ?, ?)", (source, key, digest))
+            self._conn.execute(
+                "INSERT INTO documents (rowid, task_key, kind, title, body) VALUES (?, ?, ?, ?, ?)",
+                (cursor.lastrowid, key, kind, title, body),
+            )
+            keep.add(cursor.lastrowid)
+            indexed += 1
+        stale = [entry_id for entry_id in existing.values() if entry_id not in keep]
+        self._conn.executemany("DELETE FROM documents WHERE rowid = ?", [(entry_id,) for entry_id in stale])
+        self._conn.executemany("DELETE FROM entries WHERE id = ?", [(entry_id,) for entry_id in stale])
+        return indexed
+
+    @staticmethod
+    def _issue_entries(path: Path, data: bytes) -> List[Tuple[str, str, Any]]:
+        """(key, block hash, text thunk) per issue; the whole file is parsed when it cannot be split."""
+        blocks = iter_blocks(data, ISSUES)
+        if blocks and all(key for key, _, _ in blocks):
+            def parse(block: bytes):
+                return lambda: issue_text((parse_yaml(block, str(path)) or [{}])[0])
+            return [
+                (key, sha256(data[offset:offset + length]), parse(data[offset:offset + length]))
+                for key, offset, length in blocks
+            ]
+        try:
+            issues = (parse_yaml(data, str(path)) or {}).get("issues") or []
+        except yaml.YAMLError as e:
+            print(f"⚠️  Could not index {path}: {e}", file=sys.stderr)
+            return []
+        return [
+            (str(issue["key"]), sha256(repr(issue).encode("utf-8")), (lambda issue=issue: issue_text(issue)))
+            for issue in issues if isinstance(issue, dict) and issue.get("key")
+        ]
+
+    # Queries
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        kind: Optional[str] = None,
+        any_term: bool = False,
+        raw: bool = False,
+        exclude: Optional[List[str]] = None,
+    ) -> List[SearchHit]:
+        """
+        Tasks matching `query`, best first.
+
+        Plain words are all required (any_term=True: any of them); raw=True
+        passes the query to FTS5 as-is (phrases, OR/NOT, prefix*, NEAR).
+        """
+        expression = query if raw else match_expression(query, any_term)
+        if not expression:
+            return []
+        # Rank first; snippets (the expensive part) only for the rows returned
+        sql = f"""
+            SELECT documents.rowid, documents.task_key, documents.title, entries.source,
+                   bm25(documents, {', '.join(map(str, BM25_WEIGHTS))}) AS score
+            FROM documents JOIN entries ON entries.id = documents.rowid
+            WHERE documents MATCH ?{' AND documents.kind = ?' if kind else ''}
+            ORDER BY score
+        """
+        params: List[Any] = [expression] + ([kind] if kind else [])
+        excluded = set(exclude or [])
+        hits: Dict[str, Dict] = {}
+        rowids: List[Tuple[int, Dict]] = []
+        for row in self._conn.execute(sql, params):
+            key = row["task_key"]
+            if key in excluded:
+                continue
+            hit = hits.get(key)
+            if hit is None:
+                if len(hits) == limit:
+                    continue
+                hit = hits[key] = {"key": key, "title": row["title"], "score": row["score"], "snippets": [], "sources": []}
+            hit["title"] = hit["title"] or row["title"]
+            hit["sources"].append(self._relative(row["source"]))
+            rowids.append((row["rowid"], hit))
+
+        if rowids:
+            snippets = dict(self._conn.execute(
+                f"""
+                SELECT rowid, snippet(documents, -1, '[', ']', ' … ', 12) FROM documents
+                WHERE documents MATCH ? AND rowid IN ({', '.join('?' * len(rowids))})
+                """,
+                [expression] + [rowid for rowid, _ in rowids],
+            ).fetchall())
+            for rowid, hit in rowids:
+                hit["snippets"].append(" ".join(snippets.get(rowid, "").split()))
+        return [SearchHit(**hit) for hit in hits.values()]
+
+    def related(self, task_key: str, limit: int = 5) -> List[SearchHit]:
+        """Tasks sharing the most distinctive terms of `task_key`'s text (excluding itself)."""
+        occurrences: Dict[str, int] = {}
+        for row in self._conn.execute(
+            "SELECT term FROM document_instances WHERE doc IN (SELECT id FROM entries WHERE task_key = ?)",
+            (task_key,),
+        ):
+            occurrences[row["term"]] = occurrences.get(row["term"], 0) + 1
+        if not occurrences:
+            return []
+        # Two scans instead of a join: fts5vocab tables cannot be looked up by term
+        document_counts = {row["term"]: row["doc"] for row in self._conn.execute("SELECT term, doc FROM document_terms")}
+        total = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        # tf-idf over the task's own rows; terms in most documents (or only its own) say nothing
+        weighted = sorted(
+            (count * math.log(total / document_counts[term]), term)
+            for term, count in occurrences.items()
+            if 1 < document_counts.get(term, 0) < total / 2 and len(term) > 2 and not any(c.isdigit() for c in term)
+        )
+        terms = [term for _, term in weighted[-RELATED_TERMS:]]
+        if not terms:
+            return []
+        expression = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        return self.search(expression, limit=limit, raw=True, exclude=[task_key])
+
+    def _relative(self, source: str) -> str:
+        planning_dir = self._meta("planning_dir")
+        if planning_dir and source.startswith(planning_dir + os.sep):
+            return source[len(planning_dir) + 1:]
+        return source
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "files": self._conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0],
+            "entries": self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0],
+            "tasks": self._conn.execute("SELECT COUNT(DISTINCT task_key) FROM entries").fetchone()[0],
+        }
+
+
+def open_search(
+    planning_dir: Path = DEFAULT_PLANNING_DIR,
+    path: Path = SEARCH_PATH,
+    update: bool = True,
+) -> PlanningSearch:
+    """Open the index, bringing it up to date with planning_dir first (unless update=False)."""
+    planning_dir = Path(planning_dir).resolve()
+    index = PlanningSearch(path)
+    if index._meta("planning_dir") != str(planning_dir):
+        with index._conn:
+            for row in index._conn.execute("SELECT path FROM sources").fetchall():
+                index._drop_source(row["path"])
+            index._conn.execute("INSERT OR REPLACE INTO meta VALUES ('planning_dir', ?)", (str(planning_dir),))
+    if update:
+        index.update(planning_dir)
+    return index
+
+
+def search_tasks(query: str, planning_dir: Path = DEFAULT_PLANNING_DIR, limit: int = 10) -> List[SearchHit]:
+    """Tasks matching `query` (see PlanningSearch.search)."""
+    index = open_search(planning_dir)
+    try:
+        return index.search(query, limit=limit)
+    finally:
+        index.close()
+
+
+def related_tasks(task_key: str, planning_dir: Path = DEFAULT_PLANNING_DIR, limit: int = 5) -> List[SearchHit]:
+    """Tasks related to `task_key` (see PlanningSearch.related)."""
+    index = open_search(planning_dir)
+    try:
+        return index.related(task_key, limit=limit)
+    finally:
+        index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search over planning issues and docs")
+    parser.add_argument("query", nargs="?", help="Words to search for")
+    parser.add_argument("--planning-dir", type=Path, default=DEFAULT_PLANNING_DIR)
+    parser.add_argument("--db", type=Path, default=SEARCH_PATH, help="Index path")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--kind", choices=[ISSUE, DOC], help="Only search issues or docs")
+    parser.add_argument("--any", dest="any_term", action="store_true", help="Match any word instead of all")
+    parser.add_argument("--raw", action="store_true", help="Pass the query to FTS5 unchanged")
+    parser.add_argument("--related", metavar="TASK_KEY", help="Tasks related to this one")
+    parser.add_argument("--keys", action="store_true", help="Print task keys only")
+    parser.add_argument("--rebuild", action="store_true", help="Re-index every file")
+    args = parser.parse_args()
+
+    if not args.query and not args.related and not args.rebuild:
+        parser.error("give a query, --related or --rebuild")
+
+    started = time.perf_counter()
+    index = open_search(args.planning_dir, args.db, update=False)
+    files_read, entries_indexed = index.update(args.planning_dir, force=args.rebuild)
+    if args.rebuild or entries_indexed:
+        stats = index.stats()
+        print(f"✅ Indexed {entries_indexed} entr{'y' if entries_indexed == 1 else 'ies'} from {files_read} file(s) "
+              f"({stats['tasks']} tasks, {stats['files']} files) in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    if not args.query and not args.related:
+        return
+
+    try:
+        if args.related:
+            hits = index.related(args.related.upper(), limit=args.limit)
+        else:
+            hits = index.search(args.query, limit=args.limit, kind=args.kind, any_term=args.any_term, raw=args.raw)
+    except sqlite3.OperationalError as e:
+        print(f"❌ Invalid query: {e}", file=sys.stderr)
+        sys.exit(2)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if not hits:
+        print("❌ No matching tasks", file=sys.stderr)
+        sys.exit(1)
+    for hit in hits:
+        if args.keys:
+            print(hit.key)
+            continue
+        print(f"{hit.key}\t{hit.title}\t({', '.join(hit.sources)})")
+        for snippet in hit.snippets[:2]:
+            print(f"    {snippet}")
+    print(f"🔎 {len(hits)} task(s) in {elapsed_ms:.1f}ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Compiled Planning Store
+
+planning/issues/*.yaml and planning/estimates/effort-map.yaml compiled into
+one SQLite database (planning/.cache/planning.db), so scripts query instead
+of loading and scanning every YAML document:
+- tasks: one row per task key (effort-map entry merged with its issue
+  entry), indexed on milestone, iteration, area, priority, AI effectiveness
+  and progress.status; the source entries are kept as JSON
+- dependencies: dependsOn edges (indexed both ways)
+- sources: size/mtime/hash of every compiled file - open_store() rebuilds
+  the database when any of them changed, appeared or disappeared
+
+Usage:
+    python scripts/planning_store.py build
+    python scripts/planning_store.py query --milestone M1 --ai high
+    python scripts/planning_store.py get T24 --field title
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cache_utils import CACHE_DIR
+from planning_yaml import load_yaml
+
+STORE_VERSION = 1
+STORE_PATH = CACHE_DIR / "planning.db"
+DEFAULT_PLANNING_DIR = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press")) / "planning"
+
+SCHEMA = """
+CREATE TABLE meta (
+    name  TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE sources (
+    path     TEXT PRIMARY KEY,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256   TEXT NOT NULL
+);
+CREATE TABLE tasks (
+    key               TEXT PRIMARY KEY,
+    position          INTEGER NOT NULL,  -- effort-map order, then issue-file order
+    title             TEXT,
+    type              TEXT,
+    milestone         TEXT,
+    iteration         TEXT,
+    area              TEXT,
+    priority          TEXT,              -- issue priority (p0-p3)
+    estimate_priority TEXT,              -- effort-map priority (critical/high/medium/low)
+    effort            REAL,
+    estimated_days    REAL,
+    ai_effectiveness  TEXT NOT NULL,     -- high/medium/low/unknown (from the estimate reasoning)
+    status            TEXT,              -- progress.status
+    issue_file        TEXT,              -- issues/*.yaml file name
+    content_hash      TEXT,              -- agent_notes.content_hash
+    planning_hash     TEXT,              -- agent_notes.planning_hash
+    estimate          TEXT,              -- effort-map entry (JSON), NULL if not estimated
+    issue             TEXT               -- issues/*.yaml entry (JSON), NULL if none
+);
+CREATE INDEX tasks_milestone ON tasks (milestone);
+CREATE INDEX tasks_iteration ON tasks (iteration);
+CREATE INDEX tasks_area ON tasks (area);
+CREATE INDEX tasks_priority ON tasks (priority);
+CREATE INDEX tasks_ai_effectiveness ON tasks (ai_effectiveness);
+CREATE INDEX tasks_status ON tasks (status);
+CREATE TABLE dependencies (
+    task_key   TEXT NOT NULL,
+    depends_on TEXT NOT NULL,
+    position   INTEGER NOT NULL,
+    PRIMARY KEY (task_key, depends_on)
+);
+CREATE INDEX dependencies_depends_on ON dependencies (depends_on);
+"""
+
+# Columns that can be filtered on (all indexed)
+FILTER_COLUMNS = ("milestone", "iteration", "area", "priority", "ai_effectiveness", "status")
+
+
+def extract_ai_effectiveness(task_data: Dict) -> str:
+    """Extract AI effectiveness from reasoning field (contains "AI Impact: HIGH/MEDIUM/LOW")."""
+    reasoning = task_data.get("reasoning", "")
+    if "AI Impact: HIGH" in reasoning or "AI effectiveness: HIGH" in reasoning:
+        return "high"
+    elif "AI Impact: MEDIUM" in reasoning:
+        return "medium"
+    elif "AI Impact: LOW" in reasoning:
+        return "low"
+    return "unknown"
+
+
+def source_files(planning_dir: Path) -> List[Path]:
+    """Files compiled into the store (the effort map only if it exists)."""
+    files = sorted((planning_dir / "issues").glob("*.yaml"))
+    effort_map = planning_dir / "estimates/effort-map.yaml"
+    if effort_map.exists():
+        files.insert(0, effort_map)
+    return files
+
+
+def file_signature(path: Path) -> Dict:
+    stat = path.stat()
+    return {
+        "path": str(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+    }
+
+
+def build_store(planning_dir: Path = DEFAULT_PLANNING_DIR, path: Path = STORE_PATH) -> int:
+    """
+    Compile the planning YAML into a fresh database at `path` (replaced atomically).
+
+    Returns the number of tasks stored.
+    """
+    planning_dir = Path(planning_dir)
+    path = Path(path)
+    files = source_files(planning_dir)
+    signatures = [file_signature(source) for source in files]
+
+    effort_map_path = planning_dir / "estimates/effort-map.yaml"
+    estimates = (load_yaml(effort_map_path) or {}).get("estimates", {}) if effort_map_path in files else {}
+    issues: Dict[str, Dict] = {}
+    issue_files: Dict[str, str] = {}
+    for source in files:
+        if source == effort_map_path:
+            continue
+        for issue in (load_yaml(source) or {}).get("issues", []):
+            if issue.get("key"):
+                issues[issue["key"]] = issue
+                issue_files[issue["key"]] = source.name
+
+    rows = []
+    edges = []
+    for position, key in enumerate(list(estimates) + [key for key in issues if key not in estimates]):
+        estimate = estimates.get(key)
+        issue = issues.get(key)
+        merged = {**(issue or {}), **(estimate or {})}
+        progress = (issue or {}).get("progress") or {}
+        agent_notes = (issue or {}).get("agent_notes") or {}
+        rows.append((
+            key, position, merged.get("title"), (issue or {}).get("type"), merged.get("milestone"),
+            merged.get("iteration"), (issue or {}).get("area"), (issue or {}).get("priority"),
+            (estimate or {}).get("priority"), merged.get("effort"), (estimate or {}).get("estimated_days"),
+            extract_ai_effectiveness(estimate or {}), progress.get("status") if isinstance(progress, dict) else None,
+            issue_files.get(key), agent_notes.get("content_hash", ""), agent_notes.get("planning_hash", ""),
+            json.dumps(estimate, default=str) if estimate is not None else None,
+            json.dumps(issue, default=str) if issue is not None else None,
+        ))
+        for index, dependency in enumerate(dict.fromkeys((issue or {}).get("dependsOn") or [])):
+            edges.append((key, dependency, index))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_name)
+        with conn:
+            conn.executescript(SCHEMA)
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("version", str(STORE_VERSION)),
+                ("planning_dir", str(planning_dir.resolve())),
+            ])
+            conn.executemany("INSERT INTO sources VALUES (:path, :size, :mtime_ns, :sha256)", signatures)
+            conn.executemany(f"INSERT INTO tasks VALUES ({', '.join('?' * 18)})", rows)
+            conn.executemany("INSERT INTO dependencies VALUES (?, ?, ?)", edges)
+        conn.close()
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    return len(rows)
+
+
+class PlanningStore:
+    """Read-only queries against a compiled planning database."""
+
+    def __init__(self, path: Path = STORE_PATH):
+        self.path = Path(path)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.row_factory = sqlite3.Row
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def meta(self, name: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row["value"] if row else None
+
+    def is_current(self, planning_dir: Path) -> bool:
+        """True when the database was built from the current planning files (stat first, hash on mismatch)."""
+        planning_dir = Path(planning_dir)
+        if self.meta("version") != str(STORE_VERSION) or self.meta("planning_dir") != str(planning_dir.resolve()):
+            return False
+        recorded = {row["path"]: dict(row) for row in self._conn.execute("SELECT * FROM sources")}
+        files = source_files(planning_dir)
+        if {str(source) for source in files} != set(recorded):
+            return False
+        for source in files:
+            entry = recorded[str(source)]
+            stat = source.stat()
+            if stat.st_size != entry["size"]:
+                return False
+            if stat.st_mtime_ns != entry["mtime_ns"] and file_signature(source)["sha256"] != entry["sha256"]:
+                return False
+        return True
+
+    @staticmethod
+    def _task(row: sqlite3.Row) -> Dict[str, Any]:
+        task = dict(row)
+        for column in ("estimate", "issue"):
+            if column in task:
+                task[column] = json.loads(task[column]) if task[column] else None
+        return task
+
+    def task(self, key: str) -> Optional[Dict[str, Any]]:
+        """One task (columns plus decoded "estimate"/"issue" entries), or None."""
+        row = self._conn.execute("SELECT * FROM tasks WHERE key = ?", (key,)).fetchone()
+        return self._task(row) if row else None
+
+    def query(
+        self,
+        keys: Optional[List[str]] = None,
+        milestone_prefix: Optional[str] = None,
+        estimated_only: bool = False,
+        columns: Optional[List[str]] = None,
+        **filters: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Tasks in planning order matching every given filter.
+
+        filters: exact matches on FILTER_COLUMNS (e.g. ai_effectiveness="high");
+        milestone_prefix: milestone starts with this ("M1");
+        estimated_only: only tasks that have an effort-map entry;
+        columns: fetch only these columns (default: all, JSON entries decoded).
+        """
+        clauses = []
+        params: List[Any] = []
+        for column, value in filters.items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"Unknown filter: {column}")
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if milestone_prefix:
+            # Range scan on the milestone index (LIKE would not use it)
+            clauses.append("milestone >= ? AND milestone < ?")
+            params += [milestone_prefix, milestone_prefix + "\U0010ffff"]
+        if keys is not None:
+            clauses.append(f"key IN ({', '.join('?' * len(keys))})")
+            params += list(keys)
+        if estimated_only:
+            clauses.append("estimate IS NOT NULL")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        selected = ", ".join(columns) if columns else "*"
+        rows = self._conn.execute(f"SELECT {selected} FROM tasks {where} ORDER BY position", params)
+        return [self._task(row) for row in rows]
+
+    def estimates(self) -> Dict[str, Dict]:
+        """Task key -> effort-map entry, in effort-map order."""
+        rows = self._conn.execute("SELECT key, estimate FROM tasks WHERE estimate IS NOT NULL ORDER BY position")
+        return {row["key"]: json.loads(row["estimate"]) for row in rows}
+
+    def dependencies(self, key: Optional[str] = None) -> Dict[str, List[str]]:
+        """Task key -> dependsOn keys (every task with an issue entry, or just `key`)."""
+        sql = "SELECT key, depends_on FROM tasks LEFT JOIN dependencies ON task_key = key WHERE issue IS NOT NULL"
+        params: List[Any] = []
+        if key is not None:
+            sql += " AND key = ?"
+            params.append(key)
+        result: Dict[str, List[str]] = {}
+        for row in self._conn.execute(sql + " ORDER BY tasks.position, dependencies.position", params):
+            deps = result.setdefault(row["key"], [])
+            if row["depends_on"] is not None:
+                deps.append(row["depends_on"])
+        return result
+
+    def dependents(self, key: str) -> List[str]:
+        """Tasks that list `key` in dependsOn."""
+        rows = self._conn.execute("SELECT task_key FROM dependencies WHERE depends_on = ? ORDER BY task_key", (key,))
+        return [row["task_key"] for row in rows]
+
+
+def open_store(
+    planning_dir: Path = DEFAULT_PLANNING_DIR,
+    path: Path = STORE_PATH,
+    rebuild: bool = True,
+) -> PlanningStore:
+    """Open the store, (re)building it first when missing or stale (unless rebuild=False)."""
+    path = Path(path)
+    if path.exists():
+        store = PlanningStore(path)
+        try:
+            if not rebuild or store.is_current(planning_dir):
+                return store
+        except sqlite3.DatabaseError:
+            pass
+        store.close()
+    build_store(planning_dir, path)
+    return PlanningStore(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile and query the planning store")
+    parser.add_argument("--planning-dir", type=Path, default=DEFAULT_PLANNING_DIR)
+    parser.add_argument("--db", type=Path, default=STORE_PATH, help="Store path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("build", help="Compile the planning YAML (always rebuilds)")
+
+    query = commands.add_parser("query", help="List matching tasks")
+    query.add_argument("--milestone", help="Milestone prefix (e.g. M1)")
+    query.add_argument("--ai", dest="ai_effectiveness", choices=["high", "medium", "low", "unknown"])
+    for column in ("iteration", "area", "priority", "status"):
+        query.add_argument(f"--{column}")
+    query.add_argument("--estimated", action="store_true", help="Only tasks in effort-map.yaml")
+    query.add_argument("--keys", action="store_true", help="Print task keys only")
+
+    get = commands.add_parser("get", help="Print one task as JSON (exit 1 if unknown)")
+    get.add_argument("task_key")
+    get.add_argument("--field", help="Print only this column")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        count = build_store(args.planning_dir, args.db)
+        print(f"✅ Compiled {count} tasks into {args.db}")
+        return
+
+    store = open_store(args.planning_dir, args.db)
+    if args.command == "get":
+        task = store.task(args.task_key)
+        if task is None:
+            print(f"❌ Task {args.task_key} not found", file=sys.stderr)
+            sys.exit(1)
+        print(task.get(args.field) if args.field else json.dumps(task, indent=2))
+        return
+
+    tasks = store.query(
+        milestone_prefix=args.milestone,
+        estimated_only=args.estimated,
+        **{column: getattr(args, column) for column in FILTER_COLUMNS if column != "milestone"},
+    )
+    for task in tasks:
+        print(task["key"] if args.keys else f"{task['key']}\t{task['milestone']}\t{task['title']}")
+
+
+if __name__ == "__main__":
+    main()
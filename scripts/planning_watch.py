@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Planning File Watcher
+
+Change notifications for the files the issue sync reads, used by
+`create-issues-api.py --watch`:
+- planning/issues/*.yaml, planning/estimates/effort-map.yaml,
+  planning/milestones.yaml, planning/labels.yaml and planning/docs/**/*.md
+- inotify on Linux (directory watches, so editors that save via a temp file
+  and rename are seen too); polling of file mtimes elsewhere or on request
+- Debouncing: a burst of saves is reported once, after the files have been
+  quiet for a moment (bounded, so a file rewritten nonstop is still synced)
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+DEFAULT_DEBOUNCE_SECONDS = 1.0
+DEFAULT_POLL_INTERVAL = 1.0
+MAX_DEBOUNCE_FACTOR = 10  # flush after debounce * factor even if edits keep coming
+
+WATCHED_FILES = {"milestones.yaml", "labels.yaml", "estimates/effort-map.yaml"}
+WATCHED_DIRECTORIES = ("", "issues", "estimates", "docs")
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_watched(planning_dir: Path, path: Path) -> bool:
+    """True for the planning files the sync reads (editor temp and hidden files excluded)."""
+    try:
+        relative = Path(path).relative_to(planning_dir)
+    except ValueError:
+        return False
+    if not relative.parts or relative.name.startswith((".", "#")) or relative.name.endswith("~"):
+        return False
+    if relative.as_posix() in WATCHED_FILES:
+        return True
+    if relative.parts[0] == "issues":
+        return len(relative.parts) == 2 and relative.suffix == ".yaml"
+    return relative.parts[0] == "docs" and relative.suffix == ".md"
+
+
+def is_docs_path(planning_dir: Path, path: Path) -> bool:
+    """True for planning/docs and anything below it."""
+    try:
+        return Path(path).relative_to(planning_dir).parts[:1] == ("docs",)
+    except ValueError:
+        return False
+
+
+def watched_files(planning_dir: Path) -> Iterator[Path]:
+    """Every watched file that currently exists."""
+    for name in sorted(WATCHED_FILES):
+        if (planning_dir / name).is_file():
+            yield planning_dir / name
+    yield from sorted((planning_dir / "issues").glob("*.yaml"))
+    yield from sorted((planning_dir / "docs").rglob("*.md"))
+
+
+class PollingWatcher:
+    """Detects changes by comparing (mtime, size) of the watched files every interval."""
+
+    def __init__(self, planning_dir: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.planning_dir = Path(planning_dir)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for path in watched_files(self.planning_dir):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: Optional[float]) -> Set[Path]:
+        """Changed paths (created, modified or deleted); waits up to `timeout` (None: until a change)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            wait = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watches on the planning directories (docs/ recursively, new subdirectories included)."""
+
+    def __init__(self, planning_dir: Path):
+        self.planning_dir = Path(planning_dir)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories: Dict[int, Path] = {}
+        for name in WATCHED_DIRECTORIES:
+            directory = self.planning_dir / name
+            if name == "docs":
+                self._watch_tree(directory)
+            else:
+                self._watch(directory)
+
+    def _watch(self, directory: Path) -> None:
+        if not directory.is_dir():
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._directories[wd] = directory
+
+    def _watch_tree(self, directory: Path) -> None:
+        if not directory.is_dir():
+            return
+        self._watch(directory)
+        for child in directory.rglob("*"):
+            if child.is_dir():
+                self._watch(child)
+
+    def poll(self, timeout: Optional[float]) -> Set[Path]:
+        """Changed paths seen within `timeout` seconds (None: wait for the first relevant event)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return set()
+            changed = self._read_events()
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def _read_events(self) -> Set[Path]:
+        changed: Set[Path] = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0")
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped - report everything so the caller re-parses it all
+                changed.update(watched_files(self.planning_dir))
+                continue
+            if mask & IN_IGNORED:
+                self._directories.pop(wd, None)
+                continue
+            directory = self._directories.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                # Docs subdirectory added/removed/renamed: reported as the directory itself
+                if is_docs_path(self.planning_dir, path):
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._watch_tree(path)
+                    changed.add(path)
+                continue
+            if is_watched(self.planning_dir, path):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def create_watcher(planning_dir: Path, polling: bool = False, interval: float = DEFAULT_POLL_INTERVAL):
+    """inotify watcher on Linux (unless `polling`), otherwise a PollingWatcher."""
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(planning_dir)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}) - polling every {interval:.1f}s")
+    return PollingWatcher(planning_dir, interval)
+
+
+def wait_for_changes(
+    watcher,
+    debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+    max_delay: Optional[float] = None,
+) -> Set[Path]:
+    """
+    Block until planning files change, then keep collecting until they have
+    been quiet for `debounce` seconds (at most `max_delay` after the first change).
+    """
+    changed: Set[Path] = set()
+    while not changed:
+        changed = watcher.poll(None)
+    max_delay = debounce * MAX_DEBOUNCE_FACTOR if max_delay is None else max_delay
+    flush_at = time.monotonic() + max_delay
+    while True:
+        quiet = min(debounce, flush_at - time.monotonic())
+        if quiet <= 0:
+            break
+        more = watcher.poll(quiet)
+        if not more:
+            break
+        changed |= more
+    return changed
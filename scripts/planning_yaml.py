@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Planning YAML Loader
+
+Shared yaml.safe_load replacement for the planning files (issues/*.yaml,
+effort-map.yaml, milestones.yaml, labels.yaml):
+- Parses with libyaml's CSafeLoader when PyYAML was built with it (several
+  times faster than the pure-Python SafeLoader), SafeLoader otherwise
+- Caches each parsed file as a pickle in planning/.cache/yaml/, keyed by
+  path, size, mtime and content hash: an unchanged file is served from the
+  pickle without parsing, a file whose mtime changed but content did not
+  (checkout, touch) is re-validated by hash, anything else is re-parsed
+- Every call returns fresh objects, so callers may mutate what they get
+
+Usage:
+    python scripts/planning_yaml.py planning/issues/*.yaml   # cold vs warm load times
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+from cache_utils import CACHE_DIR, atomic_write, remove_cache
+
+YAML_CACHE_DIR = CACHE_DIR / "yaml"
+CACHE_VERSION = 1
+
+# libyaml-backed loader when available
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+USING_LIBYAML = SafeLoader is not yaml.SafeLoader
+
+# A file modified within this many seconds of being cached could change again
+# without its mtime moving (coarse timestamps) - such entries are checked by hash
+RACY_WINDOW_SECONDS = 2.0
+
+
+def parse_yaml(data: bytes, name: str = "<planning yaml>") -> Any:
+    """Parse a YAML document with the fastest available safe loader (`name` appears in parse errors)."""
+    stream = io.BytesIO(data)
+    stream.name = name
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def cache_path(path: Path) -> Path:
+    """Pickle file caching the parsed form of `path`."""
+    digest = hashlib.sha1(str(Path(path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return YAML_CACHE_DIR / f"{Path(path).name}-{digest}.pickle"
+
+
+def _read_entry(path: Path) -> Optional[Dict]:
+    try:
+        with open(cache_path(path), "rb") as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+        return None
+    return entry
+
+
+def _write_entry(path: Path, stat: os.stat_result, digest: str, data: Any) -> None:
+    entry = {
+        "version": CACHE_VERSION,
+        "path": str(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest,
+        "cached_at": time.time(),
+        "data": data,
+    }
+    try:
+        atomic_write(cache_path(path), pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+    except (OSError, pickle.PicklingError) as e:
+        print(f"⚠️  Could not cache parsed {path}: {e}", file=sys.stderr)
+
+
+def load_yaml(path: Path, use_cache: bool = True) -> Any:
+    """
+    yaml.safe_load() of a file, served from the parse cache when the file is unchanged.
+
+    Raises the same errors as open() + yaml.safe_load().
+    """
+    path = Path(path)
+    stat = path.stat()
+    entry = _read_entry(path) if use_cache else None
+
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        if entry["cached_at"] - stat.st_mtime_ns / 1e9 > RACY_WINDOW_SECONDS:
+            return entry["data"]
+
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if entry and entry["sha256"] == digest:
+        data = entry["data"]
+    else:
+        data = parse_yaml(raw, str(path))
+    if use_cache:
+        _write_entry(path, stat, digest, data)
+    return data
+
+
+def clear_yaml_cache(path: Optional[Path] = None) -> None:
+    """Drop the cached parse of one file, or of every file."""
+    if path is not None:
+        remove_cache(cache_path(path))
+        return
+    for cached in YAML_CACHE_DIR.glob("*.pickle"):
+        remove_cache(cached)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time planning YAML loads (cold parse vs warm cache)")
+    parser.add_argument("files", nargs="+", type=Path)
+    args = parser.parse_args()
+
+    print(f"📄 Loader: {'libyaml CSafeLoader' if USING_LIBYAML else 'pure-Python SafeLoader (libyaml unavailable)'}")
+    for label, prepare in (("cold", clear_yaml_cache), ("warm", lambda: None)):
+        prepare()
+        started = time.perf_counter()
+        for path in args.files:
+            load_yaml(path)
+        print(f"   {label}: {(time.perf_counter() - started) * 1000:8.1f} ms for {len(args.files)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Phase Profiling for the Planning Scripts
+
+Shared `--profile` option for create-issues-api.py, create-github-issues.py,
+automation/task-automation-agent.py and generate_tests_from_scenarios.py:
+- `with phase("yaml_load"):` times a phase (wall and CPU time, call count);
+  a no-op unless profiling was enabled
+- Optional whole-run cProfile (`--profile cprofile`, also saved as .pstats;
+  every thread gets its own profiler, merged into one report, so phases run
+  by worker threads such as issue creation show up) or a built-in stack sampler (`--profile sampling`, also saved as folded
+  stacks for flamegraph tools)
+- One JSON report per run (planning/.cache/profiles/ unless --profile-output
+  is given) plus a line in profiles/history.jsonl, so phase times can be
+  compared across runs as the backlog grows
+"""
+
+import atexit
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from cache_utils import CACHE_DIR, atomic_write
+
+PROFILE_DIR = CACHE_DIR / "profiles"
+HISTORY_FILE = PROFILE_DIR / "history.jsonl"
+PROFILE_MODES = ("phases", "cprofile", "sampling")
+
+SAMPLE_INTERVAL_SECONDS = 0.005
+TOP_FUNCTIONS = 30
+TOP_STACKS = 30
+
+
+class StackSampler:
+    """Background thread sampling every thread's stack (folded "a;b;c" stacks with counts)."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class PhaseProfiler:
+    """Per-phase wall/CPU timings for one script run, plus the optional whole-run profiler."""
+
+    def __init__(self, script: str, mode: str = "phases", output: Optional[Path] = None):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode} (expected one of {', '.join(PROFILE_MODES)})")
+        self.script = script
+        self.mode = mode
+        self.started_at = datetime.now(timezone.utc)
+        stamp = self.started_at.strftime("%Y%m%d-%H%M%S")
+        self.output = Path(output) if output else PROFILE_DIR / f"{script}-{stamp}.json"
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.counts: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+        self._cprofile = cProfile.Profile() if mode == "cprofile" else None
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._sampler = StackSampler() if mode == "sampling" else None
+        if self._cprofile:
+            self._cprofile.enable()
+            threading.setprofile(self._profile_thread)
+        if self._sampler:
+            self._sampler.start()
+
+    def _profile_thread(self, frame, event, arg) -> None:
+        """threading.setprofile hook: each new thread enables its own cProfile (merged in finish())."""
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return  # Python 3.12+: one active profiler already sees every thread
+        with self._lock:
+            self._thread_profiles.append(profile)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase; repeated phases (one LLM call per task) accumulate."""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            with self._lock:
+                entry = self.phases.setdefault(name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0,
+                                                      "max_wall_seconds": 0.0})
+                entry["calls"] += 1
+                entry["wall_seconds"] += wall
+                entry["cpu_seconds"] += cpu
+                entry["max_wall_seconds"] = max(entry["max_wall_seconds"], wall)
+
+    def count(self, name: str, value: Any) -> None:
+        """Record a size (tasks, edges, files) so timings can be compared against backlog growth."""
+        with self._lock:
+            self.counts[name] = value
+
+    def finish(self) -> Dict[str, Any]:
+        """Stop the profilers and write the report (and history line). Returns the report."""
+        wall = time.perf_counter() - self._wall_start
+        report: Dict[str, Any] = {
+            "script": self.script,
+            "argv": sys.argv[1:],
+            "started_at": self.started_at.isoformat(),
+            "mode": self.mode,
+            "python": platform.python_version(),
+            "wall_seconds": wall,
+            "cpu_seconds": time.process_time() - self._cpu_start,
+            "counts": dict(self.counts),
+            "phases": dict(self.phases),
+        }
+
+        if self._cprofile:
+            self._cprofile.disable()
+            threading.setprofile(None)
+            stats = pstats.Stats(self._cprofile, stream=io.StringIO())
+            with self._lock:
+                for profile in self._thread_profiles:
+                    stats.add(profile)
+            stats_path = self.output.with_suffix(".pstats")
+            stats_path.parent.mkdir(parents=True, exist_ok=True)
+            stats.dump_stats(str(stats_path))
+            report["cprofile"] = {
+                "stats_file": str(stats_path),
+                "threads": 1 + len(self._thread_profiles),
+                "top": top_functions(stats),
+            }
+        if self._sampler:
+            self._sampler.stop()
+            folded_path = self.output.with_suffix(".folded")
+            atomic_write(folded_path, self._sampler.folded())
+            report["sampling"] = {
+                "folded_file": str(folded_path),
+                "interval_seconds": self._sampler.interval,
+                "samples": sum(self._sampler.samples.values()),
+                "top_stacks": [
+                    {"stack": stack, "samples": count} for stack, count in self._sampler.samples.most_common(TOP_STACKS)
+                ],
+            }
+
+        atomic_write(self.output, json.dumps(report, indent=2))
+        history = {key: report[key] for key in ("script", "started_at", "mode", "wall_seconds", "counts")}
+        history["phases"] = {name: round(entry["wall_seconds"], 4) for name, entry in self.phases.items()}
+        history["report"] = str(self.output)
+        HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(history) + "\n")
+        return report
+
+    def print_summary(self) -> None:
+        wall = time.perf_counter() - self._wall_start
+        print(f"\n⏱️  Profile ({self.script}, {wall:.2f}s total):")
+        for name, entry in sorted(self.phases.items(), key=lambda item: -item[1]["wall_seconds"]):
+            calls = f" ({entry['calls']}x)" if entry["calls"] > 1 else ""
+            print(f"   {entry['wall_seconds']:>8.3f}s  cpu {entry['cpu_seconds']:>7.3f}s  {name}{calls}")
+
+
+def top_functions(stats: pstats.Stats, limit: int = TOP_FUNCTIONS) -> list:
+    """Functions with the most cumulative time: [{function, calls, total_seconds, cumulative_seconds}]."""
+    rows = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in stats.stats.items():
+        rows.append({
+            "function": f"{name} ({os.path.basename(filename)}:{line})",
+            "calls": calls,
+            "total_seconds": total,
+            "cumulative_seconds": cumulative,
+        })
+    rows.sort(key=lambda row: -row["cumulative_seconds"])
+    return rows[:limit]
+
+
+_profiler: Optional[PhaseProfiler] = None
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a phase when profiling is enabled (no-op otherwise)."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.phase(name):
+        yield
+
+
+def record_count(name: str, value: Any) -> None:
+    """Record a size in the profile report when profiling is enabled."""
+    if _profiler is not None:
+        _profiler.count(name, value)
+
+
+def add_profile_arguments(parser) -> None:
+    """Add --profile [phases|cprofile|sampling] and --profile-output to an argparse parser."""
+    parser.add_argument("--profile", nargs="?", const="phases", choices=PROFILE_MODES, default=None,
+                        help="Time each phase and write a JSON report (cprofile/sampling also profile the whole run, "
+                             "worker threads included)")
+    parser.add_argument("--profile-output", type=Path, default=None,
+                        help=f"Profile report path (default: {PROFILE_DIR}/<script>-<timestamp>.json)")
+
+
+def start_profiling(args, script: str) -> Optional[PhaseProfiler]:
+    """Enable profiling when --profile was given; the report is written when the process exits."""
+    global _profiler
+    if not getattr(args, "profile", None):
+        return None
+    _profiler = PhaseProfiler(script, args.profile, getattr(args, "profile_output", None))
+
+    def finish() -> None:
+        _profiler.print_summary()
+        _profiler.finish()
+        print(f"💾 Profile written to {_profiler.output}")
+
+    atexit.register(finish)
+    return _profiler
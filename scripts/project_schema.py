@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+ProjectV2 Schema Discovery
+
+One GraphQL query resolves every ID the issue sync needs (repositories with
+more than 100 labels/milestones/issue types page on with follow-up queries):
+- Repository node ID, labels, milestones and issue types
+- Project node ID, fields, single-select options and iterations
+
+The result is cached on disk (planning/.cache) with a TTL, so a normal run
+makes no lookup round trips. Callers invalidate the cache when the API
+answers "not found" for a cached ID.
+"""
+
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cache_utils import CACHE_DIR, read_json_cache, remove_cache, write_json_cache
+from github_transport import graphql_call
+
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+SCHEMA_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) { pageInfo { hasNextPage endCursor } nodes { id name } }
+    milestones(first: 100, states: [OPEN, CLOSED]) { pageInfo { hasNextPage endCursor } nodes { id number title } }
+    issueTypes(first: 100) { pageInfo { hasNextPage endCursor } nodes { id name } }
+    owner {
+      ... on Organization { projectV2(number: $number) { ...ProjectSchema } }
+      ... on User { projectV2(number: $number) { ...ProjectSchema } }
+    }
+  }
+  rateLimit { cost limit remaining resetAt }
+}
+
+fragment ProjectSchema on ProjectV2 {
+  id
+  title
+  fields(first: 50) {
+    nodes {
+      ... on ProjectV2FieldCommon { id name dataType }
+      ... on ProjectV2SingleSelectField { options { id name } }
+      ... on ProjectV2IterationField {
+        configuration {
+          iterations { id title startDate }
+          completedIterations { id title startDate }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Follow-up pages of the repository connections, only for repositories with more
+# than one page of labels/milestones/issue types
+REPOSITORY_CONNECTIONS = {
+    "labels": "labels(first: 100, after: $cursor) { pageInfo { hasNextPage endCursor } nodes { id name } }",
+    "milestones": (
+        "milestones(first: 100, after: $cursor, states: [OPEN, CLOSED]) "
+        "{ pageInfo { hasNextPage endCursor } nodes { id number title } }"
+    ),
+    "issueTypes": "issueTypes(first: 100, after: $cursor) { pageInfo { hasNextPage endCursor } nodes { id name } }",
+}
+
+CONNECTION_PAGE_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) { %s }
+  rateLimit { cost limit remaining resetAt }
+}
+"""
+
+NOT_FOUND_MARKERS = ("could not resolve to", "not found", "does not exist")
+
+
+class ProjectSchema:
+    """Name -> ID lookups over a fetched (or cached) schema document."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+
+    @property
+    def repository_id(self) -> str:
+        return self.data["repository_id"]
+
+    @property
+    def project_id(self) -> str:
+        return self.data["project_id"]
+
+    @property
+    def fetched_at(self) -> float:
+        return self.data.get("fetched_at", 0.0)
+
+    def field(self, name: str) -> Optional[Dict]:
+        """Project field by name (case-insensitive)."""
+        return self.data["fields"].get(name.lower())
+
+    def field_id(self, name: str) -> Optional[str]:
+        field = self.field(name)
+        return field["id"] if field else None
+
+    def option_id(self, field_name: str, option_name: str) -> Optional[str]:
+        """Single-select option ID by field and option name (case-insensitive)."""
+        field = self.field(field_name) or {}
+        for option in field.get("options", []):
+            if option["name"].lower() == option_name.lower():
+                return option["id"]
+        return None
+
+    def iterations(self, field_name: str) -> List[Dict]:
+        """Active and completed iterations of an iteration field ({id, title, startDate})."""
+        return (self.field(field_name) or {}).get("iterations", [])
+
+    def milestone_numbers(self) -> Dict[str, int]:
+        """Milestone title -> number."""
+        return {ms["title"]: ms["number"] for ms in self.data["milestones"]}
+
+    def milestone_ids(self) -> Dict[int, str]:
+        """Milestone number -> node ID."""
+        return {ms["number"]: ms["id"] for ms in self.data["milestones"]}
+
+    def label_ids(self) -> Dict[str, str]:
+        """Label name -> node ID."""
+        return dict(self.data["labels"])
+
+    def issue_type_id(self, name: str) -> Optional[str]:
+        return self.data["issue_types"].get(name.lower())
+
+
+def schema_cache_path(owner: str, repo: str, project_number: int) -> Path:
+    return CACHE_DIR / f"project-schema-{owner}-{repo}-{project_number}.json"
+
+
+def fetch_remaining_nodes(owner: str, repo: str, name: str, connection: Optional[Dict]) -> Optional[List[Dict]]:
+    """
+    All nodes of a repository connection, paging on from the first page
+    returned by the schema query. None when a follow-up page fails.
+    """
+    if not connection:
+        return []
+    nodes = list(connection.get("nodes") or [])
+    page_info = connection.get("pageInfo") or {}
+    while page_info.get("hasNextPage"):
+        response = graphql_call(
+            CONNECTION_PAGE_QUERY % REPOSITORY_CONNECTIONS[name],
+            {"owner": owner, "name": repo, "cursor": page_info.get("endCursor")},
+        )
+        data = response.data.get("data") if isinstance(response.data, dict) else None
+        connection = ((data or {}).get("repository") or {}).get(name)
+        if not connection:
+            print(f"❌ Could not page repository {name}: {response.error or 'empty response'}")
+            return None
+        nodes.extend(connection.get("nodes") or [])
+        page_info = connection.get("pageInfo") or {}
+    return nodes
+
+
+def fetch_project_schema(owner: str, repo: str, project_number: int) -> Optional[Dict[str, Any]]:
+    """Run the introspection query and normalize it into a cacheable document."""
+    response = graphql_call(SCHEMA_QUERY, {"owner": owner, "name": repo, "number": project_number})
+    repository = ((response.data or {}).get("data") or {}).get("repository") if isinstance(response.data, dict) else None
+    project = ((repository or {}).get("owner") or {}).get("projectV2")
+    if not repository or not project:
+        print(f"❌ Could not discover project schema: {response.error or 'project not found'}")
+        return None
+
+    # Past the first page, missing labels would look absent and be dropped from issues
+    labels = fetch_remaining_nodes(owner, repo, "labels", repository["labels"])
+    milestones = fetch_remaining_nodes(owner, repo, "milestones", repository["milestones"])
+    issue_types = fetch_remaining_nodes(owner, repo, "issueTypes", repository.get("issueTypes"))
+    if labels is None or milestones is None or issue_types is None:
+        return None
+
+    fields = {}
+    for node in project["fields"]["nodes"]:
+        if not node.get("id"):
+            continue
+        field = {"id": node["id"], "name": node["name"], "data_type": node.get("dataType")}
+        if "options" in node:
+            field["options"] = node["options"]
+        configuration = node.get("configuration")
+        if configuration:
+            field["iterations"] = configuration.get("iterations", []) + configuration.get("completedIterations", [])
+        fields[node["name"].lower()] = field
+
+    return {
+        "owner": owner,
+        "repo": repo,
+        "project_number": project_number,
+        "fetched_at": time.time(),
+        "repository_id": repository["id"],
+        "project_id": project["id"],
+        "project_title": project.get("title"),
+        "fields": fields,
+        "labels": {label["name"]: label["id"] for label in labels},
+        "milestones": milestones,
+        "issue_types": {issue_type["name"].lower(): issue_type["id"] for issue_type in issue_types},
+    }
+
+
+def load_project_schema(
+    owner: str,
+    repo: str,
+    project_number: int,
+    ttl: float = DEFAULT_TTL_SECONDS,
+    refresh: bool = False,
+) -> Optional[ProjectSchema]:
+    """
+    Return the project schema from the disk cache, fetching it when missing,
+    older than `ttl` seconds, or when `refresh` is set.
+    """
+    path = schema_cache_path(owner, repo, project_number)
+    data = None if refresh else read_json_cache(path, max_age=ttl)
+    if data is None:
+        data = fetch_project_schema(owner, repo, project_number)
+        if data is None:
+            return None
+        write_json_cache(path, data)
+    return ProjectSchema(data)
+
+
+def invalidate_project_schema(owner: str, repo: str, project_number: int) -> None:
+    """Drop the cached schema so the next load fetches it again."""
+    remove_cache(schema_cache_path(owner, repo, project_number))
+
+
+def is_not_found_error(result: Any, error: str = "") -> bool:
+    """True when a GraphQL response says an ID no longer resolves (stale cached schema)."""
+    errors = result.get("errors") if isinstance(result, dict) else None
+    for entry in errors or []:
+        if isinstance(entry, dict) and entry.get("type") == "NOT_FOUND":
+            return True
+    messages = [error] + [str(e.get("message", "")) for e in errors or [] if isinstance(e, dict)]
+    return any(marker in message.lower() for message in messages for marker in NOT_FOUND_MARKERS)
+
+
+def iteration_key_from_title(title: str) -> Optional[str]:
+    """Planning iteration key from an iteration title ("I3 - ML Foundation" -> "I3")."""
+    match = re.match(r"^\s*(I\d+)\b", title)
+    return match.group(1) if match else None
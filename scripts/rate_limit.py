@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+GitHub Rate-Limit Governor
+
+One governor per process, shared by every GitHub API call:
+- Token bucket sized to GitHub's secondary limits (mutations cost 5 points,
+  queries 1; ~2,000 points/minute for GraphQL, ~900 for REST)
+- Primary budget tracking from X-RateLimit-* headers and GraphQL
+  `rateLimit { cost remaining resetAt }` data: once less than 20% of the
+  hourly budget is left, calls are spread over the time until reset, and
+  they pause entirely when the budget is nearly gone
+- Exponential backoff with jitter on secondary limits (403/429, Retry-After,
+  RATE_LIMITED errors); the pause applies to all threads
+"""
+
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Secondary limit budget (points/second) and burst size
+# (MORPHEUS_BUCKET_RATE overrides the rate, e.g. for benchmarks against the fake server)
+BUCKET_RATE = float(os.environ.get("MORPHEUS_BUCKET_RATE", 15.0))
+BUCKET_CAPACITY = 250.0
+QUERY_POINTS = 1.0
+MUTATION_POINTS = 5.0
+
+# Keep this many primary requests/points in reserve before pausing until reset
+PRIMARY_RESERVE = 50
+# Below this share of the hourly limit, spread the remaining calls until reset
+PACING_THRESHOLD = 0.2
+DEFAULT_PRIMARY_LIMIT = 5000
+
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 120.0
+MAX_RETRIES = 5
+
+SECONDARY_LIMIT_MARKERS = (
+    "secondary rate limit",
+    "abuse detection",
+    "rate limit exceeded",
+    "submitted too quickly",
+)
+
+
+class RateLimitGovernor:
+    """Thread-safe token bucket plus primary-budget pacing and shared backoff."""
+
+    def __init__(
+        self,
+        rate: float = BUCKET_RATE,
+        capacity: float = BUCKET_CAPACITY,
+        reserve: int = PRIMARY_RESERVE,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.reserve = reserve
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        # Latest primary budget per resource ("core", "graphql"): (remaining, reset epoch, limit)
+        self.budget: Dict[str, tuple] = {}
+        self.last_graphql_cost: Optional[int] = None
+
+    # -- pacing -------------------------------------------------------------
+
+    def acquire(self, points: float = QUERY_POINTS, resource: str = "core") -> float:
+        """Block until the call may proceed. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                delay = max(self._paused_until - now, self._primary_delay(resource))
+                needed = min(points, self.capacity)
+                if delay <= 0 and self._tokens >= needed:
+                    # Large aliased documents may go into debt rather than wait forever
+                    self._tokens -= points
+                    self._spend_primary(resource)
+                    return waited
+                if delay <= 0:
+                    delay = (needed - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _primary_delay(self, resource: str) -> float:
+        remaining, reset_at, _ = self.budget.get(resource, (None, None, None))
+        if remaining is None:
+            return 0.0
+        seconds_left = reset_at - time.time()
+        if seconds_left <= 0:
+            return 0.0
+        if remaining <= self.reserve:
+            return seconds_left
+        return self._next_slot.get(resource, 0.0) - time.monotonic()
+
+    def _spend_primary(self, resource: str) -> None:
+        remaining, reset_at, limit = self.budget.get(resource, (None, None, None))
+        if remaining is None:
+            return
+        self.budget[resource] = (remaining - 1, reset_at, limit)
+        if remaining < limit * PACING_THRESHOLD:
+            # Budget is getting tight - spread what is left evenly until reset
+            interval = max(0.0, reset_at - time.time()) / max(1, remaining - self.reserve)
+            self._next_slot[resource] = time.monotonic() + interval
+
+    # -- feedback -----------------------------------------------------------
+
+    def observe_headers(self, headers: Dict[str, str]) -> None:
+        """Record X-RateLimit-Remaining / X-RateLimit-Reset from a response."""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        resource = headers.get("x-ratelimit-resource", "core")
+        limit = int(headers.get("x-ratelimit-limit", DEFAULT_PRIMARY_LIMIT))
+        with self._lock:
+            self.budget[resource] = (int(remaining), float(reset), limit)
+
+    def observe_graphql(self, data: Any) -> None:
+        """Record `rateLimit { cost limit remaining resetAt }` when a query selected it."""
+        rate_limit = ((data or {}).get("data") or {}).get("rateLimit") if isinstance(data, dict) else None
+        if not rate_limit or rate_limit.get("remaining") is None:
+            return
+        reset_at = rate_limit.get("resetAt")
+        reset_epoch = (
+            datetime.fromisoformat(reset_at.replace("Z", "+00:00")).timestamp()
+            if reset_at else time.time() + 3600
+        )
+        with self._lock:
+            self.budget["graphql"] = (
+                int(rate_limit["remaining"]),
+                reset_epoch,
+                int(rate_limit.get("limit") or DEFAULT_PRIMARY_LIMIT),
+            )
+            self.last_graphql_cost = rate_limit.get("cost")
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Pause every caller after a secondary limit hit. Returns the pause length."""
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, 1)
+        else:
+            ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+            delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self._tokens = 0.0
+        return delay
+
+
+def is_rate_limited(status: int, headers: Dict[str, str], error: str) -> bool:
+    """Detect primary exhaustion or secondary limit responses."""
+    if status == 429:
+        return True
+    message = error.lower()
+    if status == 403 and (headers.get("retry-after") or headers.get("x-ratelimit-remaining") == "0"):
+        return True
+    return any(marker in message for marker in SECONDARY_LIMIT_MARKERS)
+
+
+def retry_after_seconds(headers: Dict[str, str]) -> Optional[float]:
+    """Seconds to wait according to Retry-After, or until X-RateLimit-Reset when exhausted."""
+    if headers.get("retry-after"):
+        try:
+            return float(headers["retry-after"])
+        except ValueError:
+            return None
+    if headers.get("x-ratelimit-remaining") == "0" and headers.get("x-ratelimit-reset"):
+        return max(0.0, float(headers["x-ratelimit-reset"]) - time.time())
+    return None
+
+
+def graphql_points(query: str) -> float:
+    """Secondary-limit points for a GraphQL document (5 per mutation field)."""
+    if not query.lstrip().startswith("mutation"):
+        return QUERY_POINTS
+    return MUTATION_POINTS * max(1, len(re.findall(r"\(\s*input\s*:", query)))
+
+
+_governor: Optional[RateLimitGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> RateLimitGovernor:
+    """Return the process-wide governor."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = RateLimitGovernor()
+        return _governor
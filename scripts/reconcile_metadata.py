@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Milestone and Label Reconciliation
+
+Makes the repository's milestones and labels match planning/milestones.yaml
+and planning/labels.yaml:
+- One paginated GraphQL sweep fetches every remote milestone (open and
+  closed) and label - both connections page through the same document
+- Diff: create what is missing; update description, due date, state,
+  color in place (a milestone whose title drifted but keeps its "M3" key is
+  renamed rather than recreated); with --prune, close milestones that are
+  no longer planned
+- Changes are applied concurrently through the shared, rate-limited transport
+- Labels are never deleted: the issue sync applies labels (from-planning,
+  automation:*) that labels.yaml does not list
+
+Usage:
+    python scripts/reconcile_metadata.py --dry-run     # Show the diff
+    python scripts/reconcile_metadata.py --prune
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote
+
+from github_transport import TRANSPORT_MODES, configure as configure_transport, graphql_call, rest_call
+from issue_scheduler import DEFAULT_CONCURRENCY
+from planning_yaml import load_yaml
+
+WORKSPACE_ROOT = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press"))
+MILESTONES_PATH = WORKSPACE_ROOT / "planning/milestones.yaml"
+LABELS_PATH = WORKSPACE_ROOT / "planning/labels.yaml"
+REPO_OWNER = "neutrico"
+REPO_NAME = "morpheus-press"
+
+PAGE_SIZE = 100
+
+# Color for new labels per labels.yaml category (existing labels keep theirs unless labels.yaml sets one)
+CATEGORY_COLORS = {
+    "area": "1d76db",
+    "priority": "d93f0b",
+    "status": "0e8a16",
+}
+DEFAULT_LABEL_COLOR = "ededed"
+
+ACTION_CREATE = "create"
+ACTION_UPDATE = "update"
+ACTION_CLOSE = "close"
+
+
+class MetadataChange(NamedTuple):
+    """One REST write that brings a milestone or label in line with planning."""
+    kind: str    # "milestone" or "label"
+    action: str  # ACTION_CREATE, ACTION_UPDATE or ACTION_CLOSE
+    name: str    # Milestone title / label name as planned
+    method: str
+    endpoint: str
+    payload: Dict
+    detail: str  # Human-readable summary of the change
+
+
+def milestone_key(title: str) -> str:
+    """Stable part of a milestone title: "M3 - Content Generation Pipeline" -> "M3"."""
+    return title.split(" - ", 1)[0].strip().upper()
+
+
+def normalize_due_on(value) -> Optional[str]:
+    """YAML date / ISO timestamp -> "YYYY-MM-DD" (GitHub shifts due_on by the repo timezone, so dates are compared)."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10]
+
+
+def load_planned_milestones(path: Path = MILESTONES_PATH) -> Dict[str, Dict]:
+    """
+    Milestones from milestones.yaml, keyed by title.
+
+    Entries: name, description, state (open/closed), optional due_on.
+    """
+    data = load_yaml(path) or {}
+    milestones = {}
+    for entry in data.get("milestones", []):
+        title = entry.get("name") or entry.get("title")
+        if not title:
+            continue
+        milestones[title] = {
+            "title": title,
+            "description": " ".join(str(entry.get("description") or "").split()),
+            "state": str(entry.get("state") or "open").lower(),
+            "due_on": normalize_due_on(entry.get("due_on") or entry.get("due")),
+        }
+    return milestones
+
+
+def load_planned_labels(path: Path = LABELS_PATH) -> Dict[str, Dict]:
+    """
+    Labels from labels.yaml ("labels: {category: [name | {name, color, description}]}"), keyed by name.
+
+    color/description are None unless labels.yaml sets them.
+    """
+    data = load_yaml(path) or {}
+    labels = {}
+    for category, entries in (data.get("labels") or {}).items():
+        for entry in entries or []:
+            if isinstance(entry, str):
+                entry = {"name": entry}
+            if not entry.get("name"):
+                continue
+            color = entry.get("color")
+            labels[entry["name"]] = {
+                "name": entry["name"],
+                "category": category,
+                "color": str(color).lstrip("#").lower() if color else None,
+                "description": entry.get("description"),
+            }
+    return labels
+
+
+LABELS_SELECTION = """
+    labels(first: %d, after: $labelsAfter) {
+      nodes { name color description }
+      pageInfo { hasNextPage endCursor }
+    }""" % PAGE_SIZE
+
+MILESTONES_SELECTION = """
+    milestones(first: %d, after: $milestonesAfter, states: [OPEN, CLOSED]) {
+      nodes { number title description state dueOn }
+      pageInfo { hasNextPage endCursor }
+    }""" % PAGE_SIZE
+
+
+def metadata_query(labels: bool, milestones: bool) -> str:
+    """Document for one page of the sweep (only the connections that still have pages)."""
+    variables = ["$owner: String!", "$name: String!"]
+    selections = ""
+    if labels:
+        variables.append("$labelsAfter: String")
+        selections += LABELS_SELECTION
+    if milestones:
+        variables.append("$milestonesAfter: String")
+        selections += MILESTONES_SELECTION
+    return f"query({', '.join(variables)}) {{\n  repository(owner: $owner, name: $name) {{{selections}\n  }}\n}}"
+
+
+def fetch_remote_metadata(
+    owner: str = REPO_OWNER,
+    repo: str = REPO_NAME,
+) -> Optional[Tuple[Dict[str, Dict], Dict[str, Dict]]]:
+    """
+    All milestones (by title) and labels (by name) of the repository.
+
+    Returns None when the sweep fails (nothing should be changed then).
+    """
+    milestones: Dict[str, Dict] = {}
+    labels: Dict[str, Dict] = {}
+    cursors = {"labelsAfter": None, "milestonesAfter": None}
+    pending = {"labels": True, "milestones": True}
+
+    while any(pending.values()):
+        variables = {"owner": owner, "name": repo}
+        if pending["labels"]:
+            variables["labelsAfter"] = cursors["labelsAfter"]
+        if pending["milestones"]:
+            variables["milestonesAfter"] = cursors["milestonesAfter"]
+        response = graphql_call(metadata_query(pending["labels"], pending["milestones"]), variables)
+        repository = ((response.data or {}).get("data") or {}).get("repository")
+        if response.error or not repository:
+            print(f"❌ Could not fetch milestones/labels: {response.error or 'repository not found'}")
+            return None
+
+        for connection_name, cursor_name in (("labels", "labelsAfter"), ("milestones", "milestonesAfter")):
+            if not pending[connection_name]:
+                continue
+            connection = repository[connection_name]
+            for node in connection["nodes"]:
+                if connection_name == "labels":
+                    labels[node["name"]] = {
+                        "name": node["name"],
+                        "color": (node.get("color") or "").lower(),
+                        "description": node.get("description") or "",
+                    }
+                else:
+                    milestones[node["title"]] = {
+                        "number": node["number"],
+                        "title": node["title"],
+                        "description": " ".join((node.get("description") or "").split()),
+                        "state": (node.get("state") or "OPEN").lower(),
+                        "due_on": normalize_due_on(node.get("dueOn")),
+                    }
+            page_info = connection["pageInfo"]
+            pending[connection_name] = page_info["hasNextPage"]
+            cursors[cursor_name] = page_info["endCursor"]
+
+    return milestones, labels
+
+
+def plan_milestone_changes(
+    planned: Dict[str, Dict],
+    remote: Dict[str, Dict],
+    owner: str = REPO_OWNER,
+    repo: str = REPO_NAME,
+    prune: bool = False,
+) -> Tuple[List[MetadataChange], Dict[str, int]]:
+    """
+    Milestone writes needed, and planned title -> number for milestones that already exist.
+
+    A planned milestone matches a remote one by title, else by key ("M3"),
+    in which case the remote one is renamed.
+    """
+    changes = []
+    numbers = {}
+    unmatched = dict(remote)
+    by_key = {}
+    for title, milestone in remote.items():
+        by_key.setdefault(milestone_key(title), title)
+
+    for title, milestone in planned.items():
+        remote_title = title if title in unmatched else by_key.get(milestone_key(title))
+        existing = unmatched.pop(remote_title, None) if remote_title else None
+        if existing is None:
+            payload = {"title": title, "description": milestone["description"], "state": milestone["state"]}
+            if milestone["due_on"]:
+                payload["due_on"] = f"{milestone['due_on']}T00:00:00Z"
+            detail = f"due {milestone['due_on']}" if milestone["due_on"] else milestone["state"]
+            changes.append(MetadataChange("milestone", ACTION_CREATE, title, "POST",
+                                          f"/repos/{owner}/{repo}/milestones", payload, detail))
+            continue
+
+        numbers[title] = existing["number"]
+        payload = {}
+        if existing["title"] != title:
+            payload["title"] = title
+        if existing["description"] != milestone["description"]:
+            payload["description"] = milestone["description"]
+        if existing["state"] != milestone["state"]:
+            payload["state"] = milestone["state"]
+        if milestone["due_on"] and existing["due_on"] != milestone["due_on"]:
+            payload["due_on"] = f"{milestone['due_on']}T00:00:00Z"
+        if payload:
+            detail = ", ".join(
+                f"title from '{existing['title']}'" if field == "title" else
+                f"due {existing['due_on'] or 'none'} -> {milestone['due_on']}" if field == "due_on" else
+                f"{existing[field]} -> {milestone[field]}" if field == "state" else field
+                for field in payload
+            )
+            changes.append(MetadataChange("milestone", ACTION_UPDATE, title, "PATCH",
+                                          f"/repos/{owner}/{repo}/milestones/{existing['number']}", payload, detail))
+
+    if prune:
+        for title, existing in sorted(unmatched.items()):
+            if existing["state"] == "open":
+                changes.append(MetadataChange("milestone", ACTION_CLOSE, title, "PATCH",
+                                              f"/repos/{owner}/{repo}/milestones/{existing['number']}",
+                                              {"state": "closed"}, "not in milestones.yaml"))
+    return changes, numbers
+
+
+def plan_label_changes(
+    planned: Dict[str, Dict],
+    remote: Dict[str, Dict],
+    owner: str = REPO_OWNER,
+    repo: str = REPO_NAME,
+) -> List[MetadataChange]:
+    """Label writes needed (names match case-insensitively, like GitHub's)."""
+    changes = []
+    remote_by_lower = {name.lower(): label for name, label in remote.items()}
+    for name, label in planned.items():
+        existing = remote_by_lower.get(name.lower())
+        if existing is None:
+            payload = {
+                "name": name,
+                "color": label["color"] or CATEGORY_COLORS.get(label["category"], DEFAULT_LABEL_COLOR),
+            }
+            if label["description"]:
+                payload["description"] = label["description"]
+            changes.append(MetadataChange("label", ACTION_CREATE, name, "POST", f"/repos/{owner}/{repo}/labels",
+                                          payload, f"#{payload['color']}"))
+            continue
+
+        payload = {}
+        if existing["name"] != name:
+            payload["new_name"] = name
+        if label["color"] and existing["color"] != label["color"]:
+            payload["color"] = label["color"]
+        if label["description"] is not None and existing["description"] != label["description"]:
+            payload["description"] = label["description"]
+        if payload:
+            changes.append(MetadataChange(
+                "label", ACTION_UPDATE, name, "PATCH",
+                f"/repos/{owner}/{repo}/labels/{quote(existing['name'], safe='')}", payload,
+                ", ".join("name" if field == "new_name" else field for field in payload),
+            ))
+    return changes
+
+
+def apply_changes(
+    changes: List[MetadataChange],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> List[Tuple[MetadataChange, Optional[Dict]]]:
+    """Run the writes in parallel; (change, response body or None when it failed) pairs."""
+    def apply(change: MetadataChange):
+        return rest_call(change.endpoint, change.method, change.payload)
+
+    results = []
+    if not changes:
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(changes)))) as executor:
+        # Reported from this thread, in plan order
+        for change, response in zip(changes, executor.map(apply, changes)):
+            if response.ok:
+                print(f"   ✅ {change.action.capitalize()}d {change.kind} {change.name} ({change.detail})")
+                results.append((change, response.data or {}))
+            else:
+                print(f"   ❌ {change.action} {change.kind} {change.name}: {response.error}")
+                results.append((change, None))
+    return results
+
+
+def print_changes(changes: List[MetadataChange]) -> None:
+    icons = {ACTION_CREATE: "➕", ACTION_UPDATE: "✏️ ", ACTION_CLOSE: "🔒"}
+    for change in changes:
+        print(f"   {icons[change.action]} {change.action} {change.kind} {change.name} ({change.detail})")
+
+
+def reconcile_metadata(
+    owner: str = REPO_OWNER,
+    repo: str = REPO_NAME,
+    milestones_path: Path = MILESTONES_PATH,
+    labels_path: Path = LABELS_PATH,
+    prune: bool = False,
+    dry_run: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Optional[Dict[str, int]]:
+    """
+    Bring milestones and labels in line with the planning files.
+
+    Returns planned milestone title -> number (milestones that would be
+    created are missing in a dry run), or None when the remote state could
+    not be fetched.
+    """
+    planned_milestones = load_planned_milestones(milestones_path) if Path(milestones_path).exists() else {}
+    planned_labels = load_planned_labels(labels_path) if Path(labels_path).exists() else {}
+
+    remote = fetch_remote_metadata(owner, repo)
+    if remote is None:
+        return None
+    remote_milestones, remote_labels = remote
+    print(f"📅 {len(remote_milestones)} milestone(s) and {len(remote_labels)} label(s) on GitHub; "
+          f"{len(planned_milestones)} and {len(planned_labels)} planned")
+
+    milestone_changes, numbers = plan_milestone_changes(planned_milestones, remote_milestones, owner, repo, prune)
+    label_changes = plan_label_changes(planned_labels, remote_labels, owner, repo)
+    changes = milestone_changes + label_changes
+    unmanaged = len({name.lower() for name in remote_labels} - {name.lower() for name in planned_labels})
+
+    if not changes:
+        print("   ✓ Milestones and labels match the planning files")
+    elif dry_run:
+        print_changes(changes)
+    else:
+        for change, result in apply_changes(changes, concurrency):
+            if change.kind == "milestone" and change.action == ACTION_CREATE and result:
+                numbers[change.name] = result["number"]
+    if unmanaged:
+        print(f"   ℹ️  {unmanaged} label(s) not in labels.yaml left alone")
+    return numbers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile GitHub milestones and labels with the planning files")
+    parser.add_argument("--owner", default=REPO_OWNER)
+    parser.add_argument("--repo", default=REPO_NAME)
+    parser.add_argument("--milestones", type=Path, default=MILESTONES_PATH, help="milestones.yaml path")
+    parser.add_argument("--labels", type=Path, default=LABELS_PATH, help="labels.yaml path")
+    parser.add_argument("--prune", action="store_true", help="Close open milestones that milestones.yaml no longer lists")
+    parser.add_argument("--dry-run", action="store_true", help="Show the changes without applying them")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Parallel API writes")
+    parser.add_argument("--transport", choices=TRANSPORT_MODES, default=None,
+                        help="GitHub API transport: pooled HTTP session, gh CLI subprocesses, or auto-detect")
+    args = parser.parse_args()
+
+    if args.transport:
+        configure_transport(args.transport)
+    numbers = reconcile_metadata(args.owner, args.repo, args.milestones, args.labels,
+                                 args.prune, args.dry_run, args.concurrency)
+    if numbers is None:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
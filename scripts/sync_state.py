@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Persistent Sync State
+
+SQLite store that survives crashes and Ctrl-C between sync runs:
+- task key -> issue number, node ID, project item ID, last-synced content hash
+  and a snapshot of the synced fields (for incremental updates)
+- provisioning step reached (created -> in_project -> typed -> done)
+- relationships already linked (blocked_by / parent)
+
+Every step is committed as soon as it succeeds, so a re-run skips finished
+work and resumes a partially provisioned issue at the step where it stopped.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Provisioning steps in order
+STEP_CREATED = "created"        # Issue exists (number, maybe node ID)
+STEP_IN_PROJECT = "in_project"  # Added to the project (project item ID known)
+STEP_TYPED = "typed"            # Issue type set
+STEP_DONE = "done"              # Project fields (and parent link) set
+STEPS = (STEP_CREATED, STEP_IN_PROJECT, STEP_TYPED, STEP_DONE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    task_key        TEXT PRIMARY KEY,
+    issue_number    INTEGER NOT NULL,
+    node_id         TEXT,
+    project_item_id TEXT,
+    content_hash    TEXT,
+    snapshot        TEXT,
+    step            TEXT NOT NULL,
+    updated_at      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS relationships (
+    kind        TEXT NOT NULL,
+    task_key    TEXT NOT NULL,
+    target_key  TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    PRIMARY KEY (kind, task_key, target_key)
+);
+"""
+
+
+def step_reached(record: Optional[Dict], step: str) -> bool:
+    """True when a record has completed `step` (or a later one)."""
+    return bool(record) and STEPS.index(record["step"]) >= STEPS.index(step)
+
+
+class SyncState:
+    """Thread-safe SQLite store for issue sync progress."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def get(self, task_key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM issues WHERE task_key = ?", (task_key,)).fetchone()
+        return dict(row) if row else None
+
+    def all(self) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM issues ORDER BY task_key").fetchall()
+        return [dict(row) for row in rows]
+
+    def save(self, task_key: str, step: str, **fields) -> None:
+        """
+        Upsert a task's record and commit immediately.
+
+        Only the given fields are changed; issue_number is required for new records.
+        """
+        if step not in STEPS:
+            raise ValueError(f"Unknown sync step: {step}")
+        allowed = {"issue_number", "node_id", "project_item_id", "content_hash", "snapshot"}
+        unknown = set(fields) - allowed
+        if unknown:
+            raise ValueError(f"Unknown sync state fields: {', '.join(sorted(unknown))}")
+
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            existing = self._conn.execute("SELECT * FROM issues WHERE task_key = ?", (task_key,)).fetchone()
+            record = dict(existing) if existing else {"task_key": task_key}
+            record.update({k: v for k, v in fields.items() if v is not None})
+            record["step"] = step
+            record["updated_at"] = now
+            if record.get("issue_number") is None:
+                raise ValueError(f"{task_key}: issue_number is required for a new sync record")
+
+            self._conn.execute(
+                """
+                INSERT INTO issues (task_key, issue_number, node_id, project_item_id, content_hash, snapshot, step, updated_at)
+                VALUES (:task_key, :issue_number, :node_id, :project_item_id, :content_hash, :snapshot, :step, :updated_at)
+                ON CONFLICT(task_key) DO UPDATE SET
+                    issue_number = excluded.issue_number,
+                    node_id = excluded.node_id,
+                    project_item_id = excluded.project_item_id,
+                    content_hash = excluded.content_hash,
+                    snapshot = excluded.snapshot,
+                    step = excluded.step,
+                    updated_at = excluded.updated_at
+                """,
+                {
+                    "node_id": None,
+                    "project_item_id": None,
+                    "content_hash": None,
+                    "snapshot": None,
+                    **record,
+                },
+            )
+            self._conn.commit()
+
+    def linked_relationships(self) -> set:
+        """Set of (kind, task_key, target_key) already linked on GitHub."""
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, task_key, target_key FROM relationships").fetchall()
+        return {tuple(row) for row in rows}
+
+    def record_relationships(self, relationships: Iterable[Tuple[str, str, str]]) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO relationships (kind, task_key, target_key, updated_at) VALUES (?, ?, ?, ?)",
+                [(kind, task_key, target_key, now) for kind, task_key, target_key in relationships],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test the issue sync's API call counts against the fake GitHub server.
+
+Runs benchmark_sync.py on a small synthetic backlog (create-issues-api.py
+in a subprocess, fake_github_server.py in-process) and checks:
+- One createIssue and one batched project field update per issue, REST only
+  for the missing labels, relationships linked in a few batches
+- A second run over the same backlog makes a single call (the prefetch)
+
+Usage:
+  python3 scripts/test_benchmark_sync.py [tasks]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_sync import benchmark_size
+
+DEFAULT_TASKS = 25
+
+# Per run, on top of one createIssue + one field update per issue: the schema
+# query, the prefetch, the Copilot bot lookup and assignment, and the labels
+FIXED_CALLS = 4
+
+
+def benchmark_args() -> argparse.Namespace:
+    """benchmark_sync.py defaults, with a re-run."""
+    return argparse.Namespace(
+        max_dependencies=3,
+        seed=42,
+        latency_ms=0.0,
+        jitter_ms=0.0,
+        primary_limit=10_000_000,
+        secondary_points=0,
+        github_pacing=False,
+        concurrency=4,
+        provision="graphql",
+        link_mode="batched",
+        rerun=True,
+        keep=False,
+        sync_args=[],
+    )
+
+
+def count(stats: dict, prefix: str) -> int:
+    """Calls whose operation label starts with `prefix` ("mutation addBlockedBy x25" -> "mutation addBlockedBy")."""
+    return sum(calls for operation, calls in stats["by_operation"].items() if operation.startswith(prefix))
+
+
+def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TASKS
+
+    print(f"🧪 Testing Issue Sync API Calls ({tasks} tasks)\n")
+    print("=" * 60)
+
+    result = benchmark_size(tasks, benchmark_args())
+    first = result["first_run"]
+    rerun = result["rerun"]
+    labels = count(first, "POST /labels")
+    links = count(first, "mutation addBlockedBy") + count(first, "mutation addSubIssue")
+
+    checks = [
+        ("First run succeeds", first["exit_code"] == 0, f"exit code {first['exit_code']}"),
+        ("Every task has an issue", first["issues"] == tasks, f"{first['issues']} issues"),
+        ("One createIssue per issue", count(first, "mutation createIssue") == tasks,
+         f"{count(first, 'mutation createIssue')} createIssue calls"),
+        ("One batched field update per issue", count(first, "mutation updateProjectV2ItemFieldValue") == tasks,
+         f"{count(first, 'mutation updateProjectV2ItemFieldValue')} field update calls"),
+        ("REST only for missing labels", first["rest"] == labels, f"{first['rest']} REST calls, {labels} labels"),
+        ("Relationships linked in batches", 1 <= links <= 3, f"{links} link calls"),
+        ("No rate-limited calls", first["rate_limited"] == 0, f"{first['rate_limited']} rate limited"),
+        ("Call total", first["requests"] <= 2 * tasks + labels + links + FIXED_CALLS,
+         f"{first['requests']} calls ({first['calls_per_issue']:.2f}/issue)"),
+        ("Re-run succeeds", rerun["exit_code"] == 0, f"exit code {rerun['exit_code']}"),
+        ("Re-run makes one call", rerun["requests"] == 1, f"{rerun['requests']} calls: {rerun['by_operation']}"),
+    ]
+
+    print()
+    passed = 0
+    failed = 0
+    for name, ok, detail in checks:
+        if ok:
+            print(f"✅ {name}")
+            passed += 1
+        else:
+            print(f"❌ {name}")
+            failed += 1
+        print(f"   {detail}")
+
+    print("=" * 60)
+    print(f"\n📊 Results: {passed} passed, {failed} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
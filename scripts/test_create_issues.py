@@ -9,6 +9,10 @@ This tests:
 - Parent/child relationships (addSubIssue)
 - Blocking relationships (addBlockedBy)
 - Projects v2 integration
+
+Runs against the live repository by default. To run offline, start
+fake_github_server.py and point the transport at it:
+    GITHUB_API_URL=http://127.0.0.1:8765 GITHUB_TOKEN=fake python scripts/test_create_issues.py
 """
 
 import json
@@ -44,6 +48,10 @@ from copilot_agent import (
     generate_copilot_instructions,
 )
 
+# Discover project field/option/issue type IDs (cached in planning/.cache)
+if not create_issues_api.resolve_project_ids():
+    sys.exit(1)
+
 REPO_OWNER = create_issues_api.REPO_OWNER
 REPO_NAME = create_issues_api.REPO_NAME
 GITHUB_ISSUE_TYPE_FEATURE = create_issues_api.GITHUB_ISSUE_TYPE_FEATURE
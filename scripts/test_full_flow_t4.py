@@ -8,8 +8,6 @@ import subprocess
 import sys
 from pathlib import Path
 
-import yaml
-
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -18,24 +16,18 @@ from copilot_agent import (
     generate_copilot_instructions,
     select_custom_agent,
 )
+from issue_index import load_issue
 
 REPO_OWNER = "neutrico"
 REPO_NAME = "morpheus-press"
-PLANNING_FILE = Path("/workspaces/morpheus-press/planning/issues/m0-infrastructure.yaml")
+PLANNING_DIR = Path("/workspaces/morpheus-press/planning")
 
 print("\n🚀 Full Flow Test: Create Task T4 with Custom Agent")
 print("=" * 70)
 
 # Step 1: Load task data from YAML
 print("\n📝 Step 1: Loading task T4 from planning YAML...")
-with open(PLANNING_FILE) as f:
-    planning_data = yaml.safe_load(f)
-
-task_t4 = None
-for task in planning_data.get("issues", []):
-    if task.get("key") == "T4":
-        task_t4 = task
-        break
+task_t4 = load_issue("T4", PLANNING_DIR)
 
 if not task_t4:
     print("❌ Task T4 not found in planning file")
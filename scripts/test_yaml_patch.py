@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Test in-place planning YAML patching (yaml_patch.py) and the raw block
+scanner behind the issue index (issue_index.iter_blocks).
+
+Each patch case writes a small planning file, applies the edits with
+patch_file() and compares the result byte for byte with the expected file,
+so anything outside the edited value that changes is a failure.
+
+Usage:
+  python3 scripts/test_yaml_patch.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from issue_index import ESTIMATES, ISSUES, iter_blocks
+from yaml_patch import PatchError, patch_file
+
+ISSUES_FILE = """\
+# Milestone M1 issues
+issues:
+  - key: T1
+    task: "Set up the repository"   # keep this comment
+    effort: 3  # days
+    description: >
+      A folded description that
+      wraps over two lines.
+    progress:
+      status: todo
+      notes: first
+    dependsOn:
+    - T0
+
+  - key: T2
+    task: Write the docs
+    effort: 2
+
+# trailing comment
+other: value
+"""
+
+# (name, file text, collection, {task key: [(field, value)]}, expected file text)
+PATCH_CASES = [
+    (
+        "Scalar replace",
+        ISSUES_FILE, ISSUES,
+        {"T2": [("effort", 5)]},
+        ISSUES_FILE.replace("    effort: 2\n", "    effort: 5\n"),
+    ),
+    (
+        "Nested scalar replace",
+        ISSUES_FILE, ISSUES,
+        {"T1": [("progress.status", "in-progress")]},
+        ISSUES_FILE.replace("      status: todo\n", "      status: in-progress\n"),
+    ),
+    (
+        "Trailing comment kept",
+        ISSUES_FILE, ISSUES,
+        {"T1": [("effort", 8)]},
+        ISSUES_FILE.replace("    effort: 3  # days\n", "    effort: 8  # days\n"),
+    ),
+    (
+        "Quoted value with a comment",
+        ISSUES_FILE, ISSUES,
+        {"T1": [("task", "Set up the monorepo")]},
+        ISSUES_FILE.replace(
+            '    task: "Set up the repository"   # keep this comment\n',
+            "    task: Set up the monorepo   # keep this comment\n",
+        ),
+    ),
+    (
+        "Multi-line folded value",
+        ISSUES_FILE, ISSUES,
+        {"T1": [("description", "Short.")]},
+        ISSUES_FILE.replace(
+            "    description: >\n      A folded description that\n      wraps over two lines.\n",
+            "    description: Short.\n",
+        ),
+    ),
+    (
+        "Missing parent and child inserted",
+        ISSUES_FILE, ISSUES,
+        {"T2": [("progress.status", "done")]},
+        ISSUES_FILE.replace(
+            "    effort: 2\n",
+            "    effort: 2\n    progress:\n      status: done\n",
+        ),
+    ),
+    (
+        "Field on the '- key:' line",
+        ISSUES_FILE, ISSUES,
+        {"T1": [("key", "T1b")]},
+        ISSUES_FILE.replace("  - key: T1\n", "  - key: T1b\n"),
+    ),
+    (
+        "Value before a sequence at the key's indent",
+        ISSUES_FILE, ISSUES,
+        {"T1": [("progress.notes", "second")]},
+        ISSUES_FILE.replace("      notes: first\n", "      notes: second\n"),
+    ),
+    (
+        "Several edits in one pass",
+        ISSUES_FILE, ISSUES,
+        {"T1": [("effort", 4)], "T2": [("effort", 1), ("progress.status", "todo")]},
+        ISSUES_FILE.replace("    effort: 3  # days\n", "    effort: 4  # days\n").replace(
+            "    effort: 2\n", "    effort: 1\n    progress:\n      status: todo\n"
+        ),
+    ),
+    (
+        "CRLF line endings",
+        ISSUES_FILE.replace("\n", "\r\n"), ISSUES,
+        {"T1": [("progress.status", "done")], "T2": [("progress.status", "todo")]},
+        ISSUES_FILE.replace("      status: todo\n", "      status: done\n").replace(
+            "    effort: 2\n", "    effort: 2\n    progress:\n      status: todo\n"
+        ).replace("\n", "\r\n"),
+    ),
+    (
+        "Estimates mapping entry",
+        "estimates:\n  T1:\n    estimated_days: 2  # rough\n    confidence: low\n  T2:\n    estimated_days: 1\n",
+        ESTIMATES,
+        {"T1": [("estimated_days", 3)]},
+        "estimates:\n  T1:\n    estimated_days: 3  # rough\n    confidence: low\n  T2:\n    estimated_days: 1\n",
+    ),
+]
+
+# (name, file text, collection, [(task key, block text)])
+BLOCK_CASES = [
+    (
+        "Issue list blocks",
+        ISSUES_FILE, ISSUES,
+        [
+            ("T1", ISSUES_FILE[ISSUES_FILE.index("  - key: T1"):ISSUES_FILE.index("  - key: T2")]),
+            # Comments after the last entry stay with it, up to the next top-level key
+            ("T2", ISSUES_FILE[ISSUES_FILE.index("  - key: T2"):ISSUES_FILE.index("other: value")]),
+        ],
+    ),
+    (
+        "Key below the first line",
+        "issues:\n- task: First\n  key: T7\n- key: T8\n  task: Second\nnext: 1\n", ISSUES,
+        [("T7", "- task: First\n  key: T7\n"), ("T8", "- key: T8\n  task: Second\n")],
+    ),
+    (
+        "Estimates mapping blocks",
+        "version: 1\nestimates:\n  T1:\n    days: 2\n\n  'T2':\n    days: 1\n", ESTIMATES,
+        [("T1", "  T1:\n    days: 2\n\n"), ("T2", "  'T2':\n    days: 1\n")],
+    ),
+    (
+        "CRLF offsets",
+        "issues:\r\n  - key: T1\r\n    effort: 1\r\n  - key: T2\r\n", ISSUES,
+        [("T1", "  - key: T1\r\n    effort: 1\r\n"), ("T2", "  - key: T2\r\n")],
+    ),
+    (
+        "Missing collection",
+        "milestones:\n  - key: M1\n", ISSUES,
+        [],
+    ),
+    (
+        "Flow-style collection",
+        "issues: []\n", ISSUES,
+        [],
+    ),
+]
+
+
+def run_patch_case(directory: Path, text: str, collection: str, edits: dict) -> bytes:
+    path = directory / "planning.yaml"
+    path.write_bytes(text.encode("utf-8"))
+    patch_file(path, edits, collection)
+    return path.read_bytes()
+
+
+def main():
+    print("🧪 Testing YAML Patching\n")
+    print("=" * 60)
+
+    passed = 0
+    failed = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+
+        for name, text, collection, edits, expected in PATCH_CASES:
+            try:
+                result = run_patch_case(directory, text, collection, edits)
+            except PatchError as e:
+                result = f"PatchError: {e}".encode("utf-8")
+            if result == expected.encode("utf-8"):
+                print(f"✅ {name}")
+                passed += 1
+            else:
+                print(f"❌ {name}")
+                print(f"   Expected: {expected.encode('utf-8')!r}")
+                print(f"   Got:      {result!r}")
+                failed += 1
+
+        # A scalar cannot take a nested field: the file must stay as it was
+        path = directory / "planning.yaml"
+        path.write_bytes(ISSUES_FILE.encode("utf-8"))
+        try:
+            patch_file(path, {"T1": [("effort.days", 3)]}, ISSUES)
+            raised = False
+        except PatchError:
+            raised = True
+        if raised and path.read_bytes() == ISSUES_FILE.encode("utf-8"):
+            print("✅ Failed edit leaves the file untouched")
+            passed += 1
+        else:
+            print("❌ Failed edit leaves the file untouched")
+            print(f"   PatchError raised: {raised}")
+            failed += 1
+
+        # Dry runs report a diff without writing
+        patched, diff = patch_file(path, {"T2": [("effort", 9)]}, ISSUES, dry_run=True)
+        if patched == ["T2"] and "+    effort: 9\n" in diff and path.read_bytes() == ISSUES_FILE.encode("utf-8"):
+            print("✅ Dry run")
+            passed += 1
+        else:
+            print("❌ Dry run")
+            print(f"   Patched: {patched}, diff: {diff}")
+            failed += 1
+
+    print("\n🧪 Testing Issue Index Blocks\n")
+    print("=" * 60)
+
+    for name, text, collection, expected in BLOCK_CASES:
+        data = text.encode("utf-8")
+        blocks = [(key, data[offset:offset + length].decode("utf-8")) for key, offset, length in iter_blocks(data, collection)]
+        if blocks == expected:
+            print(f"✅ {name}")
+            passed += 1
+        else:
+            print(f"❌ {name}")
+            print(f"   Expected: {expected}")
+            print(f"   Got:      {blocks}")
+            failed += 1
+
+    print("=" * 60)
+    print(f"\n📊 Results: {passed} passed, {failed} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
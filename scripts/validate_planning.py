@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Planning Validator
+
+Schema and referential-integrity checks for the planning YAML, run before
+the sync scripts touch it (and by build-planning.py):
+- planning/ISSUE_TEMPLATE.yaml is compiled once into check functions:
+  field shapes (mapping/list/number), enums from "a | b | c" comments and
+  ranges from "(1-13)" comments; key and title are required
+- estimates/effort-map.yaml: estimates must map task keys to mappings with
+  a title
+- Cross-file invariants in one O(n) pass over per-issue summaries: unique
+  keys, existing dependsOn targets, iteration in pi-metadata.yaml
+  safe.pi.iterations, milestone in milestones.yaml; dependency cycles are
+  warnings (the sync schedules a cycle as one unit)
+- The sync pre-flight (check_planning) can be limited to the tasks being
+  synced, so a bad entry elsewhere does not block a --milestone run
+- Per-file results are cached by size/mtime/content hash (and the template
+  fingerprint) in planning/.cache/validation.json, so after one edit only
+  that file is re-checked
+
+Errors are what would break the scripts (missing key, bad references,
+malformed blocks); warnings are template deviations (unknown enum values,
+out-of-range effort).
+
+Usage:
+    python scripts/validate_planning.py             # exit 1 on errors
+    python scripts/validate_planning.py --strict    # warnings fail too
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+from cache_utils import CACHE_DIR, read_json_cache, write_json_cache
+from planning_yaml import RACY_WINDOW_SECONDS, load_yaml, parse_yaml
+
+VALIDATOR_VERSION = 2
+VALIDATION_CACHE_FILE = CACHE_DIR / "validation.json"
+DEFAULT_PLANNING_DIR = Path(os.environ.get("MORPHEUS_WORKSPACE_ROOT", "/workspaces/morpheus-press")) / "planning"
+
+REQUIRED_FIELDS = ("key", "title")
+# Template "Metadata" fields - expected on every issue, but the scripts cope without them
+EXPECTED_FIELDS = ("type", "milestone", "iteration", "priority", "effort", "area")
+ENUM_COMMENT_PATTERN = re.compile(r"^\s*[\w.:-]+(?:\s*\([^)]*\))?(?:\s*\|\s*[\w.:-]+(?:\s*\([^)]*\))?)+\s*$")
+RANGE_COMMENT_PATTERN = re.compile(r"\((\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\)")
+TEMPLATE_LINE_PATTERN = re.compile(r"""^(\s*)([A-Za-z_][\w-]*):(?:\s+([^#]*?))?\s*(?:#\s*(.*))?$""")
+
+Check = Callable[[Dict], Tuple[List[str], List[str]]]
+
+
+class ValidationReport(NamedTuple):
+    errors: List[str]
+    warnings: List[str]
+    issue_count: int
+    files_checked: int
+    files_cached: int
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, dict):
+        return "mapping"
+    if isinstance(value, list):
+        return "list"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return "number"
+    return "scalar"
+
+
+def _template_comments(text: str) -> Dict[str, str]:
+    """Dotted field path -> its trailing comment, from the template's raw lines."""
+    comments = {}
+    stack: List[Tuple[int, str]] = []
+    for line in text.splitlines():
+        match = TEMPLATE_LINE_PATTERN.match(line)
+        if not match:
+            continue
+        indent = len(match.group(1))
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        path = ".".join([name for _, name in stack] + [match.group(2)])
+        if match.group(4):
+            comments[path] = match.group(4).strip()
+        stack.append((indent, match.group(2)))
+    return comments
+
+
+class IssueSchema:
+    """ISSUE_TEMPLATE.yaml compiled into per-field check functions."""
+
+    def __init__(self, template_text: str):
+        self.fingerprint = hashlib.sha256(f"{VALIDATOR_VERSION}\n{template_text}".encode("utf-8")).hexdigest()[:16]
+        template = parse_yaml(template_text.encode("utf-8"), "ISSUE_TEMPLATE.yaml") or {}
+        comments = _template_comments(template_text)
+        self.checks: List[Check] = [self._required_check()]
+        self._compile(template, comments, ())
+
+    @staticmethod
+    def _required_check() -> Check:
+        def check(issue: Dict) -> Tuple[List[str], List[str]]:
+            errors = [f"missing required field '{field}'" for field in REQUIRED_FIELDS if not issue.get(field)]
+            if issue.get("key") is not None and not isinstance(issue["key"], str):
+                errors.append(f"key must be a string, got {issue['key']!r}")
+            warnings = [f"missing field '{field}'" for field in EXPECTED_FIELDS if field not in issue]
+            return errors, warnings
+        return check
+
+    def _compile(self, template: Dict, comments: Dict[str, str], prefix: Tuple[str, ...]) -> None:
+        for name, example in template.items():
+            path = prefix + (name,)
+            dotted = ".".join(path)
+            kind = _kind(example)
+            comment = comments.get(dotted, "")
+            enum = None
+            if ENUM_COMMENT_PATTERN.match(comment):
+                enum = [option.split()[0].split("(")[0] for option in comment.split("|")]
+            bounds = RANGE_COMMENT_PATTERN.search(comment) if kind == "number" else None
+            self.checks.append(self._field_check(path, kind, enum, bounds))
+            if kind == "mapping":
+                self._compile(example, comments, path)
+
+    @staticmethod
+    def _field_check(path: Tuple[str, ...], kind: str, enum: Optional[List[str]], bounds) -> Check:
+        dotted = ".".join(path)
+        low, high = (float(bounds.group(1)), float(bounds.group(2))) if bounds else (None, None)
+        # A null value means "not set" for any field; scalars accept any scalar
+        # (the template's "3d" estimates are numbers in practice)
+        accepted = {"mapping": ("mapping",), "list": ("list",), "number": ("number",)}.get(kind, ("scalar", "number"))
+
+        def check(issue: Dict) -> Tuple[List[str], List[str]]:
+            value = issue
+            for part in path:
+                if not isinstance(value, dict) or part not in value:
+                    return [], []
+                value = value[part]
+            if value is None:
+                return [], []
+            actual = _kind(value)
+            if actual not in accepted:
+                return [f"{dotted} must be a {kind}, got {actual} {value!r:.40}"], []
+            warnings = []
+            if enum and str(value) not in enum:
+                warnings.append(f"{dotted} {value!r} is not one of {' | '.join(enum)}")
+            if low is not None and not low <= value <= high:
+                warnings.append(f"{dotted} {value} is outside {low:g}-{high:g}")
+            return [], warnings
+        return check
+
+    def check(self, issue: Any) -> Tuple[List[str], List[str]]:
+        """(errors, warnings) for one issue entry."""
+        if not isinstance(issue, dict):
+            return [f"issue entry must be a mapping, got {_kind(issue)} {issue!r:.40}"], []
+        errors: List[str] = []
+        warnings: List[str] = []
+        for check in self.checks:
+            more_errors, more_warnings = check(issue)
+            errors += more_errors
+            warnings += more_warnings
+        return errors, warnings
+
+
+_schemas: Dict[str, IssueSchema] = {}
+
+
+def load_schema(template_path: Path) -> IssueSchema:
+    """Compiled schema for a template (compiled once per process and template content)."""
+    text = Path(template_path).read_text(encoding="utf-8") if Path(template_path).exists() else "{}"
+    if text not in _schemas:
+        _schemas[text] = IssueSchema(text)
+    return _schemas[text]
+
+
+def summarize_issue(issue: Dict) -> Dict:
+    """The fields the cross-file checks need."""
+    depends_on = issue.get("dependsOn") or []
+    return {
+        "key": issue.get("key"),
+        "milestone": issue.get("milestone"),
+        "iteration": issue.get("iteration"),
+        "dependsOn": [str(dep) for dep in depends_on] if isinstance(depends_on, list) else [],
+    }
+
+
+Finding = Tuple[Optional[str], str]  # (task key, or None for the whole file; message)
+
+
+def check_issue_file(data: Any, schema: IssueSchema) -> Tuple[List[Finding], List[Finding], List[Dict]]:
+    """Schema errors/warnings (per task key) and cross-file summaries for a parsed planning/issues/*.yaml file."""
+    if not isinstance(data, dict) or not isinstance(data.get("issues"), list):
+        return [(None, "top level must be a mapping with an 'issues' list")], [], []
+    errors, warnings, summaries = [], [], []
+    for position, issue in enumerate(data["issues"], 1):
+        key = str(issue["key"]) if isinstance(issue, dict) and issue.get("key") else None
+        label = key or f"issue #{position}"
+        issue_errors, issue_warnings = schema.check(issue)
+        errors += [(key, f"{label}: {message}") for message in issue_errors]
+        warnings += [(key, f"{label}: {message}") for message in issue_warnings]
+        if isinstance(issue, dict) and isinstance(issue.get("key"), str):
+            summaries.append(summarize_issue(issue))
+    return errors, warnings, summaries
+
+
+def check_estimates_file(data: Any) -> Tuple[List[Finding], List[Finding], List[str]]:
+    """Errors/warnings (per task key) and task keys for a parsed effort-map.yaml."""
+    estimates = data.get("estimates") if isinstance(data, dict) else None
+    if not isinstance(estimates, dict):
+        return [(None, "top level must be a mapping with an 'estimates' mapping")], [], []
+    errors, warnings = [], []
+    for key, estimate in estimates.items():
+        key = str(key)
+        if not isinstance(estimate, dict):
+            errors.append((key, f"{key}: estimate must be a mapping, got {_kind(estimate)}"))
+            continue
+        if not estimate.get("title"):
+            errors.append((key, f"{key}: missing required field 'title'"))
+        for field in ("estimated_days", "effort"):
+            if estimate.get(field) is not None and _kind(estimate[field]) != "number":
+                errors.append((key, f"{key}: {field} must be a number, got {estimate[field]!r}"))
+        if "reasoning" in estimate and not isinstance(estimate["reasoning"], str):
+            errors.append((key, f"{key}: reasoning must be text"))
+    return errors, warnings, list(estimates)
+
+
+def find_cycles(dependencies: Dict[str, List[str]]) -> List[List[str]]:
+    """Dependency cycles (one per back edge), via an iterative O(n + e) DFS."""
+    white, grey, black = 0, 1, 2
+    color = {key: white for key in dependencies}
+    cycles = []
+    for root in dependencies:
+        if color[root] != white:
+            continue
+        stack = [(root, iter(dependencies[root]))]
+        path = [root]
+        color[root] = grey
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                color[node] = black
+                stack.pop()
+                path.pop()
+            elif color.get(child) == grey:
+                cycles.append(path[path.index(child):] + [child])
+            elif color.get(child) == white:
+                color[child] = grey
+                stack.append((child, iter(dependencies[child])))
+                path.append(child)
+    return cycles
+
+
+def check_references(
+    summaries: List[Dict],
+    milestones: Optional[List[str]] = None,
+    iterations: Optional[List[str]] = None,
+    keys: Optional[set] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Cross-file checks in one pass: errors for duplicate keys, unknown or self
+    dependencies, unknown milestones and iterations; warnings for dependency
+    cycles (the sync orders a cycle as one unit).
+
+    `keys` limits the checks to those tasks (cycles are found globally and
+    reported when they pass through one of them).
+    """
+    counts: Dict[str, int] = {}
+    for summary in summaries:
+        counts[summary["key"]] = counts.get(summary["key"], 0) + 1
+    milestone_names = set(milestones or [])
+    iteration_names = {str(iteration) for iteration in iterations or []}
+
+    errors, warnings = [], []
+    dependencies: Dict[str, List[str]] = {}
+    for summary in summaries:
+        key = summary["key"]
+        dependencies.setdefault(key, []).extend(summary["dependsOn"])
+        if keys is not None and key not in keys:
+            continue
+        if counts[key] > 1:
+            errors.append(f"{key}: duplicate key ({counts[key]} issues)")
+            counts[key] = 0  # report once
+        if milestone_names and summary.get("milestone") not in milestone_names:
+            errors.append(f"{key}: milestone {summary.get('milestone')!r} is not in milestones.yaml")
+        if iteration_names and summary.get("iteration") is not None and str(summary["iteration"]) not in iteration_names:
+            errors.append(f"{key}: iteration {summary['iteration']!r} is not in safe.pi.iterations")
+        for dependency in summary["dependsOn"]:
+            if dependency == key:
+                errors.append(f"{key}: depends on itself")
+            elif dependency not in counts:
+                errors.append(f"{key}: dependsOn unknown task {dependency}")
+
+    graph = {key: [dep for dep in deps if dep in dependencies and dep != key] for key, deps in dependencies.items()}
+    for cycle in find_cycles(graph):
+        if keys is None or keys & set(cycle):
+            warnings.append(f"Dependency cycle: {' -> '.join(cycle)}")
+    return errors, warnings
+
+
+def planning_context(planning_dir: Path) -> Dict[str, List[str]]:
+    """Milestone names (milestones.yaml) and iterations (pi-metadata.yaml), where those files exist."""
+    context: Dict[str, List[str]] = {}
+    milestones_path = planning_dir / "milestones.yaml"
+    if milestones_path.exists():
+        data = load_yaml(milestones_path) or {}
+        context["milestones"] = [m.get("name") for m in data.get("milestones") or [] if isinstance(m, dict)]
+    metadata_path = planning_dir / "pi-metadata.yaml"
+    if metadata_path.exists():
+        pi = ((load_yaml(metadata_path) or {}).get("safe") or {}).get("pi") or {}
+        if pi.get("iterations"):
+            context["iterations"] = [str(iteration) for iteration in pi["iterations"]]
+    return context
+
+
+def _check_file(path: Path, kind: str, schema: IssueSchema) -> Dict:
+    stat = path.stat()
+    raw = path.read_bytes()
+    entry = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "checked_at": time.time(),
+        "schema": schema.fingerprint,
+        "kind": kind,
+    }
+    try:
+        data = parse_yaml(raw, str(path))
+    except yaml.YAMLError as e:
+        entry.update(errors=[(None, f"YAML error: {e}".replace("\n", " "))], warnings=[], summaries=[], keys=[])
+        return entry
+    if kind == "issues":
+        errors, warnings, summaries = check_issue_file(data, schema)
+        entry.update(errors=errors, warnings=warnings, summaries=summaries, keys=[])
+    else:
+        errors, warnings, keys = check_estimates_file(data)
+        entry.update(errors=errors, warnings=warnings, summaries=[], keys=keys)
+    return entry
+
+
+def _cached_entry(path: Path, entry: Optional[Dict], schema: IssueSchema) -> Optional[Dict]:
+    """The cached entry if it still describes the file's content."""
+    if not entry or entry.get("schema") != schema.fingerprint:
+        return None
+    stat = path.stat()
+    if stat.st_size != entry["size"]:
+        return None
+    if stat.st_mtime_ns == entry["mtime_ns"] and entry["checked_at"] - stat.st_mtime_ns / 1e9 > RACY_WINDOW_SECONDS:
+        return entry
+    if hashlib.sha256(path.read_bytes()).hexdigest() == entry["sha256"]:
+        return dict(entry, mtime_ns=stat.st_mtime_ns, checked_at=time.time())
+    return None
+
+
+def validate_planning(
+    planning_dir: Path = DEFAULT_PLANNING_DIR,
+    use_cache: bool = True,
+    keys: Optional[set] = None,
+) -> ValidationReport:
+    """
+    Validate every issue file and the effort map (unchanged files come from the cache).
+
+    `keys` limits the reported findings to those tasks (plus whole-file errors
+    such as YAML syntax errors); every file is still checked and cached.
+    """
+    planning_dir = Path(planning_dir)
+    schema = load_schema(planning_dir / "ISSUE_TEMPLATE.yaml")
+    files = {path: "issues" for path in sorted((planning_dir / "issues").glob("*.yaml"))}
+    effort_map = planning_dir / "estimates/effort-map.yaml"
+    if effort_map.exists():
+        files[effort_map] = "estimates"
+
+    cache = read_json_cache(VALIDATION_CACHE_FILE) if use_cache else None
+    if not cache or cache.get("version") != VALIDATOR_VERSION:
+        cache = {"files": {}}
+    entries: Dict[str, Dict] = {}
+    checked = cached = 0
+    for path, kind in files.items():
+        entry = _cached_entry(path, cache["files"].get(str(path)), schema)
+        if entry is None:
+            entry = _check_file(path, kind, schema)
+            checked += 1
+        else:
+            cached += 1
+        entries[str(path)] = entry
+
+    errors: List[str] = []
+    warnings: List[str] = []
+    summaries: List[Dict] = []
+    estimate_keys: List[str] = []
+    for path, entry in entries.items():
+        name = Path(path).relative_to(planning_dir).as_posix()
+        errors += [f"{name}: {message}" for key, message in entry["errors"] if keys is None or key is None or key in keys]
+        warnings += [f"{name}: {message}" for key, message in entry["warnings"] if keys is None or key is None or key in keys]
+        summaries += entry["summaries"]
+        estimate_keys += entry["keys"]
+
+    context = planning_context(planning_dir)
+    reference_errors, reference_warnings = check_references(
+        summaries, context.get("milestones"), context.get("iterations"), keys
+    )
+    errors += reference_errors
+    warnings += reference_warnings
+    issue_keys = {summary["key"] for summary in summaries}
+    unplanned = [key for key in estimate_keys if key not in issue_keys and (keys is None or key in keys)]
+    if unplanned and issue_keys:
+        warnings.append(f"estimates/effort-map.yaml: {len(unplanned)} estimate(s) without an issue: "
+                        f"{', '.join(unplanned[:10])}{' ...' if len(unplanned) > 10 else ''}")
+
+    if use_cache and (checked or len(entries) != len(cache["files"])):
+        try:
+            write_json_cache(VALIDATION_CACHE_FILE, {"version": VALIDATOR_VERSION, "files": entries})
+        except OSError as e:
+            print(f"⚠️  Could not cache validation results: {e}", file=sys.stderr)
+    return ValidationReport(errors, warnings, len(summaries), checked, cached)
+
+
+def check_planning(planning_dir: Path = DEFAULT_PLANNING_DIR, max_shown: int = 20, keys: Optional[set] = None) -> bool:
+    """
+    Pre-flight for the sync scripts: print validation errors for the tasks
+    being synced (`keys`, all tasks when None) and return False if there are
+    any (warnings are only counted).
+    """
+    report = validate_planning(planning_dir, keys=keys)
+    if not report.errors:
+        if report.warnings:
+            print(f"⚠️  Planning YAML: {len(report.warnings)} warning(s) - see scripts/validate_planning.py")
+        return True
+    print(f"❌ Planning YAML has {len(report.errors)} error(s):")
+    for error in report.errors[:max_shown]:
+        print(f"   - {error}")
+    if len(report.errors) > max_shown:
+        print(f"   ... and {len(report.errors) - max_shown} more (scripts/validate_planning.py)")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate planning YAML (schema + cross-file references)")
+    parser.add_argument("--planning-dir", type=Path, default=DEFAULT_PLANNING_DIR)
+    parser.add_argument("--no-cache", action="store_true", help="Re-check every file")
+    parser.add_argument("--strict", action="store_true", help="Fail on warnings too")
+    parser.add_argument("--quiet", action="store_true", help="Print errors only")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = validate_planning(args.planning_dir, use_cache=not args.no_cache)
+    elapsed = time.perf_counter() - started
+
+    for error in report.errors:
+        print(f"❌ {error}")
+    if not args.quiet:
+        for warning in report.warnings:
+            print(f"⚠️  {warning}")
+    print(f"{'✅' if not report.errors else '❌'} {report.issue_count} issues: {len(report.errors)} error(s), "
+          f"{len(report.warnings)} warning(s) - {report.files_checked} file(s) checked, "
+          f"{report.files_cached} from cache, {elapsed * 1000:.0f} ms")
+    if report.errors or (args.strict and report.warnings):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+YAML -> Markdown
+
+Renders planning/issues/*.yaml tasks as planning/docs/<milestone>/T<n>-*.md
+(see planning_convert.py). Only tasks whose YAML block changed since their doc
+was rendered are converted; docs edited since then are left alone.
+
+Usage:
+    python scripts/yaml-to-markdown.py               # changed tasks
+    python scripts/yaml-to-markdown.py T23 T24       # just these
+    python scripts/yaml-to-markdown.py --force       # re-render everything
+"""
+
+from planning_convert import cli, yaml_to_markdown
+
+if __name__ == "__main__":
+    cli(yaml_to_markdown, "Render planning YAML tasks as markdown docs")
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Planning YAML Patcher
+
+In-place field updates for planning/issues/*.yaml and effort-map.yaml
+(progress.status, effort, agent_notes.content_hash, ...) without loading and
+re-dumping whole files:
+- Each file is streamed line by line; only the block of a task with pending
+  edits is held in memory, everything else is copied through untouched
+- Within that block the field is found by indentation and only its value
+  (the line plus any continuation lines) is rewritten; missing fields and
+  parents are inserted at the end of their parent - comments, quoting and
+  line wrapping elsewhere are preserved, so diffs stay minimal
+- All edits to one file are applied in a single pass; each patched block is
+  re-parsed to verify the new values before the file is replaced atomically
+- Files are found through the issue index (issue_index.py)
+
+Usage:
+    python scripts/yaml_patch.py T24 progress.status=in-progress
+    python scripts/yaml_patch.py T24 T25 effort=5 --dry-run        # print the diff
+    python scripts/yaml_patch.py T24 estimated_days=3 --estimates  # effort-map.yaml
+    python scripts/yaml_patch.py --edits edits.json                # [{"key", "field", "value"}, ...]
+"""
+
+import argparse
+import difflib
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+from issue_index import DEFAULT_PLANNING_DIR, ESTIMATES, ISSUES, load_issue_index
+from planning_yaml import parse_yaml
+
+FIELD_PATTERN = re.compile(r"""^(\s*)(["']?)([^"':#]+?)\2\s*:(?:\s+(.*?))?\s*$""")
+KEY_PATTERN = re.compile(r"""^\s*(?:-\s+)?key:\s*["']?([^"'\s#]+)""")
+MAPPING_KEY_PATTERN = re.compile(r"""^\s*["']?([^"':\s#]+)["']?\s*:""")
+TRAILING_COMMENT_PATTERN = re.compile(
+    r"""^(?P<value>"(?:[^"\\]|\\.)*"|'(?:[^']|'')*'|[^'"#][^#]*?)(?P<comment>\s+#.*)$"""
+)
+
+
+class PatchError(Exception):
+    """A field could not be patched in place (the file is left unchanged)."""
+
+
+class FieldEdit(NamedTuple):
+    """Set `field` (dotted path, e.g. "progress.status") of one task to `value`."""
+    task_key: str
+    field: str
+    value: Any
+
+
+def render_scalar(value: Any) -> str:
+    """Single-line YAML for a value (strings quoted as needed, lists/mappings in flow style)."""
+    style = '"' if isinstance(value, str) and "\n" in value else None
+    text = yaml.safe_dump(
+        value, default_flow_style=True, default_style=style, width=float("inf"), allow_unicode=True
+    )
+    if text.endswith("\n...\n"):
+        text = text[:-len("\n...\n")]
+    text = text.rstrip("\n")
+    if "\n" in text:
+        raise PatchError(f"Cannot render {value!r} on one line")
+    return text
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _is_content(line: str) -> bool:
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith("#")
+
+
+def _newline(lines: List[str]) -> str:
+    return "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+
+
+def _span_end(lines: List[str], start: int, end: int, indent: int) -> int:
+    """End of the value of the field on lines[start] (continuation and child lines), trailing blanks excluded."""
+    last = start + 1
+    for i in range(start + 1, end):
+        if not _is_content(lines[i]):
+            continue
+        column = _indent(lines[i])
+        # "key:\n- item" - a block sequence may sit at its key's indent
+        if column < indent or (column == indent and not lines[i][column:].startswith("- ")):
+            break
+        last = i + 1
+    return last
+
+
+def _find_field(lines: List[str], start: int, end: int, name: str) -> Tuple[Optional[int], int]:
+    """
+    (line index, indent) of `name:` among the direct children in lines[start:end].
+
+    The children's indent is that of the first content line; the index is
+    None when the field is absent.
+    """
+    indent = next((_indent(lines[i]) for i in range(start, end) if _is_content(lines[i])), None)
+    if indent is None:
+        return None, -1
+    for i in range(start, end):
+        line = lines[i]
+        if not _is_content(line) or _indent(line) != indent:
+            continue
+        match = FIELD_PATTERN.match(line.rstrip("\r\n"))
+        if match and match.group(3) == name:
+            return i, indent
+    return None, indent
+
+
+def set_field(lines: List[str], start: int, end: int, parent_indent: int, path: List[str], value: Any) -> int:
+    """
+    Set the dotted `path` inside lines[start:end] (a mapping's children) in place.
+
+    Returns the change in line count.
+    """
+    newline = _newline(lines)
+    name = path[0]
+    index, indent = _find_field(lines, start, end, name)
+    if indent < 0:
+        indent = parent_indent + 2
+
+    if index is None:
+        # Insert after the parent's last content line (before trailing blanks/comments)
+        at = start
+        for i in range(start, end):
+            if _is_content(lines[i]):
+                at = i + 1
+        new_lines = []
+        for depth, part in enumerate(path[:-1]):
+            new_lines.append(f"{' ' * (indent + 2 * depth)}{part}:{newline}")
+        new_lines.append(f"{' ' * (indent + 2 * (len(path) - 1))}{path[-1]}: {render_scalar(value)}{newline}")
+        lines[at:at] = new_lines
+        return len(new_lines)
+
+    span_end = _span_end(lines, index, end, indent)
+    match = FIELD_PATTERN.match(lines[index].rstrip("\r\n"))
+    inline = (match.group(4) or "") if match else ""
+    head = lines[index][:match.end(3) + len(match.group(2))] if match else f"{' ' * indent}{name}"
+
+    if len(path) > 1:
+        if inline and inline not in ("{}", "null", "~") and not inline.startswith("#"):
+            raise PatchError(f"'{name}' is not a block mapping ({inline})")
+        if inline:
+            lines[index] = f"{head}:{newline}"
+        return set_field(lines, index + 1, span_end, indent, path[1:], value)
+
+    comment = ""
+    if span_end == index + 1:
+        trailing = TRAILING_COMMENT_PATTERN.match(inline)
+        if trailing:
+            comment = trailing.group("comment")
+    lines[index:span_end] = [f"{head}: {render_scalar(value)}{comment}{newline}"]
+    return 1 - (span_end - index)
+
+
+def _resolve(data: Any, path: List[str]) -> Any:
+    for part in path:
+        if not isinstance(data, dict) or part not in data:
+            raise KeyError(part)
+        data = data[part]
+    return data
+
+
+def patch_block(lines: List[str], collection: str, task_key: str, edits: List[Tuple[str, Any]]) -> List[str]:
+    """Apply edits to one task's block (its lines, as in the file) and verify the result."""
+    lines = list(lines)
+    first = next(i for i, line in enumerate(lines) if _is_content(line))
+    item_indent = _indent(lines[first])
+    dash = collection == ISSUES
+    if dash:
+        # Treat "- key: T1" as "  key: T1" so the first field lines up with its siblings
+        original = lines[first]
+        lines[first] = original[:item_indent] + "  " + original[item_indent + 2:]
+        children_start, parent_indent = first, item_indent
+    else:
+        children_start, parent_indent = first + 1, item_indent
+
+    for field, value in edits:
+        set_field(lines, children_start, len(lines), parent_indent, field.split("."), value)
+
+    if dash:
+        lines[first] = lines[first][:item_indent] + "- " + lines[first][item_indent + 2:]
+
+    try:
+        parsed = parse_yaml("".join(lines).encode("utf-8"), f"{task_key} (patched)")
+        entry = parsed[0] if dash else parsed[task_key]
+        for field, value in edits:
+            if _resolve(entry, field.split(".")) != value:
+                raise PatchError(f"{task_key}.{field} reads back as {_resolve(entry, field.split('.'))!r}")
+    except (yaml.YAMLError, KeyError, IndexError, TypeError) as e:
+        raise PatchError(f"{task_key}: patched block does not verify ({e})")
+    return lines
+
+
+def _blocks(stream, collection: str) -> Iterator[Tuple[Optional[str], List[str]]]:
+    """
+    Stream a file as (task key, lines) chunks: one chunk per collection entry,
+    key None for everything else. Only one chunk is held at a time.
+    """
+    header = f"{collection}:"
+    state = "before"  # before -> inside -> after
+    indent = None
+    is_sequence = False
+    pending: List[str] = []
+    current: List[str] = []
+    current_key: Optional[str] = None
+
+    def entry_key(block: List[str]) -> Optional[str]:
+        if is_sequence:
+            for line in block:
+                if _indent(line) in (indent, indent + 2) and (match := KEY_PATTERN.match(line)):
+                    return match.group(1)
+            return None
+        match = MAPPING_KEY_PATTERN.match(block[0]) if block else None
+        return match.group(1) if match else None
+
+    for line in stream:
+        if state == "before":
+            pending.append(line)
+            if line.rstrip() == header:
+                yield None, pending
+                pending = []
+                state = "inside"
+            continue
+        if state == "after":
+            yield None, [line]
+            continue
+
+        if not _is_content(line):
+            (current if current else pending).append(line)
+            continue
+        column = _indent(line)
+        if indent is None:
+            indent = column
+            is_sequence = line[column:].startswith("- ")
+        if column < indent or (column == indent and is_sequence and not line[column:].startswith("- ")):
+            if current:
+                yield entry_key(current), current
+            yield None, pending + [line]
+            current, pending = [], []
+            state = "after"
+            continue
+        if column == indent:
+            if current:
+                yield entry_key(current), current
+            if pending:
+                yield None, pending
+            current, pending = [line], []
+        else:
+            current.append(line)
+
+    if current:
+        yield entry_key(current), current
+    if pending:
+        yield None, pending
+
+
+HUNK_PATTERN = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+def _block_diff(path: Path, old: List[str], new: List[str], old_offset: int, new_offset: int, header: bool) -> List[str]:
+    """Unified diff of one block, with hunk line numbers relative to the whole file."""
+    lines = []
+    for line in difflib.unified_diff(old, new, f"a/{path.name}", f"b/{path.name}", n=1, lineterm=""):
+        if line.startswith(("---", "+++")):
+            if header:
+                lines.append(line)
+            continue
+        match = HUNK_PATTERN.match(line)
+        if match:
+            line = (f"@@ -{int(match.group(1)) + old_offset}{match.group(2) or ''} "
+                    f"+{int(match.group(3)) + new_offset}{match.group(4) or ''} @@")
+        lines.append(line)
+    return lines
+
+
+def patch_file(
+    path: Path,
+    edits: Dict[str, List[Tuple[str, Any]]],
+    collection: str = ISSUES,
+    dry_run: bool = False,
+) -> Tuple[List[str], List[str]]:
+    """
+    Apply {task key: [(field, value), ...]} to one file in a single streaming pass.
+
+    Returns (patched task keys, unified diff lines). Raises PatchError without
+    touching the file if any edit cannot be applied.
+    """
+    path = Path(path)
+    patched: List[str] = []
+    diff: List[str] = []
+    changed = False
+    added = 0  # net lines inserted so far, to number the original file's lines
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as source, os.fdopen(fd, "w", encoding="utf-8", newline="") as out:
+            line_number = 0  # lines written so far (new numbering)
+            for key, block in _blocks(source, collection):
+                if key in edits and key not in patched:
+                    new_block = patch_block(block, collection, key, edits[key])
+                    patched.append(key)
+                    if new_block != block:
+                        changed = True
+                        diff.extend(_block_diff(path, block, new_block, line_number - added, line_number, not diff))
+                        added += len(new_block) - len(block)
+                    block = new_block
+                out.writelines(block)
+                line_number += len(block)
+        if changed and not dry_run:
+            os.chmod(tmp_name, os.stat(path).st_mode & 0o777)
+            os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+    return patched, diff
+
+
+def apply_edits(
+    edits: List[FieldEdit],
+    planning_dir: Path = DEFAULT_PLANNING_DIR,
+    collection: str = ISSUES,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Apply edits across the planning files, one pass per file.
+
+    Returns {"patched": [task keys], "missing": [task keys], "errors": {file: message}, "diff": [lines]}.
+    """
+    index = load_issue_index(planning_dir)
+    by_file: Dict[Path, Dict[str, List[Tuple[str, Any]]]] = {}
+    missing = []
+    for edit in edits:
+        location = index.locate(edit.task_key, collection)
+        if location is None:
+            if edit.task_key not in missing:
+                missing.append(edit.task_key)
+            continue
+        by_file.setdefault(location.path, {}).setdefault(edit.task_key, []).append((edit.field, edit.value))
+
+    result: Dict[str, Any] = {"patched": [], "missing": missing, "errors": {}, "diff": []}
+    for path, file_edits in by_file.items():
+        try:
+            patched, diff = patch_file(path, file_edits, collection, dry_run)
+        except (PatchError, OSError) as e:
+            result["errors"][str(path)] = str(e)
+            continue
+        result["patched"].extend(patched)
+        result["missing"].extend(key for key in file_edits if key not in patched)
+        result["diff"].extend(diff)
+    return result
+
+
+def set_status(task_key: str, status: str, planning_dir: Path = DEFAULT_PLANNING_DIR) -> bool:
+    """Write a task's progress.status back to its issue file; True on success."""
+    result = apply_edits([FieldEdit(task_key, "progress.status", status)], planning_dir)
+    return task_key in result["patched"] and not result["errors"]
+
+
+def parse_assignment(text: str) -> Tuple[str, Any]:
+    """"progress.status=done" -> ("progress.status", "done"); values are YAML ("5" -> 5)."""
+    field, separator, raw = text.partition("=")
+    if not separator or not field:
+        raise argparse.ArgumentTypeError(f"expected field=value, got {text!r}")
+    return field.strip(), parse_yaml(raw.encode("utf-8")) if raw.strip() else ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Patch planning YAML fields in place")
+    parser.add_argument("items", nargs="*", help="Task keys followed by field=value assignments")
+    parser.add_argument("--edits", type=Path, help='JSON file ("-" for stdin): [{"key", "field", "value"}, ...]')
+    parser.add_argument("--estimates", action="store_true", help="Patch effort-map.yaml instead of issues/*.yaml")
+    parser.add_argument("--planning-dir", type=Path, default=DEFAULT_PLANNING_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="Print the diff without writing")
+    args = parser.parse_args()
+
+    keys = [item for item in args.items if "=" not in item]
+    assignments = [parse_assignment(item) for item in args.items if "=" in item]
+    edits = [FieldEdit(key, field, value) for key in keys for field, value in assignments]
+    if args.edits:
+        raw = sys.stdin.read() if str(args.edits) == "-" else args.edits.read_text(encoding="utf-8")
+        edits += [FieldEdit(edit["key"], edit["field"], edit["value"]) for edit in json.loads(raw)]
+    if not edits:
+        parser.error("nothing to patch")
+
+    result = apply_edits(edits, args.planning_dir, ESTIMATES if args.estimates else ISSUES, args.dry_run)
+    if args.dry_run:
+        print("\n".join(line.rstrip("\r\n") for line in result["diff"]))
+    print(f"{'🔍 Would patch' if args.dry_run else '✅ Patched'} {len(result['patched'])} task(s)", file=sys.stderr)
+    if result["missing"]:
+        print(f"⚠️  Not found: {', '.join(result['missing'])}", file=sys.stderr)
+    for path, error in result["errors"].items():
+        print(f"❌ {path}: {error}", file=sys.stderr)
+    if result["missing"] or result["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()